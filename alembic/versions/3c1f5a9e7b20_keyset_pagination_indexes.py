@@ -0,0 +1,35 @@
+"""keyset pagination indexes
+
+Revision ID: 3c1f5a9e7b20
+Revises: 721b3b3f0947
+Create Date: 2026-10-18 09:12:41.508113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f5a9e7b20'
+down_revision: Union[str, Sequence[str], None] = '721b3b3f0947'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently, so writes to the table are not blocked meanwhile.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_contacts_last_name_id', 'contacts', ['last_name', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_contacts_first_name_id', 'contacts', ['first_name', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_contacts_birthday_id', 'contacts', ['birthday', 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_contacts_birthday_id', table_name='contacts', postgresql_concurrently=True)
+        op.drop_index('ix_contacts_first_name_id', table_name='contacts', postgresql_concurrently=True)
+        op.drop_index('ix_contacts_last_name_id', table_name='contacts', postgresql_concurrently=True)
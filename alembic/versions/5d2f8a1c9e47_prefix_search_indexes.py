@@ -0,0 +1,41 @@
+"""prefix search indexes
+
+Revision ID: 5d2f8a1c9e47
+Revises: b7a90c4e2f15
+Create Date: 2026-10-18 14:05:31.418226
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8a1c9e47'
+down_revision: Union[str, Sequence[str], None] = 'b7a90c4e2f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREFIX_COLUMNS = ('first_name', 'last_name', 'email', 'phone_number')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently, so writes to the table are not blocked meanwhile.
+    with op.get_context().autocommit_block():
+        for column in PREFIX_COLUMNS:
+            op.create_index(
+                f'ix_contacts_{column}_prefix',
+                'contacts',
+                [sa.text(f'lower({column}) text_pattern_ops')],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for column in PREFIX_COLUMNS:
+            op.drop_index(f'ix_contacts_{column}_prefix', table_name='contacts', postgresql_concurrently=True)
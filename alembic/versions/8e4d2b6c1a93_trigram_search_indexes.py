@@ -0,0 +1,45 @@
+"""trigram search indexes
+
+Revision ID: 8e4d2b6c1a93
+Revises: 3c1f5a9e7b20
+Create Date: 2026-10-18 10:03:17.224890
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4d2b6c1a93'
+down_revision: Union[str, Sequence[str], None] = '3c1f5a9e7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCHABLE_COLUMNS = ('first_name', 'last_name', 'email', 'phone_number', 'other_info')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # Built concurrently, so writes to the table are not blocked meanwhile.
+    with op.get_context().autocommit_block():
+        for column in SEARCHABLE_COLUMNS:
+            op.create_index(
+                f'ix_contacts_{column}_trgm',
+                'contacts',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for column in reversed(SEARCHABLE_COLUMNS):
+            op.drop_index(f'ix_contacts_{column}_trgm', table_name='contacts', postgresql_concurrently=True)
+    # The pg_trgm extension is left installed, other objects may depend on it.
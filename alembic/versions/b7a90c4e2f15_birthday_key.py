@@ -0,0 +1,38 @@
+"""birthday key
+
+Revision ID: b7a90c4e2f15
+Revises: 8e4d2b6c1a93
+Create Date: 2026-10-18 11:26:52.907314
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7a90c4e2f15'
+down_revision: Union[str, Sequence[str], None] = '8e4d2b6c1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # An expression index instead of a stored generated column: adding a stored
+    # column rewrites the whole table under an exclusive lock.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_birthday_key',
+            'contacts',
+            [sa.text('((EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday))::smallint)')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_contacts_birthday_key', table_name='contacts', postgresql_concurrently=True)
@@ -0,0 +1,80 @@
+"""full text search vector
+
+Revision ID: c41e7d9a3b58
+Revises: 5d2f8a1c9e47
+Create Date: 2026-10-18 15:12:08.603517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7d9a3b58'
+down_revision: Union[str, Sequence[str], None] = '5d2f8a1c9e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The weighted document of a row; `{row}` is `NEW.` in the trigger and empty in the backfill.
+DOCUMENT_SQL = (
+    "setweight(to_tsvector('english', coalesce({row}first_name, '') || ' ' || coalesce({row}last_name, '')), 'A')"
+    " || setweight(to_tsvector('english', coalesce({row}other_info, '')), 'B')"
+)
+BACKFILL_BATCH_SIZE = 10_000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A plain nullable column is added without rewriting the table, unlike a
+    # stored generated column. A trigger keeps it current from now on, and
+    # existing rows are filled in batches below.
+    op.add_column('contacts', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(
+        f"""
+        CREATE FUNCTION contacts_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {DOCUMENT_SQL.format(row='NEW.')};
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_search_vector_update
+        BEFORE INSERT OR UPDATE OF first_name, last_name, other_info ON contacts
+        FOR EACH ROW EXECUTE FUNCTION contacts_search_vector_update()
+        """
+    )
+    with op.get_context().autocommit_block():
+        # One short transaction per batch, so no lock is held for long.
+        bind = op.get_bind()
+        max_id = bind.execute(sa.text('SELECT max(id) FROM contacts')).scalar() or 0
+        for start in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(
+                sa.text(
+                    f'UPDATE contacts SET search_vector = {DOCUMENT_SQL.format(row="")}'
+                    ' WHERE id >= :start AND id < :end AND search_vector IS NULL'
+                ),
+                {'start': start, 'end': start + BACKFILL_BATCH_SIZE},
+            )
+        op.create_index(
+            'ix_contacts_search_vector',
+            'contacts',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_contacts_search_vector', table_name='contacts', postgresql_concurrently=True)
+    op.execute('DROP TRIGGER contacts_search_vector_update ON contacts')
+    op.execute('DROP FUNCTION contacts_search_vector_update()')
+    op.drop_column('contacts', 'search_vector')
@@ -0,0 +1,71 @@
+"""change tracking and tombstones
+
+Revision ID: e92b5f3d7c61
+Revises: c41e7d9a3b58
+Create Date: 2026-10-18 17:40:22.915043
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e92b5f3d7c61'
+down_revision: Union[str, Sequence[str], None] = 'c41e7d9a3b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'contacts',
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    )
+    op.add_column('contacts', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+    # Indexes are built without blocking writes. The partial unique indexes are
+    # built under temporary names and take over the old names once the full ones
+    # are dropped, so uniqueness is enforced throughout.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_updated_at_id', 'contacts', ['updated_at', 'id'], unique=False, postgresql_concurrently=True
+        )
+        # Uniqueness now only applies to live contacts.
+        op.create_index(
+            'ix_contacts_email_live',
+            'contacts',
+            ['email'],
+            unique=True,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_contacts_phone_number_live',
+            'contacts',
+            ['phone_number'],
+            unique=True,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+    op.drop_index('ix_contacts_email', table_name='contacts')
+    op.drop_constraint('contacts_phone_number_key', 'contacts', type_='unique')
+    op.execute('ALTER INDEX ix_contacts_email_live RENAME TO ix_contacts_email')
+    op.execute('ALTER INDEX ix_contacts_phone_number_live RENAME TO ix_contacts_phone_number')
+    # Every read now filters on `deleted_at IS NULL`; without statistics for the
+    # new column the planner guesses it is rare, which ruins count estimates.
+    op.execute('ANALYZE contacts')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Tombstones would break the restored full unique constraints.
+    op.execute('DELETE FROM contacts WHERE deleted_at IS NOT NULL')
+    op.drop_index('ix_contacts_phone_number', table_name='contacts')
+    op.create_unique_constraint('contacts_phone_number_key', 'contacts', ['phone_number'])
+    op.drop_index('ix_contacts_email', table_name='contacts')
+    op.create_index('ix_contacts_email', 'contacts', ['email'], unique=True)
+    op.drop_index('ix_contacts_updated_at_id', table_name='contacts')
+    op.drop_column('contacts', 'deleted_at')
+    op.drop_column('contacts', 'updated_at')
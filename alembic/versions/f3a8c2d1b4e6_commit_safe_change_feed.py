@@ -0,0 +1,62 @@
+"""commit-safe change feed
+
+Revision ID: f3a8c2d1b4e6
+Revises: e92b5f3d7c61
+Create Date: 2026-10-18 21:12:47.301556
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8c2d1b4e6'
+down_revision: Union[str, Sequence[str], None] = 'e92b5f3d7c61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant default is stored in the catalog, the table is not rewritten.
+    # Existing rows keep 0 and come first in the feed.
+    op.add_column('contacts', sa.Column('change_xid', sa.BigInteger(), server_default='0', nullable=False))
+    # Every insert and update records the writing transaction and its start time,
+    # whatever statement (ORM, Core or plain SQL) made the change.
+    op.execute(
+        """
+        CREATE FUNCTION contacts_track_change() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := now();
+            NEW.change_xid := pg_current_xact_id()::text::bigint;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_track_change
+        BEFORE INSERT OR UPDATE ON contacts
+        FOR EACH ROW EXECUTE FUNCTION contacts_track_change()
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_change_xid_id', 'contacts', ['change_xid', 'id'], unique=False, postgresql_concurrently=True
+        )
+        op.drop_index('ix_contacts_updated_at_id', table_name='contacts', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_updated_at_id', 'contacts', ['updated_at', 'id'], unique=False, postgresql_concurrently=True
+        )
+        op.drop_index('ix_contacts_change_xid_id', table_name='contacts', postgresql_concurrently=True)
+    op.execute('DROP TRIGGER contacts_track_change ON contacts')
+    op.execute('DROP FUNCTION contacts_track_change()')
+    op.drop_column('contacts', 'change_xid')
@@ -0,0 +1,101 @@
+"""
+Benchmark of concurrent single-contact creates with and without group commit.
+
+Runs the same burst of creates twice against the configured database: once
+with one `create_contact` transaction per contact, and once through a
+`CreateCoalescer`, which commits concurrent creates together. Reports
+throughput and p50/p99 latency per caller. The created contacts are deleted
+afterwards.
+
+Usage:
+    python -m benchmarks.create_coalescing --creates 5000 --concurrency 200
+"""
+import argparse
+import asyncio
+import time
+from datetime import date
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import delete
+
+from benchmarks.load_test import percentile
+from src.database.db import sessionmanager
+from src.database.models import ContactsModel
+from src.repository.repository import create_contact
+from src.schemas.schemas import ContactCreate
+from src.services.coalescer import CreateCoalescer
+
+EMAIL_DOMAIN = "coalescing.bench"
+
+
+def make_contacts(run: str, count: int) -> List[ContactCreate]:
+    stamp = int(time.time()) % 100_000
+    prefix = 1 if run == "single" else 2
+    return [
+        ContactCreate(
+            first_name="Bench",
+            last_name="Create",
+            email=f"{run}.{stamp}.{n}@{EMAIL_DOMAIN}",
+            phone_number=f"+9{prefix}{stamp:05d}{n:07d}",
+            birthday=date(1990, 1, 1),
+        )
+        for n in range(count)
+    ]
+
+
+async def run(name: str, create: Callable[[ContactCreate], Awaitable], contacts: List[ContactCreate], concurrency: int) -> None:
+    latencies: List[float] = []
+    pending = iter(contacts)
+
+    async def worker() -> None:
+        for contact in pending:
+            started = time.perf_counter()
+            await create(contact)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    print(
+        f"{name:<28} {len(contacts) / elapsed:>9.1f} creates/s  "
+        f"p50 {percentile(latencies, 50) * 1000:>7.2f} ms  p99 {percentile(latencies, 99) * 1000:>7.2f} ms"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    sessionmanager.init()
+    try:
+        async def single(contact: ContactCreate):
+            async with sessionmanager.session() as session:
+                return await create_contact(session, contact)
+
+        coalescer = CreateCoalescer(args.batch_size, args.max_delay_ms)
+
+        print(f"{args.creates} creates from {args.concurrency} concurrent callers")
+        await run("one transaction per create", single, make_contacts("single", args.creates), args.concurrency)
+        await run(
+            f"coalesced ({args.batch_size}/{args.max_delay_ms:g} ms)",
+            coalescer.create,
+            make_contacts("coalesced", args.creates),
+            args.concurrency,
+        )
+    finally:
+        async with sessionmanager.session() as session:
+            await session.execute(delete(ContactsModel).where(ContactsModel.email.like(f"%@{EMAIL_DOMAIN}")))
+            await session.commit()
+        await sessionmanager.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark group commit of contact creates.")
+    parser.add_argument("--creates", type=int, default=5000, help="Contacts created per variant.")
+    parser.add_argument("--concurrency", type=int, default=200, help="Concurrent callers.")
+    parser.add_argument("--batch-size", type=int, default=100, help="Coalescer batch size.")
+    parser.add_argument("--max-delay-ms", type=float, default=5.0, help="Coalescer maximum wait.")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Load test and benchmark suite for the contacts API.
+
+Seeds the configured database with a given number of contacts, drives every
+contacts endpoint with concurrent async clients and reports throughput and
+p50/p95/p99 latency. Results are saved as JSON so that two runs can be diffed.
+
+Usage:
+    python -m benchmarks.load_test --size 10k --output before.json
+    python -m benchmarks.load_test --size 10k --no-seed --output after.json
+    python -m benchmarks.load_test --compare before.json after.json
+
+The API must be running separately (e.g. `uvicorn main:app` with
+`APP_PROFILE=benchmark`) against the same database the suite seeds.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+from src.tools.seed import FIRST_NAMES, seed_contacts
+
+SIZES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+BASE_PATH = "/api/v1/contacts"
+
+
+def parse_size(value: str) -> int:
+    """
+    Parses a table size such as `10k`, `1m`, `10m` or a plain number.
+    """
+    return SIZES.get(value.lower()) or int(value)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Returns the nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def run_scenario(
+    name: str,
+    request: Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]],
+    client: httpx.AsyncClient,
+    total: int,
+    concurrency: int,
+    first: int = 0,
+) -> Dict:
+    """
+    Sends `total` requests built by `request(client, n)` from `concurrency` workers.
+
+    Requests are numbered from `first`; a request's parameters depend only on
+    its number, never on which worker sends it or when.
+
+    Only 2xx responses count towards throughput and latency; everything else
+    is counted as failed, by status code or exception name, so a run full of
+    fast 404s does not look like a speed-up.
+
+    Returns:
+        Dict: Throughput, latency percentiles (ms) and error counts.
+    """
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    counter = iter(range(first, first + total))
+
+    async def worker() -> None:
+        for n in counter:
+            started = time.perf_counter()
+            try:
+                response = await request(client, n)
+            except httpx.HTTPError as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                continue
+            if not 200 <= response.status_code < 300:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    result = {
+        "requests": total,
+        "succeeded": len(latencies),
+        "failed": total - len(latencies),
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "errors": errors,
+    }
+    print(
+        f"{name:<20} {result['throughput_rps']:>9.1f} req/s  "
+        f"p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms"
+        + (f"  failed {result['failed']} {errors}" if errors else "")
+    )
+    return result
+
+
+def build_scenarios(size: int, seed: int, delete_targets: List[int]) -> Dict[str, Callable]:
+    """
+    Builds the request factory of every benchmarked endpoint.
+
+    Each request draws its parameters from its own generator, seeded from
+    `seed` and the request number. Workers interleave differently on every
+    run, so with one shared generator the same seed would still send
+    different IDs and names to the API.
+
+    Deletes remove `delete_targets`, contacts created for them right before
+    the scenario runs (see `create_delete_targets`). Every delete hits a live
+    row whether or not the table was re-seeded, and the seeded rows the other
+    scenarios read are never deleted.
+    """
+    base = BASE_PATH
+
+    def rng(n: int) -> random.Random:
+        return random.Random(seed * 1_000_003 + n)
+
+    return {
+        "list": lambda c, n: c.get(f"{base}/", params={"limit": 100, "skip": rng(n).randrange(0, 1000)}),
+        "get": lambda c, n: c.get(f"{base}/{rng(n).randint(1, size)}"),
+        "search": lambda c, n: c.post(f"{base}/search", json={"first_name": rng(n).choice(FIRST_NAMES)[:4], "limit": 100}),
+        "upcoming_birthdays": lambda c, n: c.get(f"{base}/upcoming_birthdays/"),
+        "patch": lambda c, n: c.patch(f"{base}/{rng(n).randint(1, size)}", json={"other_info": f"Patched {n}"}),
+        "delete": lambda c, n: c.delete(f"{base}/{delete_targets[n]}"),
+    }
+
+
+async def create_delete_targets(client: httpx.AsyncClient, total: int, concurrency: int) -> List[int]:
+    """
+    Creates `total` contacts for the delete scenario and returns their IDs.
+
+    Emails and phone numbers embed a per-run stamp, so runs against the same
+    table never collide with each other or with seeded rows.
+
+    Raises:
+        RuntimeError: If a contact could not be created.
+    """
+    stamp = time.time_ns()
+    ids: List[int] = [0] * total
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        for n in counter:
+            response = await client.post(
+                f"{BASE_PATH}/",
+                json={
+                    "first_name": "Delete",
+                    "last_name": "Target",
+                    "email": f"delete-{stamp}-{n}@example.com",
+                    "phone_number": f"+9{stamp % 10**8:08d}{n:06d}",
+                    "birthday": "1990-01-01",
+                },
+            )
+            if response.status_code != 201:
+                raise RuntimeError(f"Could not create a delete target: {response.status_code} {response.text}")
+            ids[n] = response.json()["id"]
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return ids
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return "unknown"
+
+
+async def run(args: argparse.Namespace) -> Dict:
+    size = parse_size(args.size)
+    if args.seed:
+        await seed_contacts(size, seed=args.random_seed, workers=args.seed_workers, truncate=True)
+
+    delete_targets: List[int] = []
+    scenarios = build_scenarios(size, args.random_seed, delete_targets)
+    selected = args.scenarios or list(scenarios)
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    results = {}
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        for name in selected:
+            if name == "delete":
+                # Filled in place: the delete scenario reads this list.
+                delete_targets[:] = await create_delete_targets(client, args.requests, args.concurrency)
+            else:
+                # A short warm-up fills caches and the connection pool before measuring.
+                # It is numbered after the measured requests, so it does not pre-cache them.
+                await run_scenario(
+                    f"{name} (warm-up)", scenarios[name], client, min(50, args.requests), args.concurrency, first=args.requests
+                )
+            results[name] = await run_scenario(name, scenarios[name], client, args.requests, args.concurrency)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "base_url": args.base_url,
+            "size": size,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """
+    Prints the relative change of throughput and latency between two result files.
+    """
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    print(f"{'scenario':<20} {'metric':<16} {'before':>10} {'after':>10} {'change':>9}")
+    for name, old in before["results"].items():
+        new = after["results"].get(name)
+        if new is None:
+            continue
+        for metric in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms"):
+            change = (new[metric] - old[metric]) / old[metric] * 100 if old[metric] else 0.0
+            print(f"{name:<20} {metric:<16} {old[metric]:>10.2f} {new[metric]:>10.2f} {change:>+8.1f}%")
+        if old.get("failed") or new.get("failed"):
+            print(f"{name:<20} {'failed':<16} {old.get('failed', 0):>10} {new.get('failed', 0):>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the contacts API.")
+    parser.add_argument("--base-url", default="http://localhost:8080", help="URL of the running API.")
+    parser.add_argument("--size", default="10k", help="Table size to seed: 10k, 1m, 10m or a number.")
+    parser.add_argument("--no-seed", dest="seed", action="store_false", help="Reuse the current table contents.")
+    parser.add_argument("--seed-workers", type=int, default=4, help="Parallel processes used for seeding.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario.")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients.")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds.")
+    parser.add_argument("--random-seed", type=int, default=42, help="Seed for request parameters.")
+    parser.add_argument(
+        "--scenarios",
+        nargs="*",
+        choices=["list", "get", "search", "upcoming_birthdays", "patch", "delete"],
+        help="Subset of scenarios to run.",
+    )
+    parser.add_argument("--output", help="Write machine-readable results to this JSON file.")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Diff two result files and exit.")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
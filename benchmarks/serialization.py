@@ -0,0 +1,76 @@
+"""
+Micro-benchmark of the response serialization path for a page of contacts.
+
+Compares the validating `Contact` schema with the trusted `ContactRead`
+schema, each rendered with the standard library `json` and with `orjson`,
+for a 100-row page of ORM objects. No database is needed.
+
+Usage:
+    python -m benchmarks.serialization --rows 100 --repeat 2000
+"""
+import argparse
+import json
+import time
+from datetime import date, timedelta
+from typing import Callable, List
+
+import orjson
+from pydantic import TypeAdapter
+
+from src.database.models import ContactsModel
+from src.schemas.schemas import Contact, ContactRead
+
+
+def make_rows(count: int) -> List[ContactsModel]:
+    return [
+        ContactsModel(
+            id=n,
+            first_name=f"First{n}",
+            last_name=f"Last{n}",
+            email=f"user{n}@example.com",
+            phone_number=f"+1{n:010d}",
+            birthday=date(1980, 1, 1) + timedelta(days=n * 37 % 15000),
+            other_info=f"Benchmark contact {n}",
+        )
+        for n in range(1, count + 1)
+    ]
+
+
+def measure(render: Callable[[], bytes], repeat: int) -> float:
+    """
+    Returns the mean time of `render()` in microseconds.
+    """
+    render()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        render()
+    return (time.perf_counter() - started) / repeat * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark contact page serialization.")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per page.")
+    parser.add_argument("--repeat", type=int, default=2000, help="Pages rendered per variant.")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    validating = TypeAdapter(List[Contact])
+    trusted = TypeAdapter(List[ContactRead])
+
+    variants = {
+        "Contact + json": lambda: json.dumps(validating.dump_python(validating.validate_python(rows, from_attributes=True), mode="json")).encode(),
+        "Contact + orjson": lambda: orjson.dumps(validating.dump_python(validating.validate_python(rows, from_attributes=True), mode="json")),
+        "ContactRead + json": lambda: json.dumps(trusted.dump_python(trusted.validate_python(rows, from_attributes=True), mode="json")).encode(),
+        "ContactRead + orjson": lambda: orjson.dumps(trusted.dump_python(trusted.validate_python(rows, from_attributes=True), mode="json")),
+    }
+
+    baseline = None
+    print(f"{args.rows}-row page, mean of {args.repeat} renders")
+    for name, render in variants.items():
+        elapsed = measure(render, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:<22} {elapsed:>9.1f} us/page  ({elapsed / baseline * 100:5.1f}% of baseline, saves {baseline - elapsed:8.1f} us)")
+
+
+if __name__ == "__main__":
+    main()
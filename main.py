@@ -4,21 +4,69 @@ Main entry point for the FastAPI application.
 This module initializes the FastAPI application, includes the API router,
 and defines the startup command for the server.
 """
+import logging
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from src.api.router import router as api_router
+from src.conf.config import settings
+from src.database.db import pool_config, sessionmanager
+from src.services.events import contact_events
+from src.services.metrics import MetricsMiddleware, registry
+from src.services.warmup import warm_up_pool
+
+logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Runs application startup and shutdown logic.
+
+    On startup, the database engine is created, `DB_POOL_WARMUP` connections are
+    opened (and primed with the hot queries if `DB_PRIME_STATEMENTS` is set)
+    before the first request is served, and the effective pool configuration
+    is logged, and the contact event broadcaster starts listening. On shutdown,
+    the broadcaster, the engine and all its connections are closed.
+    """
+    sessionmanager.init()
+    try:
+        if settings.DB_POOL_WARMUP > 0:
+            await warm_up_pool(sessionmanager, settings.DB_POOL_WARMUP, prime=settings.DB_PRIME_STATEMENTS)
+        logger.info("Database pool configuration: %s", pool_config())
+        await contact_events.start()
+        yield
+    finally:
+        await contact_events.stop()
+        await sessionmanager.close()
+
 
 # Create the FastAPI application instance.
 app = FastAPI(
     title="Contacts API",  # Provides a title for the OpenAPI documentation
     description="A simple REST API for managing contacts.",  # A description for the OpenAPI docs
-    version="1.0.0"  # API version
+    version="1.0.0",  # API version
+    lifespan=lifespan,  # Startup and shutdown logic
 )
 
+# Record per-route latency, status codes and in-flight requests.
+app.add_middleware(MetricsMiddleware)
+
 # Include the main API router under the `/api` prefix.
 # This keeps the main application logic separate from the API endpoints.
 app.include_router(api_router, prefix="/api")
 
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """
+    Exposes the collected metrics in the Prometheus text format.
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 # The `if __name__ == "__main__":` block is for local development.
 # In a production environment (e.g., in a Docker container), the `CMD`
 # from the Dockerfile will be used to run the application, not this block.
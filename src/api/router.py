@@ -1,5 +1,6 @@
 from fastapi import APIRouter
-from src.api.v1.endpoints import contacts, utils
+from src.api.v1.endpoints import admin, contacts, utils
+from src.conf.config import settings
 
 # Головний роутер для версіонування API
 router = APIRouter()
@@ -8,4 +9,8 @@ router = APIRouter()
 router.include_router(contacts.router, prefix="/v1")
 
 # Включаємо утилітарний роутер без префікса версії
-router.include_router(utils.router)
\ No newline at end of file
+router.include_router(utils.router)
+
+# Адмін-ендпоінти (журнал повільних запитів) вмикаються лише явно і вимагають ADMIN_API_TOKEN
+if settings.ADMIN_API_ENABLED:
+    router.include_router(admin.router, prefix="/v1")
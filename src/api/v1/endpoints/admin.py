@@ -0,0 +1,90 @@
+import json
+import secrets
+from datetime import timedelta
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.conf.config import settings
+from src.database.db import get_async_session
+from src.repository.repository import purge_tombstones
+from src.schemas.schemas import ExplainResult, SlowQueryRead, TombstonePurgeResult
+from src.services.slow_queries import redact_plan, slow_query_log
+
+
+async def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Rejects requests without the `ADMIN_API_TOKEN` in the `X-Admin-Token` header.
+
+    Raises:
+        HTTPException: If no token is configured, or the header is missing or wrong.
+    """
+    expected = settings.ADMIN_API_TOKEN
+    if not expected or x_admin_token is None or not secrets.compare_digest(x_admin_token.encode(), expected.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token.")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+@router.get("/slow-queries", response_model=List[SlowQueryRead])
+async def list_slow_queries():
+    """
+    Lists the statements of this process that ran longer than `SLOW_QUERY_THRESHOLD_MS`, slowest first.
+    """
+    return [entry.as_dict() for entry in slow_query_log.entries()]
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries():
+    """
+    Empties the slow-query log.
+    """
+    slow_query_log.clear()
+    return None
+
+
+@router.post("/slow-queries/{entry_id}/explain", response_model=ExplainResult)
+async def explain_slow_query(entry_id: int, db: AsyncSession = Depends(get_async_session)):
+    """
+    Re-runs a captured SELECT under `EXPLAIN (ANALYZE, BUFFERS)` and returns the plan.
+
+    The statement really executes, with the parameters it was captured with,
+    inside a transaction that is always rolled back. Writes are never re-run.
+    Constants, bound parameter values included, are redacted from the plan.
+    - **entry_id**: The `id` of a slow-query log entry.
+
+    Raises:
+        HTTPException: If the entry does not exist (any more), was a batch (executemany) statement or is not a SELECT.
+    """
+    entry = slow_query_log.get(entry_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Slow query not found.")
+    if entry.executemany:
+        raise HTTPException(status_code=400, detail="Batch statements cannot be explained.")
+    # A WITH clause may hold INSERT, UPDATE or DELETE, so only plain SELECTs qualify.
+    if not entry.statement.upper().startswith("SELECT"):
+        raise HTTPException(status_code=400, detail="Only SELECT statements can be explained.")
+
+    conn = await db.connection()
+    try:
+        result = await conn.exec_driver_sql("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + entry.statement, entry.parameters)
+        plan = result.scalar_one()
+    finally:
+        await db.rollback()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return ExplainResult(query=entry.as_dict(), plan=redact_plan(plan))
+
+
+@router.post("/tombstones/purge", response_model=TombstonePurgeResult)
+async def purge_deleted_contacts(db: AsyncSession = Depends(get_async_session)):
+    """
+    Permanently removes the contacts deleted more than `TOMBSTONE_RETENTION_DAYS` ago.
+
+    Sync tokens older than the retention are rejected by `/contacts/changes`,
+    so no client can miss the deletions removed here.
+    """
+    purged = await purge_tombstones(db, timedelta(days=settings.TOMBSTONE_RETENTION_DAYS))
+    return TombstonePurgeResult(purged=purged)
@@ -1,43 +1,339 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
-from src.database.db import get_async_session
-from src.schemas.schemas import ContactCreate, Contact, ContactUpdate
-from src.repository.repository import create_contact, get_contacts, get_contact_by_id, update_contact, delete_contact, search_contacts_repo, get_contacts_upcoming_birthdays
+from datetime import datetime, timedelta, timezone
+from typing import List, Literal, Optional
+from src.conf.config import settings
+from src.database.db import get_async_session, get_read_session, get_write_session
+from src.schemas.schemas import BulkImportReport, BulkOperationResult, BulkSelector, BulkUpdateRequest, ContactBatchRequest, ContactBatchResponse, ContactChange, ContactChangesPage, ContactCreate, ContactFilter, ContactRead, ContactSearch, ContactTextMatch, ContactUpdate
+from src.repository.repository import create_contact, get_contacts, get_contact_by_id, get_contacts_by_ids, update_contact, delete_contact, search_contacts_text
+from src.repository.repository import DuplicateContactError, EmptySelectionError, bulk_delete_contacts, bulk_update_contacts, count_selected_contacts, get_contact_changes
+from src.repository.pagination import InvalidCursorError, decode_cursor, encode_cursor, next_cursor
+from src.services.bulk_import import UnsupportedFormatError, import_contacts
+from src.services.export import MEDIA_TYPES, export_contacts
+from src.services.counts import total_count
+from src.services.query_cache import cached_search_contacts, cached_upcoming_birthdays
+from src.services.coalescer import create_coalescer
+from src.services.events import TooManySubscribersError, contact_events
 
-router = APIRouter(prefix="/contacts", tags=["contacts"])
+# Responses are serialized through the validation-free `ContactRead` schema and
+# rendered with orjson, the cheapest path from ORM rows to JSON.
+router = APIRouter(prefix="/contacts", tags=["contacts"], default_response_class=ORJSONResponse)
 
 
-@router.post("/", response_model=Contact, status_code=status.HTTP_201_CREATED)
-async def create_new_contact(contact_in: ContactCreate, db: AsyncSession = Depends(get_async_session)):
+@router.post("/", response_model=ContactRead, status_code=status.HTTP_201_CREATED)
+async def create_new_contact(contact_in: ContactCreate, db: AsyncSession = Depends(get_write_session)):
     """
     Creates a new contact.
     
     This endpoint creates a new contact in the database using the provided data.
+    With `CONTACT_CREATE_COALESCING` enabled, concurrent creates are committed
+    together in small batches.
+
+    Raises:
+        HTTPException: If the email or phone number already belongs to another contact.
     """
-    db_contact = await create_contact(db, contact_in)
-    return db_contact
+    try:
+        if settings.CONTACT_CREATE_COALESCING:
+            return await create_coalescer.create(contact_in)
+        return await create_contact(db, contact_in)
+    except DuplicateContactError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+@router.post("/bulk", response_model=BulkImportReport)
+async def bulk_import_contacts(
+    request: Request,
+    db: AsyncSession = Depends(get_write_session),
+    batch_size: int = Query(1000, ge=1, le=5000),
+    max_errors: int = Query(1000, ge=0, le=100000),
+):
+    """
+    Imports many contacts from a streamed NDJSON or CSV body.
+
+    The body is read as a stream, so memory use does not grow with the upload size.
+    Send `Content-Type: application/x-ndjson` with one JSON object per line, or
+    `Content-Type: text/csv` with a header row naming the contact fields.
+    - **batch_size**: The number of rows validated and inserted per statement.
+    - **max_errors**: The maximum number of per-row errors included in the report.
+
+    Rows that fail validation or clash with an existing email or phone number are
+    skipped and reported; all other rows are created.
+
+    Raises:
+        HTTPException: If the content type is neither NDJSON nor CSV.
+    """
+    try:
+        return await import_contacts(
+            db,
+            request.stream(),
+            request.headers.get("content-type"),
+            batch_size=batch_size,
+            max_errors=max_errors,
+        )
+    except UnsupportedFormatError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e))
+
+
+@router.patch("/bulk", response_model=BulkOperationResult)
+async def bulk_update_existing_contacts(
+    body: BulkUpdateRequest,
+    db: AsyncSession = Depends(get_write_session),
+    dry_run: bool = Query(False),
+    chunk_size: int = Query(1000, ge=1, le=10000),
+):
+    """
+    Applies the same partial update to many contacts.
+
+    Contacts are selected by `ids` or by a search `filter`, and updated with
+    set-based statements, one transaction per chunk.
+    - **dry_run**: Only count the selected contacts, without changing them.
+    - **chunk_size**: The maximum number of rows changed (and locked) per transaction.
+
+    Raises:
+        HTTPException: If the filter contains no searchable field.
+    """
+    try:
+        if dry_run:
+            matched = await count_selected_contacts(db, body.ids, body.filter)
+            return BulkOperationResult(matched=matched, affected=0, chunks=0, dry_run=True)
+        affected, chunks = await bulk_update_contacts(db, body.changes, body.ids, body.filter, chunk_size=chunk_size)
+    except EmptySelectionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BulkOperationResult(affected=affected, chunks=chunks, dry_run=False)
 
 
-@router.get("/", response_model=List[Contact])
+@router.delete("/bulk", response_model=BulkOperationResult)
+async def bulk_delete_existing_contacts(
+    body: BulkSelector,
+    db: AsyncSession = Depends(get_write_session),
+    dry_run: bool = Query(False),
+    chunk_size: int = Query(1000, ge=1, le=10000),
+):
+    """
+    Deletes many contacts.
+
+    Contacts are selected by `ids` or by a search `filter`, and deleted with
+    set-based statements, one transaction per chunk.
+    - **dry_run**: Only count the selected contacts, without deleting them.
+    - **chunk_size**: The maximum number of rows deleted (and locked) per transaction.
+
+    Raises:
+        HTTPException: If the filter contains no searchable field.
+    """
+    try:
+        if dry_run:
+            matched = await count_selected_contacts(db, body.ids, body.filter)
+            return BulkOperationResult(matched=matched, affected=0, chunks=0, dry_run=True)
+        affected, chunks = await bulk_delete_contacts(db, body.ids, body.filter, chunk_size=chunk_size)
+    except EmptySelectionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BulkOperationResult(affected=affected, chunks=chunks, dry_run=False)
+
+
+@router.get("/", response_model=List[ContactRead])
 async def get_all_contacts(
-    db: AsyncSession = Depends(get_async_session),
+    response: Response,
+    db: AsyncSession = Depends(get_read_session),
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100)
+    limit: int = Query(100, ge=1, le=100),
+    sort_by: Literal["id", "last_name", "first_name", "birthday"] = Query("id"),
+    order: Literal["asc", "desc"] = Query("asc"),
+    cursor: Optional[str] = Query(None),
+    count: Optional[Literal["exact", "estimate", "cached"]] = Query(None),
 ):
     """
     Retrieves all contacts with pagination.
     
     This endpoint returns a paginated list of all contacts stored in the database.
-    - **skip**: The number of records to skip (for pagination).
+    - **skip**: The number of records to skip (for offset pagination).
     - **limit**: The maximum number of records to return.
+    - **sort_by**: The column to sort by (`id`, `last_name`, `first_name` or `birthday`).
+    - **order**: The sort direction (`asc` or `desc`).
+    - **cursor**: The `X-Next-Cursor` value of the previous page (for keyset pagination).
+    - **count**: Adds an `X-Total-Count` header: `exact` runs `COUNT(*)`, `estimate`
+      reads planner statistics, `cached` serves an exact count refreshed in the background.
+
+    When more rows may follow, the `X-Next-Cursor` response header carries the
+    cursor for the next page. Cursor pages cost the same no matter how deep they are.
+
+    Raises:
+        HTTPException: If the cursor is combined with `skip`, is malformed, or was issued for another sort.
     """
-    contacts = await get_contacts(db, skip=skip, limit=limit)
+    if cursor is not None and skip:
+        raise HTTPException(status_code=400, detail="Use either 'skip' or 'cursor', not both.")
+    try:
+        contacts = await get_contacts(db, skip=skip, limit=limit, sort_by=sort_by, order=order, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    cursor_token = next_cursor(contacts, limit, sort_by, order)
+    if cursor_token is not None:
+        response.headers["X-Next-Cursor"] = cursor_token
+    if count is not None:
+        response.headers["X-Total-Count"] = str(await total_count(db, count))
     return contacts
 
 
-@router.get("/{contact_id}", response_model=Contact)
-async def read_contact(contact_id: int, db: AsyncSession = Depends(get_async_session)):
+@router.get("/export", response_class=StreamingResponse)
+async def export_all_contacts(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    first_name: Optional[str] = Query(None),
+    last_name: Optional[str] = Query(None),
+    email: Optional[str] = Query(None),
+    phone_number: Optional[str] = Query(None),
+    other_info: Optional[str] = Query(None),
+):
+    """
+    Exports all contacts, or the ones matching a search filter, as a stream.
+
+    The export is read through a server-side cursor and streamed to the client,
+    so it never holds all rows in memory.
+    - **format**: `ndjson` (one JSON object per line) or `csv` (with a header row).
+    - **first_name**, **last_name**, **email**, **phone_number**, **other_info**:
+      Optional substring filters, like `contains` in `/contacts/search`.
+    """
+    filters = ContactFilter.model_validate({
+        field: value
+        for field, value in {
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": email,
+            "phone_number": phone_number,
+            "other_info": other_info,
+        }.items()
+        if value is not None
+    })
+    return StreamingResponse(
+        export_contacts(format, filters),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="contacts.{format}"'},
+    )
+
+
+@router.post("/batch", response_model=ContactBatchResponse)
+async def read_contacts_batch(body: ContactBatchRequest, db: AsyncSession = Depends(get_read_session)):
+    """
+    Retrieves many contacts by their IDs in a single request.
+
+    Cached contacts are served from the cache and the rest are loaded with one query.
+    - **ids**: Up to 5000 contact IDs; duplicates are ignored.
+
+    The found contacts are returned in request order, and IDs that do not exist are listed in `missing`.
+    """
+    contact_ids = list(dict.fromkeys(body.ids))
+    contacts = await get_contacts_by_ids(db, contact_ids)
+    found = {contact.id for contact in contacts}
+    return ContactBatchResponse(
+        items=contacts,
+        missing=[contact_id for contact_id in contact_ids if contact_id not in found],
+    )
+
+
+@router.get("/changes", response_model=ContactChangesPage)
+async def read_contact_changes(
+    since: Optional[str] = Query(None),
+    limit: int = Query(1000, ge=1, le=5000),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Returns the contacts created, updated or deleted since the previous sync.
+
+    Call without `since` for a full sync of the current contacts, then pass the
+    returned `next_token` to fetch only what changed afterwards. Deleted contacts
+    are reported with `deleted: true` and no data. Keep calling while `has_more`
+    is true. A change shows up once every transaction that started before it has
+    finished, so no committed change is ever skipped. Every call returns a new
+    token, even without changes, so a client polling a quiet table stays current.
+    - **since**: The `next_token` of the previous call.
+    - **limit**: The maximum number of changes to return.
+
+    The feed is always read from the primary, whose snapshot decides which
+    changes are complete.
+
+    Raises:
+        HTTPException: If the token is malformed (400), or was issued longer ago than
+            the tombstone retention, so deletions may be missing and a full sync is needed (410).
+    """
+    # Taken before reading: the new token covers every change visible from here on.
+    issued_at = datetime.now(timezone.utc)
+    position = None
+    if since is not None:
+        try:
+            (change_xid, token_issued_at), last_id = decode_cursor(since, "change", "asc")
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        retention = timedelta(days=settings.TOMBSTONE_RETENTION_DAYS)
+        if token_issued_at < issued_at - retention:
+            raise HTTPException(status_code=status.HTTP_410_GONE, detail="The sync token has expired, start a full sync.")
+        position = (change_xid, last_id)
+
+    rows = await get_contact_changes(db, position, limit + 1)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    changes = [
+        ContactChange(
+            id=row.id,
+            updated_at=row.updated_at,
+            deleted=row.deleted_at is not None,
+            contact=None if row.deleted_at is not None else ContactRead.model_validate(row),
+        )
+        for row in rows
+    ]
+    if rows:
+        position = (rows[-1].change_xid, rows[-1].id)
+    # Without changes the position stays; a full sync of an empty table starts at the beginning.
+    change_xid, last_id = position or (0, 0)
+    next_token = encode_cursor("change", "asc", [change_xid, issued_at.isoformat()], last_id)
+    return ContactChangesPage(changes=changes, next_token=next_token, has_more=has_more)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_contact_events():
+    """
+    Streams contact changes as Server-Sent Events, instead of polling for them.
+
+    Every create, update and delete, made through any worker, is sent as an event
+    named `created`, `updated` or `deleted` whose data holds the contact ID,
+    `updated_at` and, except for deletions, the contact. Bulk operations send one
+    `bulk_created`, `bulk_updated` or `bulk_deleted` event with the number of
+    affected contacts. A keep-alive comment is sent every `CONTACT_EVENTS_KEEPALIVE`
+    seconds without changes.
+
+    Each client has a queue of `CONTACT_EVENTS_QUEUE_SIZE` events. A client that
+    falls that far behind gets an `overflow` event and is disconnected; it should
+    catch up through `/contacts/changes` and reconnect.
+
+    Raises:
+        HTTPException: If `CONTACT_EVENTS_MAX_SUBSCRIBERS` clients are already connected.
+    """
+    if contact_events.is_full:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Too many contact event subscribers.")
+
+    async def frames():
+        # Subscribing when the body starts, not here, means a response that is
+        # never sent leaves no subscriber behind.
+        try:
+            subscription = contact_events.subscribe()
+        except TooManySubscribersError:
+            # The last free slot was taken after the check above.
+            yield "event: overflow\ndata: {}\n\n"
+            return
+        try:
+            async for frame in contact_events.stream(subscription, keepalive=settings.CONTACT_EVENTS_KEEPALIVE):
+                yield frame
+        finally:
+            contact_events.unsubscribe(subscription)
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{contact_id}", response_model=ContactRead)
+async def read_contact(contact_id: int, db: AsyncSession = Depends(get_read_session)):
     """
     Retrieves a single contact by its ID.
     
@@ -53,11 +349,11 @@ async def read_contact(contact_id: int, db: AsyncSession = Depends(get_async_ses
     return db_contact
 
     
-@router.patch("/{contact_id}", response_model=Contact)
+@router.patch("/{contact_id}", response_model=ContactRead)
 async def update_existing_contact(
     contact_id: int, 
     contact_update: ContactUpdate, 
-    db: AsyncSession = Depends(get_async_session)
+    db: AsyncSession = Depends(get_write_session)
 ):
     """
     Updates an existing contact.
@@ -76,7 +372,7 @@ async def update_existing_contact(
 
 
 @router.delete("/{contact_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_existing_contact(contact_id: int, db: AsyncSession = Depends(get_async_session)):
+async def delete_existing_contact(contact_id: int, db: AsyncSession = Depends(get_write_session)):
     """
     Deletes a contact.
     
@@ -92,32 +388,97 @@ async def delete_existing_contact(contact_id: int, db: AsyncSession = Depends(ge
     return None
 
 
-@router.post("/search", response_model=List[Contact])
+@router.post("/search", response_model=List[ContactRead])
 async def get_search_contacts(
-    query: dict,
-    db: AsyncSession = Depends(get_async_session)
+    query: ContactSearch,
+    response: Response,
+    db: AsyncSession = Depends(get_read_session),
+    ranked: bool = Query(False),
+    count: Optional[Literal["exact", "estimate", "cached"]] = Query(None),
 ):
     """
     Universal search for contacts.
     
-    This endpoint performs a search based on one or more parameters provided in the request body.
-    - A single key will perform a search on one parameter.
-    - Multiple keys will perform a search on multiple parameters.
+    This endpoint performs a search based on one or more fields given in the request body.
+    Each field takes operators, which are all combined with AND:
+    - Text fields (`first_name`, `last_name`, `email`, `phone_number`, `other_info`):
+      `eq`, `prefix` (case-insensitive), `contains` (case-insensitive) and `in`.
+      A bare string is a shorthand for `contains`.
+    - `birthday`: `eq`, `between` (`[from, to]`, inclusive) and `in`.
+    - **limit**: The maximum number of records to return (50 in ranked mode, 100 otherwise).
+    - **cursor**: The `X-Next-Cursor` value of the previous page.
+    - **ranked**: Match `contains` by trigram similarity and order the results by match score.
+    - **count**: Adds an `X-Total-Count` header with the number of all matches
+      (`exact`, `estimate` or `cached`, as for the contacts listing).
+
+    Unranked results are ordered by ID; when more rows may follow, the
+    `X-Next-Cursor` response header carries the cursor for the next page.
+    Results are cached until the next write to the contacts or `QUERY_CACHE_TTL`.
+
+    Raises:
+        HTTPException: If the cursor is malformed or used with `ranked`, or nothing matches on the first page.
     """
-    contacts = await search_contacts_repo(db, query)
+    if ranked and query.cursor is not None:
+        raise HTTPException(status_code=400, detail="Ranked search returns a single page and takes no cursor.")
+    limit = query.limit or (50 if ranked else 100)
+    filters = query.filters()
+    try:
+        contacts = await cached_search_contacts(db, filters, ranked=ranked, limit=limit, cursor=query.cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    if not contacts:
+    if not contacts and query.cursor is None:
         raise HTTPException(status_code=404, detail="No contacts found for the given criteria.")
 
+    if not ranked:
+        cursor_token = next_cursor(contacts, limit, "id", "asc")
+        if cursor_token is not None:
+            response.headers["X-Next-Cursor"] = cursor_token
+    if count is not None:
+        response.headers["X-Total-Count"] = str(await total_count(db, count, filters, ranked=ranked))
     return contacts
 
 
-@router.get("/upcoming_birthdays/", response_model=List[Contact])
-async def get_coming_birthday_contacts(db: AsyncSession = Depends(get_async_session)):
+@router.get("/search/text", response_model=List[ContactTextMatch])
+async def full_text_search_contacts(
+    q: str = Query(..., min_length=1, max_length=200),
+    db: AsyncSession = Depends(get_read_session),
+    limit: int = Query(20, ge=1, le=100),
+):
     """
-    Retrieves contacts with upcoming birthdays in the next 7 days.
+    Full-text search over contact names and notes.
+
+    Uses web search syntax: words are combined with AND, `"quoted text"` matches
+    a phrase, `or` gives alternatives and `-word` excludes a word. Words are
+    stemmed, so `meeting` also finds `meetings`.
+    - **q**: The search text.
+    - **limit**: The maximum number of records to return.
+
+    Results are ordered by relevance (name matches weigh more than notes) and
+    each one carries a `snippet` with the matched words wrapped in `<b>` tags.
+    """
+    matches = await search_contacts_text(db, q, limit=limit)
+    return [
+        ContactTextMatch.model_validate(
+            {**ContactRead.model_validate(contact).model_dump(), "rank": rank, "snippet": snippet}
+        )
+        for contact, rank, snippet in matches
+    ]
+
+
+@router.get("/upcoming_birthdays/", response_model=List[ContactRead])
+async def get_coming_birthday_contacts(
+    db: AsyncSession = Depends(get_read_session),
+    days: int = Query(7, ge=0, le=366),
+):
+    """
+    Retrieves contacts with upcoming birthdays in the next `days` days (7 by default).
     
-    This endpoint returns a list of contacts whose birthdays fall within the next 7 days,
-    including the current date. It correctly handles month and year transitions.
+    This endpoint returns a list of contacts whose birthdays fall within the next `days` days,
+    including the current date, ordered by the upcoming date. It correctly handles month and
+    year transitions, and Feb 29 birthdays in non-leap years.
+    - **days**: The size of the window in days, up to 366.
+
+    Results are cached until the next write to the contacts or local midnight.
     """
-    return await get_contacts_upcoming_birthdays(db)
\ No newline at end of file
+    return await cached_upcoming_birthdays(db, days=days)
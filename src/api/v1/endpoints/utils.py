@@ -1,8 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
-from src.database.db import get_async_session
+from src.database.db import get_async_session, pool_stats, sessionmanager
+from src.services.cache import contact_cache
+from src.services.events import contact_events
+from src.services.query_cache import query_cache
+from src.services.health import readiness_check
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["utils"])
 
@@ -20,9 +28,60 @@ async def healthchecker(db: AsyncSession = Depends(get_async_session)):
                 detail="Database is not configured correctly",
             )
         return {"message": "Welcome to FastAPI!"}
-    except Exception as e:
-        print(e)
+    except Exception:
+        logger.exception("Database health check failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error connecting to the database",
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/livez")
+async def liveness():
+    """
+    Liveness probe: answers as long as the process serves requests, without touching the database.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readiness(response: Response):
+    """
+    Readiness probe: reports whether this instance should receive traffic.
+
+    The database check is cached for `READINESS_CHECK_INTERVAL` seconds, so any
+    number of probes borrow at most one pool connection per interval. The
+    instance is not ready (503) when the
+    database is unreachable or every pool connection is checked out; pool
+    usage and the recent checkout wait are reported either way.
+    """
+    database = await readiness_check.database_status(sessionmanager.engine)
+    pool = pool_stats()
+    ready = database["ok"] and not pool["saturated"]
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"status": "ok" if ready else "unavailable", "database": database, "pool": pool}
+
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """
+    Returns the hit/miss counters of the single-contact cache of this process.
+    """
+    return contact_cache.stats()
+
+
+@router.get("/cache/query-stats")
+async def query_cache_stats():
+    """
+    Returns the size and hit/miss counters of the search and birthday result cache of this process.
+    """
+    return query_cache.stats()
+
+
+@router.get("/events/stats")
+async def events_stats():
+    """
+    Returns the subscriber and delivery counters of the contact event stream of this process.
+    """
+    return contact_events.stats()
@@ -0,0 +1,169 @@
+from typing import Annotated, Any, List, Literal, Optional
+
+from pydantic import field_validator, model_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+# Engine and pool defaults for each performance profile.
+# A value set explicitly in the environment always wins over the profile.
+PERFORMANCE_PROFILES: dict[str, dict[str, Any]] = {
+    "dev": {
+        "DB_ECHO": True,
+        "DB_POOL_SIZE": 5,
+        "DB_MAX_OVERFLOW": 10,
+        "DB_POOL_TIMEOUT": 30.0,
+        "DB_POOL_RECYCLE": 1800,
+        "DB_POOL_PRE_PING": True,
+        "DB_STATEMENT_CACHE_SIZE": 100,
+        "DB_COMMAND_TIMEOUT": 60.0,
+    },
+    "prod": {
+        "DB_ECHO": False,
+        "DB_POOL_SIZE": 20,
+        "DB_MAX_OVERFLOW": 10,
+        "DB_POOL_TIMEOUT": 10.0,
+        "DB_POOL_RECYCLE": 1800,
+        "DB_POOL_PRE_PING": True,
+        "DB_STATEMENT_CACHE_SIZE": 500,
+        "DB_COMMAND_TIMEOUT": 30.0,
+        "DB_POOL_WARMUP": 10,
+        "DB_PRIME_STATEMENTS": True,
+    },
+    "benchmark": {
+        "DB_ECHO": False,
+        "DB_POOL_SIZE": 50,
+        "DB_MAX_OVERFLOW": 0,
+        "DB_POOL_TIMEOUT": 30.0,
+        "DB_POOL_RECYCLE": -1,
+        "DB_POOL_PRE_PING": False,
+        "DB_STATEMENT_CACHE_SIZE": 1000,
+        "DB_COMMAND_TIMEOUT": 60.0,
+        "DB_POOL_WARMUP": 50,
+        "DB_PRIME_STATEMENTS": True,
+    },
+}
+
+
+class Settings(BaseSettings):
+    """
+    Application settings, read from environment variables and the `.env` file.
+
+    `APP_PROFILE` selects a set of engine and pool defaults from
+    `PERFORMANCE_PROFILES`; any of them can still be overridden one by one.
+    """
+
+    APP_PROFILE: Literal["dev", "prod", "benchmark"] = "dev"
+    LOG_LEVEL: str = "INFO"
+
+    DB_USER: Optional[str] = None
+    DB_PASS: Optional[str] = None
+    DB_NAME: Optional[str] = None
+    DB_HOST: str = "localhost"
+    DB_PORT: int = 5432
+
+    # Engine and pool tuning, see PERFORMANCE_PROFILES.
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_COMMAND_TIMEOUT: float = 60.0
+    # Connections opened at startup (capped at DB_POOL_SIZE), and whether the
+    # hot repository queries are prepared on each of them before serving.
+    DB_POOL_WARMUP: int = 0
+    DB_PRIME_STATEMENTS: bool = False
+
+    # Read replicas as comma-separated SQLAlchemy URLs; read-only routes use them.
+    DB_REPLICA_URLS: Annotated[List[str], NoDecode] = []
+    DB_REPLICA_SELECTION: Literal["round_robin", "least_connections"] = "round_robin"
+    # A replica that fails to connect is skipped for this many seconds.
+    DB_REPLICA_RETRY_AFTER: float = 10.0
+    DB_REPLICA_CONNECT_TIMEOUT: float = 2.0
+    # After a write, the same client reads from the primary for this many seconds.
+    DB_READ_YOUR_WRITES_WINDOW: float = 5.0
+
+    CONTACT_CACHE_BACKEND: Literal["memory", "redis", "none"] = "memory"
+    CONTACT_CACHE_SIZE: int = 10_000
+    CONTACT_CACHE_TTL: int = 60
+    CONTACT_CACHE_REDIS_URL: Optional[str] = None
+
+    # Totals served by `X-Total-Count` in "cached" mode, see src/services/counts.py.
+    COUNT_CACHE_TTL: int = 30
+    COUNT_CACHE_SIZE: int = 1000
+
+    # Results of `/contacts/search` and `/contacts/upcoming_birthdays/`, see
+    # src/services/query_cache.py. Birthday results also expire at local midnight.
+    QUERY_CACHE_ENABLED: bool = True
+    QUERY_CACHE_TTL: int = 30
+    QUERY_CACHE_BIRTHDAYS_TTL: int = 3600
+    QUERY_CACHE_SIZE: int = 500
+    QUERY_CACHE_MAX_ROWS: int = 50_000
+
+    # Statements slower than this are kept for `/admin/slow-queries`; None disables the log.
+    SLOW_QUERY_THRESHOLD_MS: Optional[float] = 200.0
+    SLOW_QUERY_LOG_SIZE: int = 100
+    # The admin endpoints can run captured SELECT statements under EXPLAIN ANALYZE.
+    # Every admin request must send the token in `X-Admin-Token`; without a token
+    # configured, all of them are rejected.
+    ADMIN_API_ENABLED: bool = False
+    ADMIN_API_TOKEN: Optional[str] = None
+
+    # Opt-in group commit of single creates: concurrent `POST /contacts/` calls
+    # are written together, after at most MAX_DELAY_MS or once BATCH_SIZE are waiting.
+    CONTACT_CREATE_COALESCING: bool = False
+    CONTACT_CREATE_BATCH_SIZE: int = 100
+    CONTACT_CREATE_MAX_DELAY_MS: float = 5.0
+
+    # Tombstones of deleted contacts are kept this many days; older `/contacts/changes`
+    # sync tokens must start over with a full sync.
+    TOMBSTONE_RETENTION_DAYS: int = 30
+
+    # Change events streamed by `/contacts/stream`. The "postgres" backend fans them
+    # out to every worker with LISTEN/NOTIFY; "memory" only reaches the local process.
+    CONTACT_EVENTS_BACKEND: Literal["postgres", "memory", "none"] = "postgres"
+    CONTACT_EVENTS_CHANNEL: str = "contact_events"
+    # Events buffered per client; a client that falls further behind is disconnected.
+    CONTACT_EVENTS_QUEUE_SIZE: int = 256
+    CONTACT_EVENTS_MAX_SUBSCRIBERS: int = 1000
+    CONTACT_EVENTS_KEEPALIVE: float = 15.0
+    # Events waiting to be sent by the background publisher; writers never wait
+    # for it, events beyond the limit or not sent within the timeout are dropped.
+    CONTACT_EVENTS_OUTBOX_SIZE: int = 10_000
+    CONTACT_EVENTS_PUBLISH_TIMEOUT: float = 5.0
+
+    # `/readyz` checks the database at most once per interval and reuses the result.
+    READINESS_CHECK_INTERVAL: float = 5.0
+    READINESS_CHECK_TIMEOUT: float = 2.0
+
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+
+    @model_validator(mode="before")
+    @classmethod
+    def apply_performance_profile(cls, data: Any) -> Any:
+        """
+        Fills the engine and pool settings that were not set explicitly from the selected profile.
+        """
+        if not isinstance(data, dict):
+            return data
+        profile = data.get("APP_PROFILE", "dev")
+        for key, value in PERFORMANCE_PROFILES.get(profile, {}).items():
+            data.setdefault(key, value)
+        return data
+
+    @field_validator("DB_REPLICA_URLS", mode="before")
+    @classmethod
+    def split_replica_urls(cls, v: Any) -> Any:
+        """
+        Accepts the replica URLs as one comma-separated string.
+        """
+        if isinstance(v, str):
+            return [url.strip() for url in v.split(",") if url.strip()]
+        return v
+
+    @property
+    def DATABASE_URL(self) -> str:
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
+
+settings = Settings()
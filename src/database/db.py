@@ -34,21 +34,309 @@
 #             raise
 
 
-import os
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+import itertools
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-DB_USER = os.getenv("DB_USER")
-DB_PASS = os.getenv("DB_PASS")
-DB_NAME = os.getenv("DB_NAME")
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = os.getenv("DB_PORT", "5432")
+from fastapi import Request, Response
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
-DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+from src.conf.config import settings
+from src.services.cache import contacts_generation
+from src.services.metrics import InstrumentedAsyncQueuePool, instrument_engine
+from src.services.slow_queries import slow_query_log
+
+logger = logging.getLogger(__name__)
+
+DATABASE_URL = settings.DATABASE_URL
+
+# Cookie marking a client that wrote recently; holds the epoch time until which
+# its reads go to the primary.
+READ_YOUR_WRITES_COOKIE = "db_primary_until"
+
+
+class Replica:
+    """
+    A read replica engine with its session factory and health state.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        self.down_until = 0.0
+
+    @property
+    def name(self) -> str:
+        return f"{self.engine.url.host}:{self.engine.url.port or 5432}/{self.engine.url.database}"
+
+    def is_available(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "replica": self.name,
+            "checked_out": self.engine.pool.checkedout(),
+            "available": self.is_available(),
+        }
+
+
+class DatabaseSessionManager:
+    """
+    Owns the engine and the session factory for the lifetime of the application.
+
+    Nothing connects at import time: `init()` creates the engine (called from the
+    FastAPI lifespan handler, or by scripts), and `close()` disposes of it and
+    every pooled connection.
+    """
+
+    def __init__(self):
+        self._engine: Optional[AsyncEngine] = None
+        self._session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+        self.replicas: List[Replica] = []
+        self._round_robin = itertools.count()
+
+    @staticmethod
+    def _create_engine(url: str, **kwargs: Any) -> AsyncEngine:
+        connect_args = {
+            # asyncpg's own per-connection prepared statement cache.
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "command_timeout": settings.DB_COMMAND_TIMEOUT,
+            **kwargs.pop("connect_args", {}),
+        }
+        return create_async_engine(
+            url,
+            echo=settings.DB_ECHO,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            connect_args=connect_args,
+            **kwargs,
+        )
+
+    def init(self, url: str = DATABASE_URL, replica_urls: Optional[List[str]] = None) -> AsyncEngine:
+        """
+        Creates the instrumented primary engine, the replica engines and their session factories.
+
+        Args:
+            url (str): The primary database URL.
+            replica_urls (Optional[List[str]]): The read replica URLs; `DB_REPLICA_URLS` by default.
+
+        Returns:
+            AsyncEngine: The new primary engine.
+        """
+        self._engine = self._create_engine(url, poolclass=InstrumentedAsyncQueuePool)
+        instrument_engine(self._engine)
+        slow_query_log.install(self._engine)
+        self._session_maker = async_sessionmaker(self._engine, expire_on_commit=False)
+
+        if replica_urls is None:
+            replica_urls = settings.DB_REPLICA_URLS
+        self.replicas = []
+        for replica_url in replica_urls:
+            # A short connect timeout makes an unreachable replica fail over quickly.
+            engine = self._create_engine(replica_url, connect_args={"timeout": settings.DB_REPLICA_CONNECT_TIMEOUT})
+            instrument_engine(engine, track_pool=False)
+            slow_query_log.install(engine)
+            self.replicas.append(Replica(engine))
+        return self._engine
+
+    async def close(self) -> None:
+        """
+        Closes every pooled connection and forgets the engines.
+        """
+        if self._engine is not None:
+            await self._engine.dispose()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+        self._engine = None
+        self._session_maker = None
+        self.replicas = []
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """
+        The engine created by `init()`.
+
+        Raises:
+            RuntimeError: If the manager has not been initialized.
+        """
+        if self._engine is None:
+            raise RuntimeError("The database engine is not initialized; call sessionmanager.init() first.")
+        return self._engine
+
+    def session(self) -> AsyncSession:
+        """
+        Returns a new session; use it as an async context manager.
+
+        Raises:
+            RuntimeError: If the manager has not been initialized.
+        """
+        if self._session_maker is None:
+            raise RuntimeError("The database engine is not initialized; call sessionmanager.init() first.")
+        return self._session_maker()
+
+    def _replica_order(self) -> List[Replica]:
+        """
+        Returns the available replicas, the preferred one first.
+        """
+        available = [replica for replica in self.replicas if replica.is_available()]
+        if settings.DB_REPLICA_SELECTION == "least_connections":
+            return sorted(available, key=lambda replica: replica.engine.pool.checkedout())
+        if not available:
+            return []
+        start = next(self._round_robin) % len(available)
+        return available[start:] + available[:start]
+
+    @asynccontextmanager
+    async def read_session(self, use_primary: bool = False) -> AsyncIterator[AsyncSession]:
+        """
+        Provides a session for read-only work, on a replica when one is usable.
+
+        A connection is checked out before the session is handed over, so a
+        replica that cannot be reached is detected here: it is skipped for
+        `DB_REPLICA_RETRY_AFTER` seconds and the next one (finally the primary)
+        is tried instead.
+
+        Args:
+            use_primary (bool): Whether to read from the primary regardless of replicas.
+
+        Yields:
+            AsyncSession: A session whose connection is already open.
+        """
+        if not use_primary:
+            for replica in self._replica_order():
+                session = replica.session_maker()
+                try:
+                    await session.connection()
+                except (OSError, TimeoutError, DBAPIError) as e:
+                    await session.close()
+                    replica.down_until = time.monotonic() + settings.DB_REPLICA_RETRY_AFTER
+                    logger.warning("Replica %s is unavailable, failing over: %r", replica.name, e)
+                    continue
+                async with session:
+                    yield session
+                return
+
+        async with self.session() as session:
+            yield session
+
+    @asynccontextmanager
+    async def connections(self, count: int) -> AsyncIterator[list]:
+        """
+        Checks out `count` pool connections at the same time, returning them on exit.
+        """
+        opened = []
+        try:
+            for _ in range(count):
+                opened.append(await self.engine.connect())
+            yield opened
+        finally:
+            for conn in opened:
+                await conn.close()
+
+
+sessionmanager = DatabaseSessionManager()
+
+
+def pool_config() -> Dict[str, Any]:
+    """
+    Returns the effective engine and pool configuration, for startup reporting.
+    """
+    return {
+        "profile": settings.APP_PROFILE,
+        "host": f"{settings.DB_HOST}:{settings.DB_PORT}",
+        "database": settings.DB_NAME,
+        "pool_class": type(sessionmanager.engine.pool).__name__,
+        "pool_size": sessionmanager.engine.pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_warmup": settings.DB_POOL_WARMUP,
+        "replicas": [replica.name for replica in sessionmanager.replicas],
+        "replica_selection": settings.DB_REPLICA_SELECTION,
+        "prime_statements": settings.DB_PRIME_STATEMENTS,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        "echo": settings.DB_ECHO,
+    }
+
+
+def is_cacheable_read(db: AsyncSession) -> bool:
+    """
+    Tells whether rows read through `db` may be put into a cache.
+
+    A replica can still be replaying a recent write, so a row read from it
+    shortly after a write may be the old version (or a deleted contact), and
+    caching it would serve it for the whole TTL. Reads from the primary are
+    always current; replica reads only once no write has been seen for
+    `DB_READ_YOUR_WRITES_WINDOW` seconds.
+    """
+    if db.bind is sessionmanager.engine:
+        return True
+    return contacts_generation.age() > settings.DB_READ_YOUR_WRITES_WINDOW
+
+
+def pool_stats() -> Dict[str, Any]:
+    """
+    Returns the current usage of the connection pool.
+    """
+    pool = sessionmanager.engine.pool
+    checked_out = pool.checkedout()
+    capacity = pool.size() + settings.DB_MAX_OVERFLOW
+    return {
+        "size": pool.size(),
+        "checked_out": checked_out,
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "saturated": checked_out >= capacity,
+        "checkout_wait_ms": round(getattr(pool, "recent_wait", 0.0) * 1000, 3),
+        "replicas": [replica.stats() for replica in sessionmanager.replicas],
+    }
 
-engine = create_async_engine(DATABASE_URL, echo=True)
-async_session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 async def get_async_session():
-    async with async_session_maker() as session:
+    async with sessionmanager.session() as session:
+        yield session
+
+
+async def get_write_session(response: Response):
+    """
+    Provides a primary session for a route that writes.
+
+    The client is marked, through a cookie, to read from the primary for
+    `DB_READ_YOUR_WRITES_WINDOW` seconds, so it sees its own changes even while
+    the replicas are catching up.
+    """
+    window = settings.DB_READ_YOUR_WRITES_WINDOW
+    if sessionmanager.replicas and window > 0:
+        response.set_cookie(
+            READ_YOUR_WRITES_COOKIE,
+            f"{time.time() + window:.3f}",
+            max_age=math.ceil(window),
+            httponly=True,
+            samesite="lax",
+        )
+    async with sessionmanager.session() as session:
+        yield session
+
+
+def _wrote_recently(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_session(request: Request):
+    """
+    Provides a session for a read-only route: a replica, unless the client wrote recently.
+    """
+    async with sessionmanager.read_session(use_primary=_wrote_recently(request)) as session:
         yield session
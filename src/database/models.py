@@ -1,6 +1,15 @@
-from sqlalchemy import Column, Integer, String, DATE, text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from datetime import date
+from sqlalchemy import BigInteger, Column, DateTime, FetchedValue, Integer, SmallInteger, String, DATE, Index, func, literal_column, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import DeclarativeBase, Mapped, column_property, mapped_column
+from datetime import date, datetime
+from typing import Optional
+
+# Text search configuration of `ContactsModel.search_vector`; queries must use the same one.
+TEXT_SEARCH_CONFIG = "english"
+
+# Indexed instead of stored; queries must spell it exactly like the index does,
+# so the model and the index share the SQL text.
+BIRTHDAY_KEY_SQL = "(EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday))::smallint"
 
 
 class Base(DeclarativeBase):
@@ -12,7 +21,64 @@ class ContactsModel(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     first_name: Mapped[str] = mapped_column(String(50), index=True)
     last_name: Mapped[str] = mapped_column(String(50), index=True)
-    email: Mapped[str] = mapped_column(String(50), unique=True, index=True)
-    phone_number: Mapped[str] = mapped_column(String(20), unique=True)
+    # Unique among live contacts only, see the partial indexes in `__table_args__`.
+    email: Mapped[str] = mapped_column(String(50))
+    phone_number: Mapped[str] = mapped_column(String(20))
     birthday: Mapped[date] = mapped_column(DATE, nullable=False, index=True)
     other_info: Mapped[str] = mapped_column(String(250), nullable=True)
+    # Month and day of the birthday as `MMDD` (e.g. 1231), computed by Postgres.
+    # Not stored: the expression itself is indexed, so it can be range-scanned.
+    # Feb 29 keeps its own key (229), which sorts between Feb 28 and Mar 1.
+    birthday_key: Mapped[int] = column_property(literal_column(f"({BIRTHDAY_KEY_SQL})", SmallInteger), deferred=True)
+    # Change tracking for delta sync, maintained by the `contacts_track_change`
+    # trigger on every insert and update: `updated_at` is the start time and
+    # `change_xid` the ID of the writing transaction. Deleting a contact only
+    # sets `deleted_at` (a tombstone).
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue(), nullable=False
+    )
+    change_xid: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("0"), server_onupdate=FetchedValue(), nullable=False
+    )
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Full-text document of the contact, maintained by the
+    # `contacts_search_vector_update` trigger: names weigh more (A) than the
+    # free-form notes (B) when results are ranked. Deferred, so ordinary
+    # queries do not load it.
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, server_default=FetchedValue(), server_onupdate=FetchedValue(), nullable=True, deferred=True
+    )
+
+    __table_args__ = (
+        # A deleted contact's email and phone number can be used again.
+        Index("ix_contacts_email", "email", unique=True, postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_contacts_phone_number", "phone_number", unique=True, postgresql_where=text("deleted_at IS NULL")),
+        # Delta sync walks changes in `(change_xid, id)` order.
+        Index("ix_contacts_change_xid_id", "change_xid", "id"),
+        # Composite indexes backing keyset pagination on each sortable column.
+        # `id` is the tie-breaker that makes the order stable for duplicate values.
+        Index("ix_contacts_last_name_id", "last_name", "id"),
+        Index("ix_contacts_first_name_id", "first_name", "id"),
+        Index("ix_contacts_birthday_id", "birthday", "id"),
+        # Trigram indexes serving substring (`ILIKE '%value%'`) and similarity search.
+        *(
+            Index(
+                f"ix_contacts_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+            for column in ("first_name", "last_name", "email", "phone_number", "other_info")
+        ),
+        # Case-insensitive prefix search (`lower(column) LIKE 'value%'`). The
+        # `text_pattern_ops` class compares byte-wise, so LIKE prefixes can use
+        # the index regardless of the database collation.
+        *(
+            Index(f"ix_contacts_{column}_prefix", text(f"lower({column}) text_pattern_ops"))
+            for column in ("first_name", "last_name", "email", "phone_number")
+        ),
+        # Upcoming birthdays (`birthday_key BETWEEN start AND end`).
+        Index("ix_contacts_birthday_key", text(f"({BIRTHDAY_KEY_SQL})")),
+        # Full-text search (`search_vector @@ query`).
+        Index("ix_contacts_search_vector", "search_vector", postgresql_using="gin"),
+    )
@@ -0,0 +1,88 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Optional, Tuple
+
+from src.database.models import ContactsModel
+
+# Columns that can be used as a stable keyset sort.
+# Every entry is backed by a composite `(column, id)` index so that any page
+# is served by an index range scan regardless of how deep it is.
+SORTABLE_COLUMNS = {
+    "id": ContactsModel.id,
+    "last_name": ContactsModel.last_name,
+    "first_name": ContactsModel.first_name,
+    "birthday": ContactsModel.birthday,
+}
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the requested sort."""
+
+
+def encode_cursor(sort_by: str, order: str, value: Any, contact_id: int) -> str:
+    """
+    Builds an opaque cursor pointing right after the given row.
+
+    Args:
+        sort_by (str): The name of the sort column.
+        order (str): The sort direction, "asc" or "desc".
+        value (Any): The value of the sort column in the last returned row.
+        contact_id (int): The ID of the last returned row (tie-breaker).
+
+    Returns:
+        str: A URL-safe token that can be passed back as `cursor`.
+    """
+    if isinstance(value, date):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort_by, "o": order, "v": value, "id": contact_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, order: str) -> Tuple[Any, int]:
+    """
+    Decodes a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The opaque token received from the client.
+        sort_by (str): The sort column of the current request.
+        order (str): The sort direction of the current request.
+
+    Raises:
+        InvalidCursorError: If the token is malformed or was issued for a different sort.
+
+    Returns:
+        Tuple[Any, int]: The sort value and the ID of the last row of the previous page.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value, contact_id = payload["v"], int(payload["id"])
+        if payload["s"] != sort_by or payload["o"] != order:
+            raise InvalidCursorError("Cursor does not match the requested sort order.")
+        if sort_by == "change":
+            # `[change_xid, issued_at]`: the position of the last change and
+            # when the token was issued, see `/contacts/changes`.
+            change_xid, issued_at = value
+            value = (int(change_xid), datetime.fromisoformat(issued_at))
+            if value[1].tzinfo is None:
+                raise ValueError("Timestamp without a time zone.")
+        elif sort_by == "birthday":
+            value = date.fromisoformat(value)
+        elif sort_by == "id":
+            value = int(value)
+    except InvalidCursorError:
+        raise
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Malformed pagination cursor.") from e
+    return value, contact_id
+
+
+def next_cursor(rows: list, limit: int, sort_by: str, order: str) -> Optional[str]:
+    """
+    Returns the cursor for the page following `rows`, or None if this was the last page.
+    """
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(sort_by, order, getattr(last, sort_by), last.id)
@@ -1,49 +1,195 @@
-from datetime import date, timedelta
+import calendar
+import json
+from datetime import date, datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.database.models import ContactsModel
-from src.schemas.schemas import ContactBase, ContactCreate, ContactUpdate, Contact
-from typing import List, Optional
-from sqlalchemy import select, extract, or_, and_
+from src.database.models import TEXT_SEARCH_CONFIG, ContactsModel
+from src.schemas.schemas import ContactBase, ContactCreate, ContactFilter, ContactUpdate, Contact, DateFilter, StringFilter
+from src.database.db import is_cacheable_read
+from src.repository.pagination import SORTABLE_COLUMNS, decode_cursor
+from src.services.cache import contact_cache, contacts_generation
+from src.services.events import contact_events
+from typing import AsyncIterator, List, Optional, Tuple
+from sqlalchemy import DATE, BigInteger, Integer, String, Text, delete, insert, select, update, func, literal, literal_column, or_, and_, any_, bindparam, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+
+
+# Deleted contacts stay in the table as tombstones for delta sync; every read
+# of current contacts must be restricted to the live ones.
+LIVE = ContactsModel.deleted_at.is_(None)
+
+
+class DuplicateContactError(ValueError):
+    """Raised when a new contact's email or phone number already belongs to another contact."""
 
 
 async def create_contact(db: AsyncSession, contact: ContactCreate) -> ContactsModel:
     """
     Creates a new contact in the database.
 
+    The row is written and read back with a single `INSERT ... RETURNING`.
+
     Args:
         db (AsyncSession): The database session.
         contact (ContactCreate): The Pydantic schema with contact data.
 
+    Raises:
+        DuplicateContactError: If the email or phone number is already taken.
+
     Returns:
         ContactsModel: The newly created contact object from the database.
     """
-    db_contact = ContactsModel(
-        first_name=contact.first_name,
-        last_name=contact.last_name,
-        email=contact.email,
-        phone_number=contact.phone_number,
-        birthday=contact.birthday,
-        other_info=contact.other_info
+    stmt = insert(ContactsModel).values(**contact.model_dump()).returning(ContactsModel)
+    try:
+        db_contact = (await db.execute(stmt)).scalar_one()
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise DuplicateContactError("A contact with this email or phone number already exists.") from e
+    contacts_generation.bump()
+    contact_events.publish_change("created", db_contact)
+    return db_contact
+
+
+def _match_inserted(contacts: List[ContactCreate], inserted: dict) -> list:
+    """
+    Pairs each input contact with its returned row, or None if it was skipped.
+
+    Returned rows are matched back by email; each email can be claimed only once,
+    so duplicates inside the batch are reported as conflicts as well.
+
+    Args:
+        contacts (List[ContactCreate]): The contacts in input order.
+        inserted (dict): Maps each returned email to `(value, phone_number)`.
+    """
+    matched = []
+    for contact in contacts:
+        row = inserted.get(contact.email)
+        if row is not None and row[1] == contact.phone_number:
+            del inserted[contact.email]
+            matched.append(row[0])
+        else:
+            matched.append(None)
+    return matched
+
+
+async def insert_contacts(db: AsyncSession, contacts: List[ContactCreate]) -> List[Optional[int]]:
+    """
+    Inserts a batch of contacts with a single multi-row statement and commits it.
+
+    Rows that violate the unique constraints on email or phone number are skipped
+    (`ON CONFLICT DO NOTHING`) instead of failing the whole batch.
+
+    Args:
+        db (AsyncSession): The database session.
+        contacts (List[ContactCreate]): The validated contacts to insert.
+
+    Returns:
+        List[Optional[int]]: For each input contact, in order, the ID of the created
+        row or None if the row was skipped because of a conflict.
+    """
+    if not contacts:
+        return []
+
+    stmt = (
+        pg_insert(ContactsModel)
+        .values([contact.model_dump() for contact in contacts])
+        .on_conflict_do_nothing()
+        .returning(ContactsModel.id, ContactsModel.email, ContactsModel.phone_number)
     )
-    db.add(db_contact)
+    result = await db.execute(stmt)
+    inserted = {email: (contact_id, phone) for contact_id, email, phone in result.all()}
     await db.commit()
-    await db.refresh(db_contact)
-    return db_contact
-    
+    contacts_generation.bump()
+    contact_events.publish_bulk("bulk_created", len(inserted))
+    return _match_inserted(contacts, inserted)
+
 
-async def get_contacts(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[ContactsModel]:
+async def create_contacts(db: AsyncSession, contacts: List[ContactCreate]) -> List[Optional[ContactsModel]]:
+    """
+    Creates many contacts in one transaction with a single `INSERT ... RETURNING`.
+
+    Like `insert_contacts`, but returns the created rows. Rows that violate the
+    unique constraints on email or phone number are skipped instead of failing
+    the others.
+
+    Args:
+        db (AsyncSession): The database session.
+        contacts (List[ContactCreate]): The validated contacts to create.
+
+    Returns:
+        List[Optional[ContactsModel]]: For each input contact, in order, the created
+        contact or None if it conflicted with an existing one.
+    """
+    if not contacts:
+        return []
+
+    stmt = (
+        pg_insert(ContactsModel)
+        .values([contact.model_dump() for contact in contacts])
+        .on_conflict_do_nothing()
+        .returning(ContactsModel)
+    )
+    result = await db.execute(stmt)
+    inserted = {row.email: (row, row.phone_number) for row in result.scalars().all()}
+    await db.commit()
+    contacts_generation.bump()
+    contact_events.publish_changes("created", [row for row, _ in inserted.values()])
+    return _match_inserted(contacts, inserted)
+
+
+async def get_contacts(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    sort_by: str = "id",
+    order: str = "asc",
+    cursor: Optional[str] = None,
+) -> List[ContactsModel]:
     """
     Retrieves a list of all contacts from the database.
 
+    When a `cursor` is given, the page starts right after the row it points to
+    (keyset pagination), so the cost of a page does not depend on its depth.
+    Rows are always ordered by `(sort_by, id)` to keep the order stable.
+
     Args:
         db (AsyncSession): The database session.
         skip (int): The number of records to skip (for pagination).
         limit (int): The maximum number of records to return.
+        sort_by (str): The column to sort by, one of `SORTABLE_COLUMNS`.
+        order (str): The sort direction, "asc" or "desc".
+        cursor (Optional[str]): An opaque token returned with the previous page.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or belongs to another sort.
 
     Returns:
         List[ContactsModel]: A list of contact objects.
     """
-    stmt = select(ContactsModel).offset(skip).limit(limit)
+    column = SORTABLE_COLUMNS[sort_by]
+    descending = order == "desc"
+
+    if sort_by == "id":
+        keys = (ContactsModel.id,)
+    else:
+        keys = (column, ContactsModel.id)
+
+    stmt = select(ContactsModel).where(LIVE).order_by(*(key.desc() if descending else key.asc() for key in keys))
+
+    if cursor is not None:
+        value, last_id = decode_cursor(cursor, sort_by, order)
+        # Row-value comparison lets Postgres turn the predicate into a single
+        # range condition on the composite `(column, id)` index.
+        last_key = (last_id,) if sort_by == "id" else (value, last_id)
+        if descending:
+            stmt = stmt.where(tuple_(*keys) < tuple_(*last_key))
+        else:
+            stmt = stmt.where(tuple_(*keys) > tuple_(*last_key))
+    elif skip:
+        stmt = stmt.offset(skip)
+
+    stmt = stmt.limit(limit)
     result = await db.execute(stmt)
     contacts = result.scalars().all()
     return contacts
@@ -53,6 +199,9 @@ async def get_contact_by_id(db: AsyncSession, contact_id: int) -> Optional[Conta
     """
     Retrieves a single contact by its ID.
 
+    Lookups go through `contact_cache` first; the database is only queried on a miss.
+    Rows read from a replica right after a write are not cached, see `is_cacheable_read`.
+
     Args:
         db (AsyncSession): The database session.
         contact_id (int): The ID of the contact to retrieve.
@@ -60,14 +209,70 @@ async def get_contact_by_id(db: AsyncSession, contact_id: int) -> Optional[Conta
     Returns:
         Optional[ContactsModel]: The contact object or None if not found.
     """
+    contact = await contact_cache.get(contact_id)
+    if contact is not None:
+        return contact
+
     # Query the database to get a contact by its ID.
-    return await db.get(ContactsModel, contact_id)
+    contact = await _get_live_contact(db, contact_id)
+    if contact is not None and is_cacheable_read(db):
+        await contact_cache.set(contact)
+    return contact
+
+
+async def _get_live_contact(db: AsyncSession, contact_id: int) -> Optional[ContactsModel]:
+    result = await db.execute(select(ContactsModel).where(ContactsModel.id == contact_id, LIVE))
+    return result.scalar_one_or_none()
+
+
+def _ids_predicate(contact_ids: List[int]):
+    """
+    Returns `id = ANY(:ids)`; a single array parameter keeps the statement text
+    (and its prepared statement) the same for any number of IDs.
+    """
+    return ContactsModel.id == any_(bindparam("ids", contact_ids, type_=ARRAY(Integer)))
+
+
+async def _get_live_contacts(db: AsyncSession, contact_ids: List[int]) -> List[ContactsModel]:
+    result = await db.execute(select(ContactsModel).where(_ids_predicate(contact_ids), LIVE))
+    return result.scalars().all()
+
+
+async def get_contacts_by_ids(db: AsyncSession, contact_ids: List[int]) -> List[ContactsModel]:
+    """
+    Retrieves many contacts by ID with at most one query.
+
+    Cached contacts are taken from `contact_cache`; the rest are fetched with a
+    single `WHERE id = ANY(:ids)` query and added to the cache (unless read
+    from a replica right after a write, see `is_cacheable_read`).
+
+    Args:
+        db (AsyncSession): The database session.
+        contact_ids (List[int]): The IDs to look up, without duplicates.
+
+    Returns:
+        List[ContactsModel]: The contacts found, in the order of `contact_ids`.
+    """
+    found = await contact_cache.get_many(contact_ids)
+    missing = [contact_id for contact_id in contact_ids if contact_id not in found]
+
+    if missing:
+        contacts = await _get_live_contacts(db, missing)
+        cacheable = is_cacheable_read(db)
+        for contact in contacts:
+            found[contact.id] = contact
+            if cacheable:
+                await contact_cache.set(contact)
+
+    return [found[contact_id] for contact_id in contact_ids if contact_id in found]
 
 
 async def update_contact(db: AsyncSession, contact_id: int, body: ContactUpdate) -> Optional[ContactsModel]:
     """
     Updates an existing contact in the database.
 
+    The row is changed and read back with a single `UPDATE ... RETURNING`.
+
     Args:
         db (AsyncSession): The database session.
         contact_id (int): The ID of the contact to update.
@@ -76,12 +281,24 @@ async def update_contact(db: AsyncSession, contact_id: int, body: ContactUpdate)
     Returns:
         Optional[ContactsModel]: The updated contact object or None if not found.
     """
-    contact = await db.get(ContactsModel, contact_id)
-    if contact:
-        for field, value in body.model_dump(exclude_unset=True).items():
-            setattr(contact, field, value)
+    values = body.model_dump(exclude_unset=True)
+    if not values:
+        # Nothing to change, the update is a plain lookup.
+        return await _get_live_contact(db, contact_id)
+
+    stmt = (
+        update(ContactsModel)
+        .where(ContactsModel.id == contact_id, LIVE)
+        .values(**values)
+        .returning(ContactsModel)
+        .execution_options(synchronize_session=False)
+    )
+    contact = (await db.execute(stmt)).scalar_one_or_none()
+    if contact is not None:
         await db.commit()
-        await db.refresh(contact)
+        contacts_generation.bump()
+        await contact_cache.invalidate(contact_id)
+        contact_events.publish_change("updated", contact)
     return contact
 
 
@@ -89,6 +306,9 @@ async def delete_contact(db: AsyncSession, contact_id: int) -> Optional[Contacts
     """
     Deletes a contact by its ID.
 
+    The row is kept as a tombstone (`deleted_at` is set) so that delta sync can
+    report the deletion, and read back with a single `UPDATE ... RETURNING`.
+
     Args:
         db (AsyncSession): The database session.
         contact_id (int): The ID of the contact to delete.
@@ -96,91 +316,581 @@ async def delete_contact(db: AsyncSession, contact_id: int) -> Optional[Contacts
     Returns:
         Optional[ContactsModel]: The deleted contact object or None if not found.
     """
-    db_contact = await db.get(ContactsModel, contact_id)
+    stmt = (
+        update(ContactsModel)
+        .where(ContactsModel.id == contact_id, LIVE)
+        .values(deleted_at=func.now())
+        .returning(ContactsModel)
+        .execution_options(synchronize_session=False)
+    )
+    db_contact = (await db.execute(stmt)).scalar_one_or_none()
 
-    if db_contact:
-        await db.delete(db_contact)
+    if db_contact is not None:
         await db.commit()
-        return db_contact 
+        contacts_generation.bump()
+        await contact_cache.invalidate(contact_id)
+        contact_events.publish_change("deleted", db_contact)
+        return db_contact
 
     return None
 
 
-async def search_contacts_repo(db: AsyncSession, filters: dict[str, str]) -> List[ContactsModel]:
+# Text columns that may be used in search filters.
+# Each one is backed by a `gin_trgm_ops` index, which serves both `ILIKE '%value%'`
+# and the trigram similarity operators used by the ranked search. All but
+# `other_info` also have a `lower(column) text_pattern_ops` index for prefixes.
+SEARCHABLE_COLUMNS = {
+    "first_name": ContactsModel.first_name,
+    "last_name": ContactsModel.last_name,
+    "email": ContactsModel.email,
+    "phone_number": ContactsModel.phone_number,
+    "other_info": ContactsModel.other_info,
+}
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _string_conditions(column, string_filter: StringFilter, ranked: bool) -> Tuple[list, list]:
+    conditions = []
+    scores = []
+    if string_filter.eq is not None:
+        conditions.append(column == string_filter.eq)
+    if string_filter.in_ is not None:
+        conditions.append(column == any_(bindparam(None, string_filter.in_, type_=ARRAY(String))))
+    if string_filter.prefix is not None:
+        # Matches the `lower(column) text_pattern_ops` index expression exactly.
+        pattern = _escape_like(string_filter.prefix.lower()) + "%"
+        conditions.append(func.lower(column).like(pattern, escape="\\"))
+    if string_filter.contains is not None:
+        value = string_filter.contains
+        if ranked:
+            # `value <% column` is the pg_trgm word-similarity operator.
+            conditions.append(literal(value).op("<%")(column))
+            scores.append(func.word_similarity(value, column))
+        else:
+            conditions.append(column.ilike(f"%{_escape_like(value)}%", escape="\\"))
+    return conditions, scores
+
+
+def _date_conditions(column, date_filter: DateFilter) -> list:
+    conditions = []
+    if date_filter.eq is not None:
+        conditions.append(column == date_filter.eq)
+    if date_filter.between is not None:
+        conditions.append(column.between(*date_filter.between))
+    if date_filter.in_ is not None:
+        conditions.append(column == any_(bindparam(None, date_filter.in_, type_=ARRAY(DATE))))
+    return conditions
+
+
+def _search_conditions(filters: ContactFilter, ranked: bool = False) -> Tuple[list, list]:
+    """
+    Compiles search filters into index-friendly SQL predicates.
+
+    `eq` and `in` become equality checks (`= ANY(array)` for lists, so the SQL
+    text does not depend on the list length), `prefix` becomes
+    `lower(column) LIKE 'value%'`, `contains` a case-insensitive substring match
+    and `between` an inclusive range.
+
+    Args:
+        filters (ContactFilter): The per-field filters.
+        ranked (bool): Whether `contains` uses trigram similarity instead of substring matching.
+
+    Returns:
+        Tuple[list, list]: The predicates and, in ranked mode, the matching score expressions.
+    """
+    conditions = []
+    scores = []
+    for field, column in SEARCHABLE_COLUMNS.items():
+        string_filter = getattr(filters, field)
+        if string_filter is not None:
+            field_conditions, field_scores = _string_conditions(column, string_filter, ranked)
+            conditions.extend(field_conditions)
+            scores.extend(field_scores)
+    if filters.birthday is not None:
+        conditions.extend(_date_conditions(ContactsModel.birthday, filters.birthday))
+    return conditions, scores
+
+
+async def search_contacts_repo(
+    db: AsyncSession,
+    filters: ContactFilter,
+    ranked: bool = False,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> List[ContactsModel]:
     """
     Performs a universal search for contacts based on one or more parameters.
 
+    Results are ordered by ID and paged with a keyset cursor. In ranked mode
+    `contains` filters are trigram word-similarity matches instead, and the
+    results are ordered by their total similarity score, best match first;
+    ranked results are a single page of the best matches.
+
     Args:
         db (AsyncSession): The database session.
-        filters (dict[str, str]): A dictionary of key-value pairs for filtering.
+        filters (ContactFilter): The per-field filters.
+        ranked (bool): Whether to order the results by similarity score.
+        limit (int): The maximum number of records to return.
+        cursor (Optional[str]): An opaque token returned with the previous page (unranked only).
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for another listing.
 
     Returns:
         List[ContactsModel]: A list of contacts that match the search criteria.
     """
-    if not filters:
+    conditions, scores = _search_conditions(filters, ranked=ranked)
+    if not conditions:
         return []
 
-    conditions = []
-    for field, value in filters.items():
-        model_field = getattr(ContactsModel, field, None)
-        if model_field is not None:
-            conditions.append(model_field.ilike(f"%{value}%"))
+    stmt = select(ContactsModel).where(LIVE, and_(*conditions))
+    if ranked and scores:
+        score = sum(scores[1:], scores[0])
+        stmt = stmt.order_by(score.desc(), ContactsModel.id)
+    else:
+        stmt = stmt.order_by(ContactsModel.id)
+        if cursor is not None:
+            _, last_id = decode_cursor(cursor, "id", "asc")
+            stmt = stmt.where(ContactsModel.id > last_id)
+    result = await db.execute(stmt.limit(limit))
+    return result.scalars().all()
 
-    if not conditions:
-        return []
 
-    stmt = select(ContactsModel).filter(and_(*conditions))
+async def search_contacts_text(
+    db: AsyncSession,
+    query: str,
+    limit: int = 20,
+) -> List[Tuple[ContactsModel, float, str]]:
+    """
+    Runs a full-text search over the names and notes of the contacts.
+
+    The query uses web search syntax (`"quoted phrase"`, `or`, `-excluded`) and
+    is matched against the GIN-indexed `search_vector` column. Every match is
+    ranked with `ts_rank` on the stored vector, so the page holds the best
+    matches; the costly `ts_headline` snippet is built for the returned page only.
+
+    Args:
+        db (AsyncSession): The database session.
+        query (str): The search text.
+        limit (int): The maximum number of records to return.
+
+    Returns:
+        List[Tuple[ContactsModel, float, str]]: The matching contacts with their rank and snippet, best match first.
+    """
+    config = literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig")
+    # A scalar subquery is evaluated once per statement, not once per candidate row.
+    tsquery = select(func.websearch_to_tsquery(config, query)).scalar_subquery()
+    rank = func.ts_rank(ContactsModel.search_vector, tsquery)
+    top = (
+        select(ContactsModel.id, rank.label("rank"))
+        .where(ContactsModel.search_vector.op("@@")(tsquery), LIVE)
+        .order_by(rank.desc(), ContactsModel.id)
+        .limit(limit)
+        .subquery()
+    )
+    document = func.concat_ws(" ", ContactsModel.first_name, ContactsModel.last_name, ContactsModel.other_info)
+    snippet = func.ts_headline(
+        config,
+        document,
+        tsquery,
+        "MaxFragments=2, MaxWords=20, MinWords=5",
+    )
+    stmt = (
+        select(ContactsModel, top.c.rank, snippet)
+        .join(top, ContactsModel.id == top.c.id)
+        .order_by(top.c.rank.desc(), ContactsModel.id)
+    )
+    result = await db.execute(stmt)
+    return result.all()
+
+
+def _filtered_ids_statement(filters: Optional[ContactFilter] = None, ranked: bool = False):
+    """
+    Returns `SELECT id FROM contacts` restricted by search filters, for counting.
+    """
+    stmt = select(ContactsModel.id).where(LIVE)
+    if filters is not None:
+        conditions, _ = _search_conditions(filters, ranked=ranked)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+    return stmt
+
+
+async def count_contacts(db: AsyncSession, filters: Optional[ContactFilter] = None, ranked: bool = False) -> int:
+    """
+    Counts all contacts, or the ones matching search filters, exactly.
+
+    Args:
+        db (AsyncSession): The database session.
+        filters (Optional[ContactFilter]): Optional search filters, as in `search_contacts_repo`.
+        ranked (bool): Whether the filters are matched by similarity.
+
+    Returns:
+        int: The exact number of matching contacts.
+    """
+    subquery = _filtered_ids_statement(filters, ranked).subquery()
+    return await db.scalar(select(func.count()).select_from(subquery))
+
+
+async def estimate_contacts_count(
+    db: AsyncSession,
+    filters: Optional[ContactFilter] = None,
+    ranked: bool = False,
+) -> int:
+    """
+    Estimates the number of contacts from planner statistics, without scanning rows.
+
+    The estimate is the row count of the top node of the plan for the
+    (filtered) query. `pg_class.reltuples` is not used for the total because
+    it also counts the tombstones of deleted contacts.
+
+    Args:
+        db (AsyncSession): The database session.
+        filters (Optional[ContactFilter]): Optional search filters, as in `search_contacts_repo`.
+        ranked (bool): Whether the filters are matched by similarity.
+
+    Returns:
+        int: The estimated number of matching contacts.
+    """
+    compiled = _filtered_ids_statement(filters, ranked).compile(dialect=db.get_bind().dialect)
+    params = compiled.construct_params()
+    positional = tuple(params[name] for name in compiled.positiontup or ())
+    conn = await db.connection()
+    result = await conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + compiled.string, positional)
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def stream_contacts(
+    db: AsyncSession,
+    filters: Optional[ContactFilter] = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[ContactsModel]:
+    """
+    Streams contacts ordered by ID through a server-side cursor.
+
+    Rows are fetched `batch_size` at a time, so the full result is never held in memory.
+
+    Args:
+        db (AsyncSession): The database session, kept busy until the iteration ends.
+        filters (Optional[ContactFilter]): Optional search filters, as in `search_contacts_repo`.
+        batch_size (int): The number of rows fetched from the cursor per round trip.
+
+    Yields:
+        ContactsModel: The matching contacts.
+    """
+    stmt = select(ContactsModel).where(LIVE).order_by(ContactsModel.id).execution_options(yield_per=batch_size)
+    if filters is not None:
+        conditions, _ = _search_conditions(filters)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+    result = await db.stream_scalars(stmt)
+    async for contact in result:
+        yield contact
+
+
+async def get_contact_changes(
+    db: AsyncSession,
+    since: Optional[Tuple[int, int]] = None,
+    limit: int = 1000,
+) -> List[ContactsModel]:
+    """
+    Retrieves the contacts created, changed or deleted after a sync position.
+
+    Rows are walked in `(change_xid, id)` order over the matching composite
+    index, and only rows written by transactions older than the snapshot's
+    `xmin` are returned. Every such transaction has finished, and any later
+    write gets a newer transaction ID, so no change can ever commit behind a
+    position already handed out. A long-running write transaction (on any
+    table) holds the feed back until it ends; nothing is skipped.
+
+    Args:
+        db (AsyncSession): The database session, on the primary.
+        since (Optional[Tuple[int, int]]): The `(change_xid, id)` of the last
+            change the client has seen, or None for a full sync (tombstones excluded).
+        limit (int): The maximum number of changes to return.
+
+    Returns:
+        List[ContactsModel]: The changed contacts, deleted ones with `deleted_at` set.
+    """
+    # An InitPlan, evaluated once per statement.
+    watermark = select(
+        func.pg_snapshot_xmin(func.pg_current_snapshot()).cast(Text).cast(BigInteger)
+    ).scalar_subquery()
+    stmt = (
+        select(ContactsModel)
+        .where(ContactsModel.change_xid < watermark)
+        .order_by(ContactsModel.change_xid, ContactsModel.id)
+        .limit(limit)
+    )
+    if since is None:
+        stmt = stmt.where(LIVE)
+    else:
+        stmt = stmt.where(tuple_(ContactsModel.change_xid, ContactsModel.id) > tuple_(*since))
+
     result = await db.execute(stmt)
     return result.scalars().all()
 
 
+async def purge_tombstones(db: AsyncSession, older_than: timedelta) -> int:
+    """
+    Permanently removes the contacts deleted more than `older_than` ago.
+
+    Args:
+        db (AsyncSession): The database session.
+        older_than (timedelta): The tombstone retention period.
+
+    Returns:
+        int: The number of removed tombstones.
+    """
+    stmt = (
+        delete(ContactsModel)
+        .where(ContactsModel.deleted_at < func.now() - older_than)
+        .returning(ContactsModel.id)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    purged = len(result.scalars().all())
+    await db.commit()
+    return purged
+
+
+class EmptySelectionError(ValueError):
+    """Raised when a bulk filter contains no searchable field and would select every contact."""
+
+
+def _bulk_predicate(filters: ContactFilter):
+    conditions, _ = _search_conditions(filters)
+    if not conditions:
+        raise EmptySelectionError("The filter does not contain any searchable field.")
+    return and_(LIVE, *conditions)
+
+
+async def count_selected_contacts(
+    db: AsyncSession,
+    contact_ids: Optional[List[int]] = None,
+    filters: Optional[ContactFilter] = None,
+) -> int:
+    """
+    Counts the contacts selected by a list of IDs or by search filters.
+
+    Args:
+        db (AsyncSession): The database session.
+        contact_ids (Optional[List[int]]): The IDs to select.
+        filters (Optional[ContactFilter]): The search filters to select by, if no IDs are given.
+
+    Raises:
+        EmptySelectionError: If the filters contain no searchable field.
+
+    Returns:
+        int: The number of selected contacts.
+    """
+    predicate = _ids_predicate(contact_ids) if contact_ids is not None else _bulk_predicate(filters)
+    return await db.scalar(select(func.count()).select_from(ContactsModel).where(predicate, LIVE))
+
+
+async def _run_in_chunks(
+    db: AsyncSession,
+    build_statement,
+    contact_ids: Optional[List[int]],
+    filters: Optional[ContactFilter],
+    chunk_size: int,
+) -> Tuple[int, int]:
+    """
+    Applies a set-based write to the selected contacts, one transaction per chunk.
+
+    With IDs, the list itself is split into chunks. With filters, each chunk
+    first selects and locks the next `chunk_size` matching IDs in ID order
+    (`id > last_id`), then applies the write to them. The walk advances past
+    every selected ID, even one the write skipped, so rows changed by an
+    earlier chunk are never selected again, and it stops only when nothing is
+    left to select.
+
+    Args:
+        build_statement: Called with a predicate, returns the UPDATE/DELETE statement
+            restricted to it, returning the affected IDs.
+
+    Returns:
+        Tuple[int, int]: The number of affected rows and the number of chunks.
+    """
+    affected = 0
+    chunks = 0
+
+    if contact_ids is not None:
+        batches = (contact_ids[i:i + chunk_size] for i in range(0, len(contact_ids), chunk_size))
+        for batch in batches:
+            result = await db.execute(build_statement(_ids_predicate(batch)))
+            changed = result.scalars().all()
+            await db.commit()
+            contacts_generation.bump()
+            chunks += 1
+            affected += len(changed)
+            for contact_id in changed:
+                await contact_cache.invalidate(contact_id)
+        return affected, chunks
+
+    predicate = _bulk_predicate(filters)
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(ContactsModel.id)
+            .where(predicate, ContactsModel.id > last_id)
+            .order_by(ContactsModel.id)
+            .limit(chunk_size)
+            .with_for_update()
+        )
+        selected = result.scalars().all()
+        if not selected:
+            await db.commit()
+            break
+        result = await db.execute(build_statement(_ids_predicate(selected)))
+        changed = result.scalars().all()
+        await db.commit()
+        contacts_generation.bump()
+        chunks += 1
+        affected += len(changed)
+        last_id = selected[-1]
+        for contact_id in changed:
+            await contact_cache.invalidate(contact_id)
+    return affected, chunks
+
+
+async def bulk_update_contacts(
+    db: AsyncSession,
+    changes: ContactUpdate,
+    contact_ids: Optional[List[int]] = None,
+    filters: Optional[ContactFilter] = None,
+    chunk_size: int = 1000,
+) -> Tuple[int, int]:
+    """
+    Sets the same fields on many contacts with chunked `UPDATE ... RETURNING id` statements.
+
+    Args:
+        db (AsyncSession): The database session.
+        changes (ContactUpdate): The fields to set.
+        contact_ids (Optional[List[int]]): The IDs to update.
+        filters (Optional[ContactFilter]): The search filters to select by, if no IDs are given.
+        chunk_size (int): The maximum number of rows locked per transaction.
+
+    Raises:
+        EmptySelectionError: If the filters contain no searchable field.
+
+    Returns:
+        Tuple[int, int]: The number of updated rows and the number of chunks.
+    """
+    values = changes.model_dump(exclude_unset=True)
+    affected, chunks = await _run_in_chunks(
+        db,
+        lambda predicate: (
+            update(ContactsModel)
+            .where(predicate, LIVE)
+            .values(**values)
+            .returning(ContactsModel.id)
+            .execution_options(synchronize_session=False)
+        ),
+        contact_ids,
+        filters,
+        chunk_size,
+    )
+    contact_events.publish_bulk("bulk_updated", affected)
+    return affected, chunks
+
+
+async def bulk_delete_contacts(
+    db: AsyncSession,
+    contact_ids: Optional[List[int]] = None,
+    filters: Optional[ContactFilter] = None,
+    chunk_size: int = 1000,
+) -> Tuple[int, int]:
+    """
+    Deletes many contacts with chunked `UPDATE ... RETURNING id` statements.
+
+    Like `delete_contact`, the rows are kept as tombstones for delta sync.
+
+    Args:
+        db (AsyncSession): The database session.
+        contact_ids (Optional[List[int]]): The IDs to delete.
+        filters (Optional[ContactFilter]): The search filters to select by, if no IDs are given.
+        chunk_size (int): The maximum number of rows locked per transaction.
+
+    Raises:
+        EmptySelectionError: If the filters contain no searchable field.
+
+    Returns:
+        Tuple[int, int]: The number of deleted rows and the number of chunks.
+    """
+    affected, chunks = await _run_in_chunks(
+        db,
+        lambda predicate: (
+            update(ContactsModel)
+            .where(predicate, LIVE)
+            .values(deleted_at=func.now())
+            .returning(ContactsModel.id)
+            .execution_options(synchronize_session=False)
+        ),
+        contact_ids,
+        filters,
+        chunk_size,
+    )
+    contact_events.publish_bulk("bulk_deleted", affected)
+    return affected, chunks
+
+
+def _birthday_key(day: date) -> int:
+    """
+    Returns the `MMDD` key of a date, matching the `birthday_key` expression.
+    """
+    return day.month * 100 + day.day
+
+
 async def get_contacts_upcoming_birthdays(db: AsyncSession, days: int=7) -> List[ContactsModel]:
     """
-    Retrieves contacts with birthdays in the next 7 days, including today.
+    Retrieves contacts with birthdays in the next `days` days, including today.
 
-    Handles month and year transitions correctly.
+    The window is matched against the indexed `birthday_key` expression, so the query
+    is an index range scan. A window that crosses the year end becomes two ranges.
+    In non-leap years, Feb 29 birthdays are celebrated on Feb 28.
+    Results are ordered by the upcoming birthday date.
 
     Args:
         db (AsyncSession): The database session.
+        days (int): The size of the window in days (0 means today only).
 
     Returns:
         List[ContactsModel]: A list of contacts with upcoming birthdays.
     """
     today = date.today()
     future_date = today + timedelta(days=days)
-
-    if today.month == future_date.month:
-        # Case 1: The entire 7-day period is within a single month.
-        stmt = (
-            select(ContactsModel)
-            .where(
-                and_(
-                    extract("month", ContactsModel.birthday) == today.month,
-                    extract("day", ContactsModel.birthday).between(today.day, future_date.day),
-                )
-            )
-        )
+    start_key = _birthday_key(today)
+    end_key = _birthday_key(future_date)
+
+    if end_key == 228 and not calendar.isleap(future_date.year):
+        end_key = 229
+
+    stmt = select(ContactsModel).where(LIVE)
+    if days >= 365:
+        # The window covers every day of the year.
+        pass
+    elif start_key <= end_key:
+        # Case 1: The whole window is within the current year.
+        stmt = stmt.where(ContactsModel.birthday_key.between(start_key, end_key))
     else:
-        # Case 2: The 7-day period transitions between two months (e.g., Dec to Jan).
-        # We need to build a query that checks for birthdays in the rest of the current month
-        # and for birthdays at the beginning of the next month.
-        stmt = (
-            select(ContactsModel)
-            .where(
-                or_(
-                    # Days from the current date to the end of the current month.
-                    and_(
-                        extract("month", ContactsModel.birthday) == today.month,
-                        extract("day", ContactsModel.birthday) >= today.day,
-                    ),
-                    # Days from the start of the next month to the future_date.
-                    and_(
-                        extract("month", ContactsModel.birthday) == future_date.month,
-                        extract("day", ContactsModel.birthday) <= future_date.day,
-                    ),
-                )
+        # Case 2: The window wraps around the year end (e.g., Dec to Jan).
+        stmt = stmt.where(
+            or_(
+                ContactsModel.birthday_key >= start_key,
+                ContactsModel.birthday_key <= end_key,
             )
         )
 
+    # Birthdays left in the current year come first, then the ones after New Year.
+    stmt = stmt.order_by(ContactsModel.birthday_key < start_key, ContactsModel.birthday_key, ContactsModel.id)
+
     result = await db.execute(stmt)
-    return result.scalars().all()
\ No newline at end of file
+    return result.scalars().all()
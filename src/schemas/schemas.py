@@ -1,6 +1,6 @@
-from datetime import date
-from pydantic import BaseModel, Field, EmailStr, ConfigDict, field_validator
-from typing import Optional
+from datetime import date, datetime
+from pydantic import BaseModel, Field, EmailStr, ConfigDict, field_validator, model_validator
+from typing import Any, List, Optional, Tuple
 
 
 class ContactBase(BaseModel):
@@ -12,10 +12,10 @@ class ContactBase(BaseModel):
     """
     first_name: str = Field(min_length=3, max_length=50, description="The contact's first name.")
     last_name: str = Field(min_length=3, max_length=50, description="The contact's last name.")
-    email: EmailStr = Field(description="The contact's email address, must be unique.")
+    email: EmailStr = Field(max_length=50, description="The contact's email address, must be unique.")
     phone_number: str = Field(pattern=r"^\+?\d{10,15}$", description="The contact's phone number, starting with an optional '+' and followed by 10 to 15 digits. Must be unique.")
     birthday: date = Field(description="The contact's birthday.")
-    other_info: Optional[str] = Field(None, description="Any additional information about the contact.")
+    other_info: Optional[str] = Field(None, max_length=250, description="Any additional information about the contact.")
 
     @field_validator("birthday")
     @classmethod
@@ -59,6 +59,34 @@ class Contact(ContactBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ContactRead(BaseModel):
+    """
+    Schema for returning contact data from the API.
+
+    Rows leaving the database were validated by `ContactCreate`/`ContactUpdate`
+    when they were written, so this schema declares plain types only: no email
+    parsing, no phone pattern and no birthday check run on the way out.
+    """
+    id: int = Field(description="The unique identifier for the contact.")
+    first_name: str = Field(description="The contact's first name.")
+    last_name: str = Field(description="The contact's last name.")
+    email: str = Field(description="The contact's email address.")
+    phone_number: str = Field(description="The contact's phone number.")
+    birthday: date = Field(description="The contact's birthday.")
+    other_info: Optional[str] = Field(None, description="Any additional information about the contact.")
+
+    # Configuration to allow Pydantic to create the model from ORM attributes.
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ContactTextMatch(ContactRead):
+    """
+    Schema for a full-text search hit: the contact with its score and a highlighted snippet.
+    """
+    rank: float = Field(description="The `ts_rank` relevance score; higher is better.")
+    snippet: str = Field(description="The matching part of the names and notes, with matches wrapped in `<b>` tags.")
+
+
 class ContactUpdate(BaseModel):
     """
     Schema for partially updating an existing contact.
@@ -67,7 +95,247 @@ class ContactUpdate(BaseModel):
     """
     first_name: Optional[str] = Field(None, min_length=3, max_length=50, description="The contact's first name.")
     last_name: Optional[str] = Field(None, min_length=3, max_length=50, description="The contact's last name.")
-    email: Optional[EmailStr] = Field(None, description="The contact's email address.")
+    email: Optional[EmailStr] = Field(None, max_length=50, description="The contact's email address.")
     phone_number: Optional[str] = Field(None, pattern=r"^\+?\d{10,15}$", description="The contact's phone number.")
     birthday: Optional[date] = Field(None, description="The contact's birthday.")
-    other_info: Optional[str] = Field(None, description="Any additional information about the contact.")
\ No newline at end of file
+    other_info: Optional[str] = Field(None, max_length=250, description="Any additional information about the contact.")
+
+
+class BulkRowError(BaseModel):
+    """
+    Schema describing why a single row of a bulk import was rejected.
+    """
+    row: int = Field(description="The 1-based number of the data row in the upload.")
+    reason: str = Field(description="Either 'invalid' (failed validation) or 'conflict' (email or phone number already exists).")
+    detail: Any = Field(None, description="Validation errors or a human-readable explanation.")
+
+
+class BulkImportReport(BaseModel):
+    """
+    Schema for the result of a bulk contact import.
+    """
+    received: int = Field(description="The number of data rows read from the upload.")
+    inserted: int = Field(description="The number of contacts created.")
+    failed: int = Field(description="The number of rows rejected by validation or unique constraints.")
+    errors: List[BulkRowError] = Field(default_factory=list, description="Per-row errors, capped at `max_errors`.")
+    errors_truncated: bool = Field(False, description="Whether some row errors were left out of `errors`.")
+
+
+class ContactBatchRequest(BaseModel):
+    """
+    Schema for fetching many contacts by ID in one request.
+    """
+    ids: List[int] = Field(min_length=1, max_length=5000, description="The IDs of the contacts to fetch.")
+
+
+class ContactBatchResponse(BaseModel):
+    """
+    Schema for the result of a batch fetch.
+    """
+    items: List[ContactRead] = Field(description="The contacts found, in request order.")
+    missing: List[int] = Field(description="The requested IDs that do not exist.")
+
+
+class ContactChange(BaseModel):
+    """
+    Schema for one entry of the change feed: a created, updated or deleted contact.
+    """
+    id: int = Field(description="The ID of the changed contact.")
+    updated_at: datetime = Field(description="When the contact was last changed.")
+    deleted: bool = Field(description="Whether the contact was deleted.")
+    contact: Optional[ContactRead] = Field(None, description="The current contact, omitted for deleted ones.")
+
+
+class ContactChangesPage(BaseModel):
+    """
+    Schema for a page of the change feed.
+    """
+    changes: List[ContactChange] = Field(description="The changes in the order they happened.")
+    next_token: Optional[str] = Field(None, description="The `since` value for the next call.")
+    has_more: bool = Field(description="Whether more changes can be fetched right away.")
+
+
+class StringFilter(BaseModel):
+    """
+    Schema for the operators that can be applied to a text field in a search.
+
+    Every given operator must match. A bare string is accepted as a shorthand
+    for `{"contains": value}`.
+    """
+    eq: Optional[str] = Field(None, min_length=1, description="Exact, case-sensitive value.")
+    prefix: Optional[str] = Field(None, min_length=1, description="Case-insensitive prefix.")
+    contains: Optional[str] = Field(None, min_length=1, description="Case-insensitive substring (or similarity match in ranked mode).")
+    in_: Optional[List[str]] = Field(None, alias="in", min_length=1, max_length=1000, description="Any of these exact values.")
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    @model_validator(mode="before")
+    @classmethod
+    def expand_shorthand(cls, data: Any) -> Any:
+        """
+        Turns a bare string into a `contains` filter.
+        """
+        if isinstance(data, str):
+            return {"contains": data}
+        return data
+
+    @model_validator(mode="after")
+    def validate_not_empty(self) -> "StringFilter":
+        """
+        Validator to ensure at least one operator is given.
+
+        Raises:
+            ValueError: If no operator is set.
+        """
+        if self.eq is None and self.prefix is None and self.contains is None and self.in_ is None:
+            raise ValueError("Provide at least one of 'eq', 'prefix', 'contains' or 'in'.")
+        return self
+
+
+class DateFilter(BaseModel):
+    """
+    Schema for the operators that can be applied to a date field in a search.
+
+    Every given operator must match.
+    """
+    eq: Optional[date] = Field(None, description="Exact date.")
+    between: Optional[Tuple[date, date]] = Field(None, description="Inclusive `[from, to]` range.")
+    in_: Optional[List[date]] = Field(None, alias="in", min_length=1, max_length=1000, description="Any of these dates.")
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    @model_validator(mode="after")
+    def validate_operators(self) -> "DateFilter":
+        """
+        Validator to ensure at least one operator is given and the range is ordered.
+
+        Raises:
+            ValueError: If no operator is set, or the range ends before it starts.
+        """
+        if self.eq is None and self.between is None and self.in_ is None:
+            raise ValueError("Provide at least one of 'eq', 'between' or 'in'.")
+        if self.between is not None and self.between[0] > self.between[1]:
+            raise ValueError("'between' must be given as [from, to] with from <= to.")
+        return self
+
+
+class ContactFilter(BaseModel):
+    """
+    Schema for selecting contacts by field values.
+
+    Filters on different fields are combined with AND. Each operator compiles
+    to a predicate served by an index: `eq` and `in` by the B-tree indexes,
+    `prefix` by the `lower(column) text_pattern_ops` indexes, `contains` by the
+    trigram indexes and birthday ranges by the birthday index.
+    """
+    first_name: Optional[StringFilter] = None
+    last_name: Optional[StringFilter] = None
+    email: Optional[StringFilter] = None
+    phone_number: Optional[StringFilter] = None
+    other_info: Optional[StringFilter] = None
+    birthday: Optional[DateFilter] = None
+
+    model_config = ConfigDict(extra="forbid")
+
+    def is_empty(self) -> bool:
+        """
+        Returns whether no field filter is set.
+        """
+        return all(getattr(self, field) is None for field in ContactFilter.model_fields)
+
+
+class ContactSearch(ContactFilter):
+    """
+    Schema for the body of `/contacts/search`.
+    """
+    limit: Optional[int] = Field(None, ge=1, le=1000, description="The maximum number of records to return (50 in ranked mode, 100 otherwise).")
+    cursor: Optional[str] = Field(None, description="The `X-Next-Cursor` value of the previous page.")
+
+    def filters(self) -> ContactFilter:
+        """
+        Returns the field filters without the paging options.
+        """
+        return ContactFilter.model_validate(self.model_dump(include=set(ContactFilter.model_fields), exclude_none=True, by_alias=True))
+
+
+class BulkSelector(BaseModel):
+    """
+    Schema selecting the contacts affected by a bulk operation.
+
+    Exactly one of `ids` or `filter` must be given. `filter` uses the same
+    per-field operators as `/contacts/search`.
+    """
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=100_000, description="The IDs of the contacts to change.")
+    filter: Optional[ContactFilter] = Field(None, description="Search filters selecting the contacts to change.")
+
+    @model_validator(mode="after")
+    def validate_single_selector(self) -> "BulkSelector":
+        """
+        Validator to ensure that exactly one way of selecting contacts is used.
+
+        Raises:
+            ValueError: If both or neither of `ids` and `filter` are given.
+        """
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of 'ids' or 'filter'.")
+        return self
+
+
+class BulkUpdateRequest(BulkSelector):
+    """
+    Schema for updating many contacts with the same changes.
+    """
+    changes: ContactUpdate = Field(description="The fields to set on every selected contact.")
+
+    @field_validator("changes")
+    @classmethod
+    def validate_changes(cls, v: ContactUpdate) -> ContactUpdate:
+        """
+        Validator to ensure the changes are non-empty and do not touch unique fields.
+
+        Raises:
+            ValueError: If no field is set, or email or phone number would be set on many rows.
+        """
+        fields = v.model_dump(exclude_unset=True)
+        if not fields:
+            raise ValueError("At least one field must be changed.")
+        if {"email", "phone_number"} & fields.keys():
+            raise ValueError("Email and phone number are unique and cannot be bulk-updated.")
+        return v
+
+
+class BulkOperationResult(BaseModel):
+    """
+    Schema for the outcome of a bulk update or delete.
+    """
+    matched: Optional[int] = Field(None, description="The number of selected contacts (dry run only).")
+    affected: int = Field(description="The number of contacts changed or deleted.")
+    chunks: int = Field(description="The number of transactions the work was split into.")
+    dry_run: bool = Field(description="Whether the operation only counted the selected contacts.")
+
+
+class SlowQueryRead(BaseModel):
+    """
+    Schema for a statement captured by the slow-query log.
+    """
+    id: int = Field(description="The identifier of the entry, used to explain it.")
+    statement: str = Field(description="The SQL sent to the database, with whitespace collapsed and parameters as placeholders.")
+    parameter_shape: List[str] = Field(description="The types of the bound parameters (with lengths for arrays), without their values.")
+    duration_ms: float = Field(description="The execution time in milliseconds.")
+    caller: Optional[str] = Field(None, description="The repository or service function that issued the statement.")
+    recorded_at: datetime = Field(description="When the statement finished.")
+
+
+class ExplainResult(BaseModel):
+    """
+    Schema for the plan of a re-run slow statement.
+    """
+    query: SlowQueryRead = Field(description="The explained slow-query log entry.")
+    plan: Any = Field(description="The `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)` output, with constants in conditions replaced by `?`.")
+
+
+class TombstonePurgeResult(BaseModel):
+    """
+    Schema for the result of a tombstone purge.
+    """
+    purged: int = Field(description="The number of deleted contacts removed for good.")
@@ -0,0 +1,222 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repository.repository import insert_contacts
+from src.schemas.schemas import BulkImportReport, BulkRowError, ContactCreate
+
+# Upper bound for a single record, so a malformed upload without line breaks
+# cannot make the parser buffer the whole body.
+MAX_RECORD_SIZE = 64 * 1024
+
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl", "application/json"}
+
+
+class UnsupportedFormatError(ValueError):
+    """Raised when the upload content type is neither NDJSON nor CSV."""
+
+
+class RecordTooLargeError(ValueError):
+    """Raised for a record longer than `MAX_RECORD_SIZE`."""
+
+
+def detect_format(content_type: Optional[str]) -> str:
+    """
+    Maps a request content type to an import format.
+
+    Args:
+        content_type (Optional[str]): The value of the Content-Type header.
+
+    Raises:
+        UnsupportedFormatError: If the content type is not supported.
+
+    Returns:
+        str: Either "ndjson" or "csv".
+    """
+    media_type = (content_type or "application/x-ndjson").split(";")[0].strip().lower()
+    if media_type in CSV_CONTENT_TYPES:
+        return "csv"
+    if media_type in NDJSON_CONTENT_TYPES:
+        return "ndjson"
+    raise UnsupportedFormatError(f"Unsupported content type '{media_type}', use NDJSON or CSV.")
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """
+    Splits a stream of UTF-8 byte chunks into lines without buffering the whole body.
+
+    Lines longer than `MAX_RECORD_SIZE` are yielded as a `RecordTooLargeError` instance
+    so that the caller can report them and carry on with the next line.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    oversized = False
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            if oversized:
+                # The tail of an oversized line, which was already reported.
+                oversized = False
+                continue
+            if len(line) > MAX_RECORD_SIZE:
+                yield RecordTooLargeError(f"Record exceeds {MAX_RECORD_SIZE} bytes.")
+                continue
+            yield line.rstrip("\r")
+        if len(buffer) > MAX_RECORD_SIZE:
+            if not oversized:
+                yield RecordTooLargeError(f"Record exceeds {MAX_RECORD_SIZE} bytes.")
+            oversized = True
+            buffer = ""
+    buffer += decoder.decode(b"", final=True)
+    if buffer and not oversized:
+        if len(buffer) > MAX_RECORD_SIZE:
+            yield RecordTooLargeError(f"Record exceeds {MAX_RECORD_SIZE} bytes.")
+        else:
+            yield buffer.rstrip("\r")
+
+
+async def iter_ndjson_records(lines: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """
+    Parses NDJSON lines, yielding a dict per record or the exception that rejected it.
+    """
+    async for line in lines:
+        if isinstance(line, Exception):
+            yield line
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield ValueError(f"Invalid JSON: {e}")
+            continue
+        yield record if isinstance(record, dict) else ValueError("Each line must be a JSON object.")
+
+
+async def iter_csv_records(lines: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """
+    Parses CSV lines with a header row, yielding a dict per record or the exception that rejected it.
+
+    Quoted fields may span several lines: physical lines are joined until the
+    number of quote characters is even, i.e. no field is left open.
+    """
+    header: Optional[List[str]] = None
+    pending = ""
+    async for line in lines:
+        if isinstance(line, Exception):
+            pending = ""
+            yield line
+            continue
+        pending = f"{pending}\n{line}" if pending else line
+        if pending.count('"') % 2:
+            if len(pending) > MAX_RECORD_SIZE:
+                pending = ""
+                yield RecordTooLargeError(f"Record exceeds {MAX_RECORD_SIZE} bytes.")
+            continue
+        record, pending = pending, ""
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield ValueError(f"Expected {len(header)} columns, got {len(values)}.")
+            continue
+        # Empty cells are treated as missing values.
+        yield {name: value if value != "" else None for name, value in zip(header, values)}
+    if pending:
+        yield ValueError("Unterminated quoted field at the end of the upload.")
+
+
+class _Report:
+    """Accumulates import counters and a bounded list of row errors."""
+
+    def __init__(self, max_errors: int):
+        self.max_errors = max_errors
+        self.received = 0
+        self.inserted = 0
+        self.failed = 0
+        self.errors: List[BulkRowError] = []
+        self.errors_truncated = False
+
+    def add_error(self, row: int, reason: str, detail: Any) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(BulkRowError(row=row, reason=reason, detail=detail))
+        else:
+            self.errors_truncated = True
+
+    def build(self) -> BulkImportReport:
+        return BulkImportReport(
+            received=self.received,
+            inserted=self.inserted,
+            failed=self.failed,
+            errors=self.errors,
+            errors_truncated=self.errors_truncated,
+        )
+
+
+async def import_contacts(
+    db: AsyncSession,
+    chunks: AsyncIterator[bytes],
+    content_type: Optional[str],
+    batch_size: int = 1000,
+    max_errors: int = 1000,
+) -> BulkImportReport:
+    """
+    Streams an NDJSON or CSV upload into the contacts table.
+
+    Records are validated against `ContactCreate` and inserted in batches of
+    `batch_size` rows, one multi-row insert and commit per batch. Only the current
+    batch and at most `max_errors` error entries are held in memory.
+
+    Args:
+        db (AsyncSession): The database session.
+        chunks (AsyncIterator[bytes]): The raw request body.
+        content_type (Optional[str]): The Content-Type of the upload.
+        batch_size (int): The number of valid rows per insert statement.
+        max_errors (int): The maximum number of row errors included in the report.
+
+    Raises:
+        UnsupportedFormatError: If the content type is not supported.
+
+    Returns:
+        BulkImportReport: Counters and per-row errors.
+    """
+    parse = iter_csv_records if detect_format(content_type) == "csv" else iter_ndjson_records
+    report = _Report(max_errors)
+    batch: List[Tuple[int, ContactCreate]] = []
+
+    async def flush() -> None:
+        ids = await insert_contacts(db, [contact for _, contact in batch])
+        for (row, _), contact_id in zip(batch, ids):
+            if contact_id is None:
+                report.add_error(row, "conflict", "A contact with this email or phone number already exists.")
+            else:
+                report.inserted += 1
+        batch.clear()
+
+    async for record in parse(iter_lines(chunks)):
+        report.received += 1
+        row = report.received
+        if isinstance(record, Exception):
+            report.add_error(row, "invalid", str(record))
+            continue
+        try:
+            batch.append((row, ContactCreate.model_validate(record)))
+        except ValidationError as e:
+            report.add_error(row, "invalid", e.errors(include_url=False, include_context=False, include_input=False))
+            continue
+        if len(batch) >= batch_size:
+            await flush()
+
+    if batch:
+        await flush()
+    return report.build()
@@ -0,0 +1,275 @@
+import json
+import math
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
+
+from src.conf.config import settings
+from src.database.models import ContactsModel
+
+CACHED_FIELDS = ("id", "first_name", "last_name", "email", "phone_number", "birthday", "other_info")
+
+
+class CacheBackend(Protocol):
+    """
+    Minimal async key-value interface the contact cache is built on.
+
+    It is a subset of the `redis.asyncio.Redis` API, so a Redis client, or any
+    fake with the same methods, can be used through `RedisCacheBackend`.
+    """
+
+    async def get(self, key: str) -> Optional[str]: ...
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]: ...
+
+    async def set(self, key: str, value: str, ttl: int) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """
+    In-process LRU cache with a per-entry time to live.
+
+    Each worker process has its own copy, so an entry changed through another
+    worker can be served stale for at most `ttl` seconds.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Cache backend on top of a Redis-compatible async client.
+
+    The client only needs `get`, `mget`, `set(key, value, ex=ttl)` and `delete`,
+    e.g. `redis.asyncio.Redis(decode_responses=True)` or a local fake in tests.
+    """
+
+    def __init__(self, client: Any, prefix: str = "contacts-api:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.client.get(self.prefix + key)
+        if isinstance(value, bytes):
+            value = value.decode()
+        return value
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        values = await self.client.mget([self.prefix + key for key in keys])
+        return [value.decode() if isinstance(value, bytes) else value for value in values]
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self.client.set(self.prefix + key, value, ex=ttl)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+
+class ContactCache:
+    """
+    Read-through cache of single contacts keyed by ID.
+
+    Contacts are stored as JSON and handed back as transient `ContactsModel`
+    instances, which are not attached to any session.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], ttl: int = 60):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(contact_id: int) -> str:
+        return f"contact:{contact_id}"
+
+    async def get(self, contact_id: int) -> Optional[ContactsModel]:
+        """
+        Returns the cached contact, or None on a miss (or when caching is disabled).
+        """
+        if self.backend is None:
+            return None
+        value = await self.backend.get(self._key(contact_id))
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._load(value)
+
+    async def get_many(self, contact_ids: Iterable[int]) -> Dict[int, ContactsModel]:
+        """
+        Returns the cached contacts among `contact_ids`, keyed by ID, in one backend round trip.
+        """
+        contact_ids = list(contact_ids)
+        if self.backend is None or not contact_ids:
+            return {}
+        values = await self.backend.get_many([self._key(contact_id) for contact_id in contact_ids])
+        found = {
+            contact_id: self._load(value)
+            for contact_id, value in zip(contact_ids, values)
+            if value is not None
+        }
+        self.hits += len(found)
+        self.misses += len(contact_ids) - len(found)
+        return found
+
+    @staticmethod
+    def _load(value: str) -> ContactsModel:
+        data = json.loads(value)
+        data["birthday"] = date.fromisoformat(data["birthday"])
+        return ContactsModel(**data)
+
+    async def set(self, contact: ContactsModel) -> None:
+        """
+        Stores a contact in the cache.
+        """
+        if self.backend is None:
+            return
+        data = {field: getattr(contact, field) for field in CACHED_FIELDS}
+        data["birthday"] = data["birthday"].isoformat()
+        await self.backend.set(self._key(contact.id), json.dumps(data), self.ttl)
+
+    async def invalidate(self, contact_id: int) -> None:
+        """
+        Drops a contact from the cache; must be called after every write to it.
+        """
+        if self.backend is None:
+            return
+        await self.backend.delete(self._key(contact_id))
+
+    def evict_local(self, contact_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Drops contacts changed through another worker from this process's cache.
+
+        Only the in-memory backend holds per-process copies; a shared backend
+        was already invalidated by the worker that made the change.
+
+        Args:
+            contact_ids (Optional[Iterable[int]]): The changed contacts, or None to drop all of them.
+        """
+        if not isinstance(self.backend, InMemoryCacheBackend):
+            return
+        if contact_ids is None:
+            self.backend.clear()
+            return
+        for contact_id in contact_ids:
+            self.backend.discard(self._key(contact_id))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the hit/miss counters of the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class Generation:
+    """
+    A counter bumped by every write to a table.
+
+    Cached values derived from the table remember the generation they were
+    computed at and are discarded once it has moved on. The counter is per
+    process; writes through other workers bump it when their change event
+    arrives (see `src/services/events.py`), and are otherwise only picked up
+    by TTL expiry.
+    """
+
+    def __init__(self):
+        self.value = 0
+        self.bumped_at: Optional[float] = None
+
+    def bump(self) -> None:
+        self.value += 1
+        self.bumped_at = time.monotonic()
+
+    def age(self) -> float:
+        """
+        Returns the seconds since the last bump (infinite if there was none).
+        """
+        return math.inf if self.bumped_at is None else time.monotonic() - self.bumped_at
+
+
+def build_cache_backend(kind: str, max_size: int, redis_url: Optional[str] = None) -> Optional[CacheBackend]:
+    """
+    Creates the cache backend selected in the configuration.
+
+    Args:
+        kind (str): "memory", "redis" or "none".
+        max_size (int): The maximum number of entries of the in-memory backend.
+        redis_url (Optional[str]): The Redis URL for the "redis" backend.
+
+    Raises:
+        ValueError: If the backend kind is unknown or Redis is not configured.
+        RuntimeError: If the "redis" backend is selected but the `redis` package is not installed.
+
+    Returns:
+        Optional[CacheBackend]: The backend, or None when caching is disabled.
+    """
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return InMemoryCacheBackend(max_size=max_size)
+    if kind == "redis":
+        if not redis_url:
+            raise ValueError("CONTACT_CACHE_REDIS_URL must be set for the redis cache backend.")
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("The redis cache backend requires the 'redis' package.") from e
+        return RedisCacheBackend(redis.from_url(redis_url, decode_responses=True))
+    raise ValueError(f"Unknown cache backend '{kind}'.")
+
+
+contact_cache = ContactCache(
+    build_cache_backend(
+        settings.CONTACT_CACHE_BACKEND,
+        max_size=settings.CONTACT_CACHE_SIZE,
+        redis_url=settings.CONTACT_CACHE_REDIS_URL,
+    ),
+    ttl=settings.CONTACT_CACHE_TTL,
+)
+
+# Bumped by every write to the contacts table.
+contacts_generation = Generation()
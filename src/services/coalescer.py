@@ -0,0 +1,86 @@
+import asyncio
+import logging
+from typing import List, Optional, Set, Tuple
+
+from src.conf.config import settings
+from src.database.db import sessionmanager
+from src.database.models import ContactsModel
+from src.repository.repository import DuplicateContactError, create_contacts
+from src.schemas.schemas import ContactCreate
+
+logger = logging.getLogger(__name__)
+
+
+class CreateCoalescer:
+    """
+    Group commit for single-contact creates.
+
+    Concurrent callers of `create()` are queued and written together with one
+    multi-row `INSERT ... ON CONFLICT DO NOTHING RETURNING` in one transaction,
+    so a burst of creates pays for one commit (and one WAL flush) per batch
+    instead of one per contact. A batch is written `max_delay_ms` after its
+    first contact arrived, or as soon as `max_batch` contacts are waiting.
+    Each caller still gets its own row, or its own `DuplicateContactError`.
+    """
+
+    def __init__(self, max_batch: int = 100, max_delay_ms: float = 5.0):
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self._pending: List[Tuple[ContactCreate, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def create(self, contact: ContactCreate) -> ContactsModel:
+        """
+        Queues a contact for the next batch and waits until the batch is committed.
+
+        Args:
+            contact (ContactCreate): The contact to create.
+
+        Raises:
+            DuplicateContactError: If the email or phone number is already taken.
+
+        Returns:
+            ContactsModel: The created contact.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((contact, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._write(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, batch: List[Tuple[ContactCreate, asyncio.Future]]) -> None:
+        try:
+            async with sessionmanager.session() as session:
+                rows = await create_contacts(session, [contact for contact, _ in batch])
+        except Exception as e:
+            logger.exception("Writing a batch of %d contacts failed", len(batch))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), row in zip(batch, rows):
+            # A caller that went away (cancelled future) is simply skipped.
+            if future.done():
+                continue
+            if row is None:
+                future.set_exception(DuplicateContactError("A contact with this email or phone number already exists."))
+            else:
+                future.set_result(row)
+
+
+create_coalescer = CreateCoalescer(settings.CONTACT_CREATE_BATCH_SIZE, settings.CONTACT_CREATE_MAX_DELAY_MS)
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.conf.config import settings
+from src.database.db import sessionmanager
+from src.repository.repository import count_contacts, estimate_contacts_count
+from src.schemas.schemas import ContactFilter
+from src.services.cache import contacts_generation
+
+logger = logging.getLogger(__name__)
+
+
+class CountCache:
+    """
+    Cache of exact contact counts per filter, refreshed in the background.
+
+    An entry older than `ttl`, or computed before the latest write to the
+    contacts table (`contacts_generation` has moved on), is still served while
+    a background task recounts it (stale-while-revalidate). Only the first
+    request for a filter pays for `COUNT(*)`; after a write, totals may lag
+    behind by one background recount.
+    """
+
+    def __init__(self, ttl: int = 30, max_entries: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # key -> (count, computed_at, generation)
+        self._entries: "OrderedDict[str, Tuple[int, float, int]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def _key(filters: Optional[ContactFilter], ranked: bool) -> str:
+        normalized = filters.model_dump(mode="json", exclude_none=True, by_alias=True) if filters is not None else {}
+        return json.dumps([normalized, ranked], sort_keys=True)
+
+    def _store(self, key: str, count: int, generation: int) -> None:
+        self._entries[key] = (count, time.monotonic(), generation)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _refresh(self, key: str, filters: Optional[ContactFilter], ranked: bool) -> None:
+        generation = contacts_generation.value
+        try:
+            async with sessionmanager.session() as session:
+                count = await count_contacts(session, filters, ranked)
+            self._store(key, count, generation)
+        except Exception:
+            logger.exception("Background count refresh failed")
+        finally:
+            self._refreshing.discard(key)
+
+    async def get(self, db: AsyncSession, filters: Optional[ContactFilter] = None, ranked: bool = False) -> int:
+        """
+        Returns the cached exact count, counting synchronously only on a cold miss.
+        """
+        key = self._key(filters, ranked)
+        entry = self._entries.get(key)
+        if entry is None:
+            generation = contacts_generation.value
+            count = await count_contacts(db, filters, ranked)
+            self._store(key, count, generation)
+            return count
+
+        count, computed_at, generation = entry
+        stale = generation != contacts_generation.value or time.monotonic() - computed_at > self.ttl
+        if stale and key not in self._refreshing:
+            self._refreshing.add(key)
+            task = asyncio.create_task(self._refresh(key, filters, ranked))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return count
+
+
+count_cache = CountCache(ttl=settings.COUNT_CACHE_TTL, max_entries=settings.COUNT_CACHE_SIZE)
+
+
+async def total_count(
+    db: AsyncSession,
+    mode: str,
+    filters: Optional[ContactFilter] = None,
+    ranked: bool = False,
+) -> int:
+    """
+    Returns the number of contacts matching `filters` using the requested mode.
+
+    Args:
+        db (AsyncSession): The database session.
+        mode (str): "exact" (`COUNT(*)`), "estimate" (planner statistics) or
+            "cached" (exact count from `count_cache`).
+        filters (Optional[ContactFilter]): Optional search filters.
+        ranked (bool): Whether the filters are matched by similarity.
+
+    Returns:
+        int: The total number of matching contacts.
+    """
+    if mode == "estimate":
+        return await estimate_contacts_count(db, filters, ranked)
+    if mode == "cached":
+        return await count_cache.get(db, filters, ranked)
+    return await count_contacts(db, filters, ranked)
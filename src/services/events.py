@@ -0,0 +1,430 @@
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Protocol, Set
+
+from src.conf.config import settings
+from src.database.models import ContactsModel
+from src.services.cache import CACHED_FIELDS, contact_cache, contacts_generation
+
+logger = logging.getLogger(__name__)
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+MAX_NOTIFY_PAYLOAD = 7900
+
+
+class EventBackend(Protocol):
+    """
+    Transport carrying published messages to the broadcaster of every worker.
+
+    `start()` receives the callback that hands an incoming message to the local
+    subscribers; a message published by this worker comes back through it too.
+    """
+
+    async def start(self, deliver: Callable[[str], None]) -> None: ...
+
+    async def publish(self, message: str) -> None: ...
+
+    async def stop(self) -> None: ...
+
+
+class InMemoryEventBackend:
+    """
+    Delivers messages straight to the subscribers of the current process.
+
+    Only clients connected to the worker that made a change see it; meant for
+    tests and single-process deployments.
+    """
+
+    def __init__(self):
+        self._deliver: Optional[Callable[[str], None]] = None
+
+    async def start(self, deliver: Callable[[str], None]) -> None:
+        self._deliver = deliver
+
+    async def publish(self, message: str) -> None:
+        if self._deliver is not None:
+            self._deliver(message)
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+
+class PostgresEventBackend:
+    """
+    Fans messages out to all workers through Postgres `LISTEN/NOTIFY`.
+
+    The backend owns one dedicated connection outside the engine pool: it
+    listens on `channel` and sends the notifications. Only the broadcaster's
+    publisher task sends, so statements never overlap on the connection. If
+    the connection is lost, it is reopened after `retry_after` seconds; events
+    published in the meantime are dropped, which clients recover from through
+    `/contacts/changes`.
+    """
+
+    def __init__(self, connect: Callable[[], Any], channel: str = "contact_events", retry_after: float = 5.0):
+        self.connect = connect
+        self.channel = channel
+        self.retry_after = retry_after
+        self._conn = None
+        self._deliver: Optional[Callable[[str], None]] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    async def start(self, deliver: Callable[[str], None]) -> None:
+        self._deliver = deliver
+        self._stopped = False
+        try:
+            await self._listen()
+        except Exception:
+            logger.exception("Could not listen for contact events, retrying in %.0f s", self.retry_after)
+            self._schedule_reconnect()
+
+    async def _listen(self) -> None:
+        conn = await self.connect()
+        await conn.add_listener(self.channel, self._on_notification)
+        conn.add_termination_listener(self._on_termination)
+        self._conn = conn
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        if self._deliver is not None:
+            self._deliver(payload)
+
+    def _on_termination(self, connection) -> None:
+        self._conn = None
+        if not self._stopped:
+            logger.warning("Contact event connection lost, reconnecting in %.0f s", self.retry_after)
+            self._schedule_reconnect()
+
+    def _schedule_reconnect(self) -> None:
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        while not self._stopped and self._conn is None:
+            await asyncio.sleep(self.retry_after)
+            try:
+                await self._listen()
+            except Exception:
+                logger.warning("Reconnecting the contact event listener failed", exc_info=True)
+
+    async def publish(self, message: str) -> None:
+        if self._conn is None:
+            return
+        await self._conn.execute("SELECT pg_notify($1, $2)", self.channel, message)
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
+
+class Subscription:
+    """
+    The bounded queue of Server-Sent Events frames waiting to be sent to one client.
+
+    A client that falls `max_queue` frames behind is not buffered any further:
+    the subscription is marked as overflowed and the client must resync.
+    """
+
+    def __init__(self, max_queue: int):
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def offer(self, frame: str) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class TooManySubscribersError(RuntimeError):
+    """Raised when a new subscriber would exceed the broadcaster's subscriber limit."""
+
+
+class ContactEventBroadcaster:
+    """
+    Publishes contact changes to the subscribers of every worker.
+
+    Writers never wait for the transport: `publish_*()` only puts events on a
+    bounded outbox, and a background task sends whatever has accumulated as
+    one message (a JSON array of events) per NOTIFY, within `publish_timeout`.
+    When the outbox is full or the transport fails, events are dropped and
+    counted; clients recover them through `/contacts/changes`.
+
+    Delivery never blocks on subscribers either: each one has its own bounded
+    queue, and one that is too slow to drain it is cut off instead of growing memory.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[EventBackend],
+        max_queue: int = 256,
+        max_subscribers: int = 1000,
+        outbox_size: int = 10_000,
+        publish_timeout: float = 5.0,
+    ):
+        self.backend = backend
+        self.max_queue = max_queue
+        self.max_subscribers = max_subscribers
+        self.publish_timeout = publish_timeout
+        self._outbox: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=outbox_size)
+        self._publisher: Optional[asyncio.Task] = None
+        self._subscribers: Set[Subscription] = set()
+        self.published = 0
+        self.dropped_events = 0
+        self.dropped_subscribers = 0
+
+    async def start(self) -> None:
+        if self.backend is not None:
+            await self.backend.start(self._deliver)
+            self._publisher = asyncio.create_task(self._run_publisher())
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        if self._publisher is not None:
+            try:
+                await asyncio.wait_for(self.drain(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Dropping %d unsent contact events on shutdown", self._outbox.qsize())
+            self._publisher.cancel()
+            self._publisher = None
+        if self.backend is not None:
+            await self.backend.stop()
+
+    async def drain(self) -> None:
+        """
+        Waits until every event queued so far has been handed to the backend.
+        """
+        await self._outbox.join()
+
+    def _deliver(self, message: str) -> None:
+        try:
+            events = json.loads(message)
+            types = [event["type"] for event in events]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring a malformed contact event message: %r", message)
+            return
+
+        # A change made through another worker invalidates this worker's
+        # caches as well: generation-checked results, and the cached contacts
+        # themselves (all of them after a bulk operation, which names no IDs).
+        contacts_generation.bump()
+        if any("id" not in event for event in events):
+            contact_cache.evict_local()
+        else:
+            contact_cache.evict_local(event["id"] for event in events)
+
+        if not self._subscribers:
+            return
+        frames = [
+            f"event: {event_type}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+            for event_type, event in zip(types, events)
+        ]
+        # Frames are built once and shared by all subscribers.
+        for subscription in list(self._subscribers):
+            for frame in frames:
+                subscription.offer(frame)
+            if subscription.overflowed:
+                # Unregistered right away, even if its stream never runs again.
+                self._subscribers.discard(subscription)
+                self.dropped_subscribers += 1
+
+    def _enqueue(self, event: Dict[str, Any]) -> None:
+        if self._publisher is None:
+            return
+        try:
+            self._outbox.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+
+    async def _run_publisher(self) -> None:
+        while True:
+            batch = [await self._outbox.get()]
+            while not self._outbox.empty():
+                batch.append(self._outbox.get_nowait())
+            try:
+                for message, count in _pack(batch):
+                    try:
+                        await asyncio.wait_for(self.backend.publish(message), timeout=self.publish_timeout)
+                        self.published += count
+                    except Exception:
+                        self.dropped_events += count
+                        logger.exception("Publishing %d contact events failed", count)
+            finally:
+                for _ in batch:
+                    self._outbox.task_done()
+
+    def publish_changes(self, event_type: str, contacts: Iterable[ContactsModel]) -> None:
+        """
+        Queues created, updated or deleted contacts for publishing; never waits.
+
+        Args:
+            event_type (str): "created", "updated" or "deleted".
+            contacts (Iterable[ContactsModel]): The contacts as written; deleted ones are sent without data.
+        """
+        for contact in contacts:
+            event: Dict[str, Any] = {"type": event_type, "id": contact.id, "updated_at": contact.updated_at}
+            if event_type != "deleted":
+                event["contact"] = {field: getattr(contact, field) for field in CACHED_FIELDS}
+            self._enqueue(event)
+
+    def publish_change(self, event_type: str, contact: ContactsModel) -> None:
+        """
+        Queues one created, updated or deleted contact for publishing, see `publish_changes`.
+        """
+        self.publish_changes(event_type, [contact])
+
+    def publish_bulk(self, event_type: str, affected: int) -> None:
+        """
+        Queues a bulk import, update or delete as one event without per-contact data.
+
+        Args:
+            event_type (str): "bulk_created", "bulk_updated" or "bulk_deleted".
+            affected (int): The number of contacts changed.
+        """
+        if affected:
+            self._enqueue({"type": event_type, "affected": affected})
+
+    def subscribe(self) -> Subscription:
+        """
+        Registers a new subscriber; `stream()` unregisters it when the client goes away.
+
+        Raises:
+            TooManySubscribersError: If `max_subscribers` are already connected.
+        """
+        if self.is_full:
+            raise TooManySubscribersError("Too many contact event subscribers.")
+        subscription = Subscription(self.max_queue)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Unregisters a subscriber; unknown or already removed ones are ignored.
+        """
+        self._subscribers.discard(subscription)
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._subscribers) >= self.max_subscribers
+
+    async def stream(self, subscription: Subscription, keepalive: float = 15.0) -> AsyncIterator[str]:
+        """
+        Yields the Server-Sent Events frames of a subscription until the client disconnects.
+
+        A comment line is sent after `keepalive` idle seconds so that proxies keep
+        the connection open. Once the subscription overflows, a final `overflow`
+        event is sent and the stream ends.
+
+        Args:
+            subscription (Subscription): A subscription returned by `subscribe()`.
+            keepalive (float): The idle time in seconds before a keep-alive comment.
+
+        Yields:
+            str: SSE frames.
+        """
+        try:
+            yield ": connected\n\n"
+            while True:
+                if subscription.overflowed:
+                    yield "event: overflow\ndata: {}\n\n"
+                    return
+                try:
+                    yield await asyncio.wait_for(subscription.queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the subscriber and delivery counters of the broadcaster.
+        """
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "queued": self._outbox.qsize(),
+            "dropped_events": self.dropped_events,
+            "dropped_subscribers": self.dropped_subscribers,
+        }
+
+
+def _pack(events: List[Dict[str, Any]]) -> List[tuple]:
+    """
+    Packs events into as few JSON array messages as fit the NOTIFY payload limit.
+
+    Returns:
+        List[tuple]: `(message, number of events)` pairs.
+    """
+    messages = []
+    parts: List[str] = []
+    size = 2
+    for event in events:
+        part = json.dumps(event, default=_json_default, separators=(",", ":"))
+        if len(part.encode()) + 2 > MAX_NOTIFY_PAYLOAD:
+            # Too large for NOTIFY; subscribers fetch the contact themselves.
+            event = {key: value for key, value in event.items() if key != "contact"}
+            part = json.dumps(event, default=_json_default, separators=(",", ":"))
+        part_size = len(part.encode()) + 1
+        if parts and size + part_size > MAX_NOTIFY_PAYLOAD:
+            messages.append(("[" + ",".join(parts) + "]", len(parts)))
+            parts, size = [], 2
+        parts.append(part)
+        size += part_size
+    if parts:
+        messages.append(("[" + ",".join(parts) + "]", len(parts)))
+    return messages
+
+
+def _json_default(value: Any) -> str:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def build_event_backend(kind: str) -> Optional[EventBackend]:
+    """
+    Creates the event backend selected in the configuration.
+
+    Args:
+        kind (str): "postgres", "memory" or "none".
+
+    Raises:
+        ValueError: If the backend kind is unknown.
+
+    Returns:
+        Optional[EventBackend]: The backend, or None when events are disabled.
+    """
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return InMemoryEventBackend()
+    if kind == "postgres":
+        import asyncpg
+
+        return PostgresEventBackend(
+            lambda: asyncpg.connect(
+                user=settings.DB_USER,
+                password=settings.DB_PASS,
+                database=settings.DB_NAME,
+                host=settings.DB_HOST,
+                port=settings.DB_PORT,
+            ),
+            channel=settings.CONTACT_EVENTS_CHANNEL,
+        )
+    raise ValueError(f"Unknown event backend '{kind}'.")
+
+
+contact_events = ContactEventBroadcaster(
+    build_event_backend(settings.CONTACT_EVENTS_BACKEND),
+    max_queue=settings.CONTACT_EVENTS_QUEUE_SIZE,
+    max_subscribers=settings.CONTACT_EVENTS_MAX_SUBSCRIBERS,
+    outbox_size=settings.CONTACT_EVENTS_OUTBOX_SIZE,
+    publish_timeout=settings.CONTACT_EVENTS_PUBLISH_TIMEOUT,
+)
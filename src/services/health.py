@@ -0,0 +1,56 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.conf.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessCheck:
+    """
+    Database reachability check whose result is shared by all probes.
+
+    The database is queried at most once per `interval`, so frequent probes
+    from many orchestrator nodes cost one `SELECT 1` per interval instead of
+    one pooled session each. While a check
+    is running, other probes get the previous result instead of waiting.
+    """
+
+    def __init__(self, interval: float = 5.0, timeout: float = 2.0):
+        self.interval = interval
+        self.timeout = timeout
+        self._lock = asyncio.Lock()
+        self._checked_at: Optional[float] = None
+        self._result: Dict[str, Any] = {"ok": False, "error": "not checked yet"}
+
+    async def _check(self, engine: AsyncEngine) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with engine.connect() as conn:
+                    await conn.exec_driver_sql("SELECT 1")
+        except Exception as e:
+            logger.warning("Readiness check failed: %r", e)
+            return {"ok": False, "error": type(e).__name__}
+        return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+    async def database_status(self, engine: AsyncEngine) -> Dict[str, Any]:
+        """
+        Returns the latest database check result, refreshing it when it is older than `interval`.
+        """
+        fresh = self._checked_at is not None and time.monotonic() - self._checked_at < self.interval
+        if fresh or (self._lock.locked() and self._checked_at is not None):
+            return {**self._result, "age_s": round(time.monotonic() - self._checked_at, 3)}
+
+        async with self._lock:
+            if self._checked_at is None or time.monotonic() - self._checked_at >= self.interval:
+                self._result = await self._check(engine)
+                self._checked_at = time.monotonic()
+        return {**self._result, "age_s": round(time.monotonic() - self._checked_at, 3)}
+
+
+readiness_check = ReadinessCheck(settings.READINESS_CHECK_INTERVAL, settings.READINESS_CHECK_TIMEOUT)
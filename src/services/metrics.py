@@ -0,0 +1,289 @@
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.services.cache import contact_cache
+
+# Bucket upper bounds in seconds, from sub-millisecond queries to slow requests.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Counter:
+    """A monotonically increasing counter, optionally split by labels or read from a callback."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Tuple[str, ...] = (),
+        callback: Optional[Callable[[], float]] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.callback = callback
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        if self.callback is not None:
+            yield f"{self.name} {self.callback()}"
+            return
+        for label_values, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {value}"
+
+
+class Gauge:
+    """A value that can go up and down, or is read from a callback at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Tuple[str, ...] = (),
+        callback: Optional[Callable[[], float]] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.callback = callback
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def dec(self, *label_values: str, amount: float = 1.0) -> None:
+        self.inc(*label_values, amount=-amount)
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} gauge"
+        if self.callback is not None:
+            yield f"{self.name} {self.callback()}"
+            return
+        for label_values, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {value}"
+
+
+class Histogram:
+    """
+    A cumulative histogram with fixed buckets, optionally split by labels.
+
+    Observing a value is a binary search plus two additions, so it is cheap
+    enough to run on every request and every query.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = buckets
+        # Per label set: [per-bucket counts (last one is +Inf), sum].
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for label_values, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _format_labels(self.labels, label_values, 'le="' + le + '"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labels, label_values)} {total[0]}"
+            yield f"{self.name}_count{_format_labels(self.labels, label_values)} {cumulative}"
+
+
+class Registry:
+    """A collection of metrics rendered together in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: list = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests_total = registry.register(
+    Counter("http_requests_total", "HTTP requests handled, by route and status code.", ("method", "route", "status"))
+)
+http_request_duration_seconds = registry.register(
+    Histogram("http_request_duration_seconds", "HTTP request latency, by route.", ("method", "route"))
+)
+http_requests_in_flight = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests currently being handled.")
+)
+db_query_duration_seconds = registry.register(
+    Histogram("db_query_duration_seconds", "SQL statement execution time, by statement kind.", ("statement",))
+)
+db_pool_checkout_wait_seconds = registry.register(
+    Histogram("db_pool_checkout_wait_seconds", "Time spent waiting for a pool connection.")
+)
+registry.register(
+    Counter("contact_cache_hits_total", "Single-contact cache hits.", callback=lambda: contact_cache.hits)
+)
+registry.register(
+    Counter("contact_cache_misses_total", "Single-contact cache misses.", callback=lambda: contact_cache.misses)
+)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request latency, status codes and in-flight requests.
+
+    Requests are labelled by their route template (e.g. `/api/v1/contacts/{contact_id}`)
+    rather than the raw path, which keeps the number of series bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec()
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            http_request_duration_seconds.observe(elapsed, method, route_path)
+            http_requests_total.inc(method, route_path, str(status_code))
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    The default async pool, timing how long each checkout waits for a connection.
+
+    The measured time includes opening a new connection when the pool has to.
+    Besides the histogram, `recent_wait` keeps an exponentially weighted moving
+    average of the last checkouts, for readiness reporting.
+    """
+
+    # Weight of the newest checkout in `recent_wait`.
+    WAIT_SMOOTHING = 0.2
+    recent_wait: float = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            db_pool_checkout_wait_seconds.observe(waited)
+            self.recent_wait += self.WAIT_SMOOTHING * (waited - self.recent_wait)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    # Label by the leading keyword only (SELECT, INSERT, ...) to keep cardinality low.
+    kind = statement.lstrip().split(None, 1)[0].upper() if statement else "UNKNOWN"
+    db_query_duration_seconds.observe(time.perf_counter() - started, kind)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches `after_cursor_execute`; drop its start time.
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+# The pool of the engine instrumented last; an engine may be recreated (and the
+# gauges below must not be registered twice) when the app restarts in-process.
+_instrumented_pool = None
+
+registry.register(
+    Gauge(
+        "db_pool_checked_out",
+        "Pool connections currently checked out.",
+        callback=lambda: _instrumented_pool.checkedout() if _instrumented_pool is not None else 0,
+    )
+)
+registry.register(
+    Gauge(
+        "db_pool_overflow",
+        "Pool connections opened beyond pool_size.",
+        callback=lambda: max(_instrumented_pool.overflow(), 0) if _instrumented_pool is not None else 0,
+    )
+)
+
+
+def instrument_engine(engine: AsyncEngine, track_pool: bool = True) -> None:
+    """
+    Attaches query timing hooks and pool gauges to an engine.
+
+    The engine should be created with `InstrumentedAsyncQueuePool` as its pool
+    class to also record checkout wait times. Only the primary engine should
+    set `track_pool`; replica engines share the query timing hooks only.
+    """
+    global _instrumented_pool
+    sync_engine = engine.sync_engine
+    if track_pool:
+        _instrumented_pool = sync_engine.pool
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
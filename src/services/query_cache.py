@@ -0,0 +1,185 @@
+import json
+import time
+from collections import OrderedDict
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.conf.config import settings
+from src.database.db import is_cacheable_read
+from src.repository.repository import get_contacts_upcoming_birthdays, search_contacts_repo
+from src.schemas.schemas import ContactFilter, ContactRead
+from src.services.cache import contacts_generation
+
+
+class QueryResultCache:
+    """
+    Cache of whole query results, keyed by the normalized query.
+
+    Every entry remembers the `contacts_generation` it was computed at and is
+    discarded once any write has bumped it, so results are never served after
+    a write through this process (writes through other workers bump it too when
+    their change event arrives). Entries also expire after their own time to
+    live. Memory is bounded by both the number of entries and the total number
+    of cached rows; the least recently used entries are evicted first.
+    """
+
+    def __init__(self, ttl: int = 30, max_entries: int = 500, max_rows: int = 50_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        # key -> (rows, expires_at, generation)
+        self._entries: "OrderedDict[str, Tuple[List[ContactRead], float, int]]" = OrderedDict()
+        self._rows = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        return json.dumps(parts, sort_keys=True, default=str)
+
+    def get(self, key: str) -> Optional[List[ContactRead]]:
+        """
+        Returns the cached rows, or None if the entry is missing, expired or from an older generation.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        rows, expires_at, generation = entry
+        if generation != contacts_generation.value or expires_at <= time.monotonic():
+            self._discard(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return rows
+
+    def store(self, key: str, rows: List[ContactRead], generation: int, ttl: Optional[float] = None) -> None:
+        """
+        Stores the rows computed at `generation`, unless a write has happened since.
+
+        Args:
+            key (str): The normalized query, see `key()`.
+            rows (List[ContactRead]): The query result.
+            generation (int): The `contacts_generation` read before the query ran.
+            ttl (Optional[float]): The lifetime in seconds; the cache's `ttl` by default.
+        """
+        if generation != contacts_generation.value or len(rows) > self.max_rows:
+            return
+        self._discard(key)
+        self._entries[key] = (rows, time.monotonic() + (self.ttl if ttl is None else ttl), generation)
+        self._rows += len(rows)
+        while len(self._entries) > self.max_entries or self._rows > self.max_rows:
+            _, (evicted, _, _) = self._entries.popitem(last=False)
+            self._rows -= len(evicted)
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._rows -= len(entry[0])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._rows = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the size and hit/miss counters of the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "rows": self._rows,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+query_cache = QueryResultCache(
+    ttl=settings.QUERY_CACHE_TTL,
+    max_entries=settings.QUERY_CACHE_SIZE,
+    max_rows=settings.QUERY_CACHE_MAX_ROWS,
+)
+
+
+def _cacheable(db: AsyncSession) -> bool:
+    """
+    Tells whether a result read through `db` may be cached, see `is_cacheable_read`.
+    """
+    return settings.QUERY_CACHE_ENABLED and is_cacheable_read(db)
+
+
+def _to_rows(contacts) -> List[ContactRead]:
+    return [ContactRead.model_validate(contact) for contact in contacts]
+
+
+async def cached_search_contacts(
+    db: AsyncSession,
+    filters: ContactFilter,
+    ranked: bool = False,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> List[ContactRead]:
+    """
+    Returns the result of `search_contacts_repo`, from `query_cache` when possible.
+
+    Args:
+        db (AsyncSession): The database session.
+        filters (ContactFilter): The per-field filters.
+        ranked (bool): Whether to order the results by similarity score.
+        limit (int): The maximum number of records to return.
+        cursor (Optional[str]): An opaque token returned with the previous page (unranked only).
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for another listing.
+
+    Returns:
+        List[ContactRead]: The matching contacts.
+    """
+    key = query_cache.key(
+        "search", filters.model_dump(mode="json", exclude_none=True, by_alias=True), ranked, limit, cursor
+    )
+    rows = query_cache.get(key)
+    if rows is not None:
+        return rows
+
+    generation = contacts_generation.value
+    rows = _to_rows(await search_contacts_repo(db, filters, ranked=ranked, limit=limit, cursor=cursor))
+    if _cacheable(db):
+        query_cache.store(key, rows, generation)
+    return rows
+
+
+def _seconds_until_midnight() -> float:
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), dt_time.min)
+    return (midnight - now).total_seconds()
+
+
+async def cached_upcoming_birthdays(db: AsyncSession, days: int = 7) -> List[ContactRead]:
+    """
+    Returns the result of `get_contacts_upcoming_birthdays`, from `query_cache` when possible.
+
+    The window moves with the date, so entries are keyed by today's date and
+    never outlive local midnight.
+
+    Args:
+        db (AsyncSession): The database session.
+        days (int): The size of the window in days (0 means today only).
+
+    Returns:
+        List[ContactRead]: The contacts with upcoming birthdays.
+    """
+    key = query_cache.key("upcoming_birthdays", date.today().isoformat(), days)
+    rows = query_cache.get(key)
+    if rows is not None:
+        return rows
+
+    generation = contacts_generation.value
+    rows = _to_rows(await get_contacts_upcoming_birthdays(db, days=days))
+    if _cacheable(db):
+        query_cache.store(key, rows, generation, ttl=min(settings.QUERY_CACHE_BIRTHDAYS_TTL, _seconds_until_midnight()))
+    return rows
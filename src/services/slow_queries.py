@@ -0,0 +1,181 @@
+import itertools
+import re
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.conf.config import settings
+
+_WHITESPACE = re.compile(r"\s+")
+# Quoted and numeric constants in the conditions of an EXPLAIN plan.
+_PLAN_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+class SlowQuery:
+    """
+    A statement that ran longer than the slow-query threshold.
+
+    `parameters` keeps the bound values so the statement can be explained
+    later; they never leave the process through `as_dict()`.
+    """
+
+    def __init__(
+        self,
+        entry_id: int,
+        statement: str,
+        parameters: Any,
+        duration_ms: float,
+        caller: Optional[str],
+        executemany: bool,
+    ):
+        self.id = entry_id
+        self.statement = statement
+        self.parameters = parameters
+        self.duration_ms = duration_ms
+        self.caller = caller
+        self.executemany = executemany
+        self.recorded_at = datetime.now(timezone.utc)
+
+    def parameter_shape(self) -> List[str]:
+        """
+        Describes the bound parameters by type (and length, for arrays) without their values.
+        """
+        if self.executemany:
+            rows = list(self.parameters or [])
+            return [f"executemany x{len(rows)}"] + (_shape(rows[0]) if rows else [])
+        return _shape(self.parameters)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "statement": self.statement,
+            "parameter_shape": self.parameter_shape(),
+            "duration_ms": round(self.duration_ms, 3),
+            "caller": self.caller,
+            "recorded_at": self.recorded_at,
+        }
+
+
+def _shape(parameters: Any) -> List[str]:
+    if parameters is None:
+        return []
+    values = parameters.values() if isinstance(parameters, dict) else parameters
+    shape = []
+    for value in values:
+        if isinstance(value, (list, tuple)):
+            shape.append(f"{type(value).__name__}[{len(value)}]")
+        else:
+            shape.append(type(value).__name__)
+    return shape
+
+
+def redact_plan(plan: Any) -> Any:
+    """
+    Replaces the constants in the conditions of an `EXPLAIN (FORMAT JSON)` plan with `?`.
+
+    Postgres prints bound parameter values into `Index Cond`, `Filter` and the
+    other `... Cond`/`... Filter` entries; everything else is returned as is.
+    """
+    if isinstance(plan, list):
+        return [redact_plan(item) for item in plan]
+    if isinstance(plan, dict):
+        return {
+            key: _PLAN_LITERAL.sub("?", value)
+            if isinstance(value, str) and key.endswith(("Cond", "Filter"))
+            else redact_plan(value)
+            for key, value in plan.items()
+        }
+    return plan
+
+
+def _caller() -> Optional[str]:
+    """
+    Returns the repository function that issued the current statement.
+
+    Cursor events run in the greenlet SQLAlchemy spawns for the sync engine
+    API, whose stack starts inside SQLAlchemy. The awaiting coroutine chain,
+    repository function included, is the stack of the parent greenlet.
+    """
+    current = greenlet.getcurrent()
+    frame = current.parent.gr_frame if current.parent is not None else None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("src.repository") or module.startswith("src.services"):
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class SlowQueryLog:
+    """
+    Bounded, in-process ring buffer of the statements slower than a threshold.
+
+    Timing hooks are cheap: the caller is only looked up for statements that
+    cross the threshold. The oldest entries are dropped once `size` is reached.
+    """
+
+    def __init__(self, threshold_ms: Optional[float] = 200.0, size: int = 100):
+        self.threshold_ms = threshold_ms
+        self._entries: Deque[SlowQuery] = deque(maxlen=size)
+        self._ids = itertools.count(1)
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms is not None
+
+    def record(self, statement: str, parameters: Any, duration_ms: float, executemany: bool = False) -> None:
+        entry = SlowQuery(
+            next(self._ids),
+            _WHITESPACE.sub(" ", statement).strip(),
+            parameters,
+            duration_ms,
+            _caller(),
+            executemany,
+        )
+        self._entries.append(entry)
+
+    def entries(self) -> List[SlowQuery]:
+        """
+        Returns the recorded statements, slowest first.
+        """
+        return sorted(self._entries, key=lambda entry: entry.duration_ms, reverse=True)
+
+    def get(self, entry_id: int) -> Optional[SlowQuery]:
+        return next((entry for entry in self._entries if entry.id == entry_id), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def install(self, engine: AsyncEngine) -> None:
+        """
+        Attaches the timing hooks to an engine.
+        """
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["slow_query_start_time"].pop()
+        if not self.enabled:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        # Explaining a captured statement must not capture the EXPLAIN itself.
+        if duration_ms >= self.threshold_ms and not statement.lstrip().upper().startswith("EXPLAIN"):
+            self.record(statement, parameters, duration_ms, executemany)
+
+    def _handle_error(self, exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("slow_query_start_time"):
+            conn.info["slow_query_start_time"].pop()
+
+
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_THRESHOLD_MS, settings.SLOW_QUERY_LOG_SIZE)
@@ -0,0 +1,60 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.database.db import DatabaseSessionManager
+from src.repository.repository import _get_live_contact, _get_live_contacts, get_contacts, get_contacts_upcoming_birthdays
+
+logger = logging.getLogger(__name__)
+
+# Hot repository queries whose SQL does not depend on the request, run with
+# arguments that match (almost) no rows. Executing them once on a connection
+# leaves their prepared statements in that connection's statement cache. Lookups
+# by ID call the uncached helpers, so priming never goes through `contact_cache`.
+HOT_QUERIES: List[Tuple[str, Callable[[AsyncSession], Awaitable[Any]]]] = [
+    ("list", lambda session: get_contacts(session, limit=1)),
+    ("get", lambda session: _get_live_contact(session, 0)),
+    ("batch", lambda session: _get_live_contacts(session, [0])),
+    ("upcoming_birthdays", lambda session: get_contacts_upcoming_birthdays(session, days=7)),
+]
+
+
+async def _prime(conn: AsyncConnection) -> None:
+    # The session only borrows the connection; closing it rolls back what it ran.
+    async with AsyncSession(bind=conn) as session:
+        for _, query in HOT_QUERIES:
+            await query(session)
+
+
+async def warm_up_pool(manager: DatabaseSessionManager, connections: int, prime: bool) -> Dict[str, Any]:
+    """
+    Opens pool connections ahead of traffic and optionally primes their prepared statements.
+
+    All connections are checked out at once, so the pool has to open each of
+    them; when they are returned they stay in the pool, and the first requests
+    skip TCP, TLS and authentication setup.
+
+    Args:
+        manager (DatabaseSessionManager): The initialized session manager.
+        connections (int): The number of connections to open, capped at the pool size.
+        prime (bool): Whether to run `HOT_QUERIES` on every opened connection.
+
+    Returns:
+        Dict[str, Any]: The number of connections opened, whether they were primed, and the time taken.
+    """
+    count = min(connections, manager.engine.pool.size())
+    started = time.perf_counter()
+    if count > 0:
+        async with manager.connections(count) as opened:
+            if prime:
+                await asyncio.gather(*(_prime(conn) for conn in opened))
+    report = {
+        "connections": count,
+        "primed": prime and count > 0,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    logger.info("Database pool warm-up: %s", report)
+    return report
@@ -0,0 +1,217 @@
+"""
+Fast synthetic data seeding for the contacts table.
+
+Generates realistic contacts that satisfy the `ContactBase` constraints and
+loads them with COPY, several chunks in parallel. Every row is copied with an
+explicit ID equal to its row number, so the output, IDs included, depends only
+on the seed, the row count and the reference date, never on which worker
+finishes first.
+
+Usage:
+    python -m src.tools.seed --count 1000000 --seed 42 --workers 4
+"""
+import argparse
+import asyncio
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+import asyncpg
+
+from src.conf.config import settings
+
+COLUMNS = ("id", "first_name", "last_name", "email", "phone_number", "birthday", "other_info")
+
+FIRST_NAMES = (
+    "Olena", "Taras", "Maria", "Andrii", "Iryna", "Petro", "Sofiia", "Mykola", "Oksana", "Dmytro",
+    "Anna", "Serhii", "Yulia", "Oleksandr", "Kateryna", "Ivan", "Natalia", "Bohdan", "Viktoriia", "Roman",
+    "Emma", "Liam", "Olivia", "Noah", "Sophia", "James", "Isabella", "Lucas", "Mia", "Henry",
+)
+LAST_NAMES = (
+    "Shevchenko", "Kovalenko", "Bondarenko", "Tkachenko", "Kravchenko", "Melnyk", "Oliinyk", "Shevchuk",
+    "Polishchuk", "Lysenko", "Moroz", "Marchenko", "Savchenko", "Rudenko", "Petrenko", "Boiko",
+    "Smith", "Johnson", "Williams", "Brown", "Garcia", "Miller", "Davis", "Wilson", "Taylor", "Clark",
+)
+DOMAINS = ("example.com", "example.org", "example.net", "mail.test")
+NOTES = (
+    "Met at the {event} in {city}.",
+    "Prefers contact by {channel}.",
+    "Interested in {topic}; follow up next quarter.",
+    "Referred by a colleague from {city}.",
+    "Account manager for {topic} deals, reachable by {channel}.",
+)
+EVENTS = ("conference", "trade fair", "meetup", "webinar", "workshop")
+CITIES = ("Kyiv", "Lviv", "Odesa", "Kharkiv", "Dnipro", "Warsaw", "Berlin", "London")
+CHANNELS = ("email", "phone", "messenger", "video call")
+TOPICS = ("cloud hosting", "analytics", "logistics", "insurance", "training", "hardware")
+
+Record = Tuple[int, str, str, str, str, date, Optional[str]]
+
+
+def generate_chunk(seed: int, chunk_index: int, start: int, count: int, reference_date: date) -> List[Record]:
+    """
+    Generates `count` contacts with global row numbers starting at `start`.
+
+    The row number is the contact's ID. Emails and phone numbers embed it, so
+    they are unique across chunks and runs with different offsets. Ages follow a normal distribution
+    around 40 years, clipped to 18..95, so no birthday is in the future.
+
+    Args:
+        seed (int): The run seed.
+        chunk_index (int): The chunk number, mixed into the seed of this chunk.
+        start (int): The row number of the first contact.
+        count (int): The number of contacts to generate.
+        reference_date (date): The date ages are computed from.
+
+    Returns:
+        List[Record]: Rows in the order of `COLUMNS`.
+    """
+    rng = random.Random(seed * 1_000_003 + chunk_index)
+    records: List[Record] = []
+    for number in range(start, start + count):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        email = f"{first_name}.{last_name}.{number}@{rng.choice(DOMAINS)}".lower()
+        phone_number = f"+1{number:010d}"
+        age_days = int(min(95.0, max(18.0, rng.gauss(40.0, 15.0))) * 365.25)
+        birthday = reference_date - timedelta(days=age_days + rng.randrange(365))
+        other_info = None
+        if rng.random() < 0.7:
+            other_info = rng.choice(NOTES).format(
+                event=rng.choice(EVENTS),
+                city=rng.choice(CITIES),
+                channel=rng.choice(CHANNELS),
+                topic=rng.choice(TOPICS),
+            )
+        records.append((number, first_name, last_name, email, phone_number, birthday, other_info))
+    return records
+
+
+async def connect() -> asyncpg.Connection:
+    """
+    Opens a plain asyncpg connection to the database from the settings.
+    """
+    return await asyncpg.connect(
+        user=settings.DB_USER,
+        password=settings.DB_PASS,
+        database=settings.DB_NAME,
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+    )
+
+
+async def seed_contacts(
+    count: int,
+    seed: int = 42,
+    workers: int = 4,
+    chunk_size: int = 50_000,
+    truncate: bool = False,
+    reference_date: date = date(2025, 1, 1),
+) -> float:
+    """
+    Generates and loads `count` contacts.
+
+    Chunks are generated in worker processes and copied into the table over
+    `workers` concurrent connections, so generation and loading overlap.
+    IDs are copied explicitly and continue after the current maximum; the ID
+    sequence is moved past them afterwards. Nothing else should insert
+    contacts while seeding runs.
+
+    Args:
+        count (int): The number of contacts to create.
+        seed (int): The seed making the data reproducible.
+        workers (int): The number of generator processes and COPY connections.
+        chunk_size (int): The number of rows per COPY.
+        truncate (bool): Whether to empty the table (and reset IDs) first.
+        reference_date (date): The date ages are computed from.
+
+    Returns:
+        float: The achieved rate in rows per second.
+    """
+    conn = await connect()
+    try:
+        if truncate:
+            await conn.execute("TRUNCATE contacts RESTART IDENTITY")
+        # Continue numbering after existing rows so emails and phones stay unique.
+        offset = await conn.fetchval("SELECT coalesce(max(id), 0) FROM contacts")
+    finally:
+        await conn.close()
+
+    chunks = [
+        (index, offset + 1 + start, min(chunk_size, count - start))
+        for index, start in enumerate(range(0, count, chunk_size))
+    ]
+    queue: asyncio.Queue = asyncio.Queue()
+    for chunk in chunks:
+        queue.put_nowait(chunk)
+
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    loaded = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        async def worker() -> None:
+            nonlocal loaded
+            conn = await connect()
+            try:
+                while not queue.empty():
+                    index, start, size = queue.get_nowait()
+                    records = await loop.run_in_executor(
+                        executor, generate_chunk, seed, index, start, size, reference_date
+                    )
+                    await conn.copy_records_to_table("contacts", records=records, columns=COLUMNS)
+                    loaded += size
+                    elapsed = time.perf_counter() - started
+                    print(f"  {loaded}/{count} rows ({loaded / elapsed:,.0f} rows/s)")
+            finally:
+                await conn.close()
+
+        await asyncio.gather(*(worker() for _ in range(min(workers, len(chunks)) or 1)))
+
+    elapsed = time.perf_counter() - started
+    conn = await connect()
+    try:
+        await conn.execute(
+            "SELECT setval(pg_get_serial_sequence('contacts', 'id'), coalesce(max(id), 0) + 1, false) FROM contacts"
+        )
+        await conn.execute("ANALYZE contacts")
+    finally:
+        await conn.close()
+
+    rate = count / elapsed if elapsed else 0.0
+    print(f"Seeded {count} contacts in {elapsed:.1f}s ({rate:,.0f} rows/s)")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the contacts table with synthetic data.")
+    parser.add_argument("-n", "--count", type=int, required=True, help="Number of contacts to create.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for reproducible data.")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel generator processes and connections.")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Rows per COPY.")
+    parser.add_argument("--truncate", action="store_true", help="Empty the table and reset IDs first.")
+    parser.add_argument(
+        "--reference-date",
+        type=date.fromisoformat,
+        default=date(2025, 1, 1),
+        help="Date ages are computed from (YYYY-MM-DD); keep it fixed for reproducible data.",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        seed_contacts(
+            args.count,
+            seed=args.seed,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            truncate=args.truncate,
+            reference_date=args.reference_date,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+import pytest
+
+from tests.fakes import FakeClock, FakeRedis
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_redis(clock: FakeClock) -> FakeRedis:
+    return FakeRedis(clock)
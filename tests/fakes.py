@@ -0,0 +1,140 @@
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from src.database.models import ContactsModel
+
+
+class FakeClock:
+    """
+    A `time` module stand-in whose `monotonic()` only moves when told to.
+    """
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeRedis:
+    """
+    Dict-backed stand-in for the subset of `redis.asyncio.Redis` used by `RedisCacheBackend`.
+
+    Keys expire like `SET ... EX`, measured on `clock`. Values are returned as
+    bytes unless `decode_responses` is set, as with a real client.
+    """
+
+    def __init__(self, clock: FakeClock, decode_responses: bool = True):
+        self.clock = clock
+        self.decode_responses = decode_responses
+        self.data: Dict[str, Tuple[str, Optional[float]]] = {}
+        self.calls: List[str] = []
+
+    def _read(self, key: str) -> Optional[Any]:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self.clock.monotonic():
+            del self.data[key]
+            return None
+        return value if self.decode_responses else value.encode()
+
+    async def get(self, key: str) -> Optional[Any]:
+        self.calls.append("get")
+        return self._read(key)
+
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        self.calls.append("mget")
+        return [self._read(key) for key in keys]
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
+        self.calls.append("set")
+        self.data[key] = (value, None if ex is None else self.clock.monotonic() + ex)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        self.calls.append("delete")
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+class FakeResult:
+    def __init__(self, rows: List[Any]):
+        self.rows = rows
+
+    def scalar_one_or_none(self) -> Optional[Any]:
+        return self.rows[0] if self.rows else None
+
+    def scalars(self) -> "FakeResult":
+        return self
+
+    def all(self) -> List[Any]:
+        return list(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeSession:
+    """
+    Stand-in for `AsyncSession` that answers every statement with the same rows.
+
+    `row` is a shortcut for a single-row result; `rows` takes precedence when set.
+    `results` scripts the answers to the first statements, one list of rows each.
+    """
+
+    def __init__(
+        self,
+        row: Optional[ContactsModel] = None,
+        rows: Optional[List[Any]] = None,
+        results: Optional[List[List[Any]]] = None,
+    ):
+        self.row = row
+        self.rows = rows
+        self.results = list(results or [])
+        self.bind = None
+        self.statements: List[Any] = []
+        self.commits = 0
+
+    async def execute(self, stmt: Any, *args: Any, **kwargs: Any) -> FakeResult:
+        self.statements.append(stmt)
+        if self.results:
+            return FakeResult(self.results.pop(0))
+        if self.rows is not None:
+            return FakeResult(self.rows)
+        return FakeResult([] if self.row is None else [self.row])
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def compile_sql(stmt: Any) -> str:
+    """
+    Renders a statement as Postgres SQL with its parameters inlined.
+
+    Uses the asyncpg dialect of the application, with backslashes left as
+    they are under `standard_conforming_strings` (the server default).
+    """
+    dialect = PGDialect_asyncpg()
+    dialect._backslash_escapes = False
+    return str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+def make_contact(contact_id: int = 1, **overrides: Any) -> ContactsModel:
+    data = {
+        "id": contact_id,
+        "first_name": "Olena",
+        "last_name": "Shevchenko",
+        "email": f"contact{contact_id}@example.com",
+        "phone_number": f"+38050{contact_id:07d}",
+        "birthday": date(1990, 5, 17),
+        "other_info": None,
+        "updated_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+    }
+    data.update(overrides)
+    return ContactsModel(**data)
@@ -0,0 +1,87 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.v1.endpoints import admin
+from src.conf.config import settings
+from src.database.db import get_async_session
+from src.services.slow_queries import SlowQueryLog, redact_plan
+
+from tests.fakes import FakeSession
+
+TOKEN = "s3cret"
+
+
+@pytest.fixture
+def slow_log(monkeypatch):
+    log = SlowQueryLog(threshold_ms=0)
+    monkeypatch.setattr(admin, "slow_query_log", log)
+    return log
+
+
+@pytest.fixture
+def client(monkeypatch, slow_log):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", TOKEN)
+    app = FastAPI()
+    app.include_router(admin.router)
+    app.dependency_overrides[get_async_session] = lambda: FakeSession()
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}])
+def test_requests_without_the_token_are_rejected(client, headers):
+    assert client.get("/admin/slow-queries", headers=headers).status_code == 401
+    assert client.post("/admin/tombstones/purge", headers=headers).status_code == 401
+
+
+def test_admin_api_is_closed_without_a_configured_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", None)
+
+    assert client.get("/admin/slow-queries", headers={"X-Admin-Token": ""}).status_code == 401
+
+
+def test_listing_shows_the_parameter_shape_only(client, slow_log):
+    slow_log.record("SELECT * FROM contacts WHERE email = $1", ("olena@example.com",), 250.0)
+
+    response = client.get("/admin/slow-queries", headers={"X-Admin-Token": TOKEN})
+
+    assert response.status_code == 200
+    assert response.json()[0]["parameter_shape"] == ["str"]
+    assert "olena@example.com" not in response.text
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "UPDATE contacts SET deleted_at = now() WHERE id = $1",
+        "WITH gone AS (DELETE FROM contacts WHERE id = $1 RETURNING id) SELECT id FROM gone",
+    ],
+)
+def test_writes_are_not_explained(client, slow_log, statement):
+    slow_log.record(statement, (1,), 250.0)
+
+    response = client.post("/admin/slow-queries/1/explain", headers={"X-Admin-Token": TOKEN})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Only SELECT statements can be explained."
+
+
+def test_plan_conditions_are_redacted():
+    plan = [
+        {
+            "Plan": {
+                "Node Type": "Index Scan",
+                "Index Name": "ix_contacts_email",
+                "Index Cond": "((email)::text = 'olena@example.com'::text)",
+                "Actual Rows": 1,
+                "Plans": [{"Filter": "((id > 40) AND (other_info = 'it''s me'))", "Rows Removed by Filter": 3}],
+            }
+        }
+    ]
+
+    redacted = redact_plan(plan)[0]["Plan"]
+
+    assert redacted["Index Cond"] == "((email)::text = ?::text)"
+    assert redacted["Plans"][0]["Filter"] == "((id > ?) AND (other_info = ?))"
+    assert redacted["Index Name"] == "ix_contacts_email"
+    assert redacted["Actual Rows"] == 1 and redacted["Plans"][0]["Rows Removed by Filter"] == 3
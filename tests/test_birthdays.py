@@ -0,0 +1,76 @@
+from datetime import date
+
+import pytest
+
+from src.database.models import BIRTHDAY_KEY_SQL
+from src.repository import repository
+
+from tests.fakes import FakeSession, compile_sql
+
+pytestmark = pytest.mark.anyio
+
+KEY = f"({BIRTHDAY_KEY_SQL})"
+
+
+def fixed_today(monkeypatch, today: date) -> None:
+    class FixedDate(date):
+        @classmethod
+        def today(cls):
+            return cls(today.year, today.month, today.day)
+
+    monkeypatch.setattr(repository, "date", FixedDate)
+
+
+async def upcoming_sql(monkeypatch, today: date, days: int) -> str:
+    fixed_today(monkeypatch, today)
+    session = FakeSession(rows=[])
+    await repository.get_contacts_upcoming_birthdays(session, days=days)
+    return compile_sql(session.statements[0])
+
+
+@pytest.mark.parametrize(
+    "day, key", [(date(2026, 1, 1), 101), (date(2026, 2, 28), 228), (date(2028, 2, 29), 229), (date(2026, 12, 31), 1231)]
+)
+def test_birthday_key_is_month_and_day(day, key):
+    assert repository._birthday_key(day) == key
+
+
+async def test_window_within_the_year_is_one_range(monkeypatch):
+    sql = await upcoming_sql(monkeypatch, date(2026, 3, 10), 7)
+
+    assert f"{KEY} BETWEEN 310 AND 317" in sql
+    assert " OR " not in sql
+
+
+async def test_today_only(monkeypatch):
+    sql = await upcoming_sql(monkeypatch, date(2026, 7, 4), 0)
+
+    assert f"{KEY} BETWEEN 704 AND 704" in sql
+
+
+async def test_window_across_new_year_is_two_ranges(monkeypatch):
+    sql = await upcoming_sql(monkeypatch, date(2026, 12, 28), 7)
+
+    assert f"{KEY} >= 1228 OR {KEY} <= 104" in sql
+    # December birthdays come before the January ones.
+    assert f"ORDER BY {KEY} < 1228, {KEY}, contacts.id" in sql
+
+
+async def test_feb_29_birthdays_are_celebrated_on_feb_28_in_common_years(monkeypatch):
+    sql = await upcoming_sql(monkeypatch, date(2027, 2, 21), 7)
+
+    assert f"{KEY} BETWEEN 221 AND 229" in sql
+
+
+async def test_feb_29_is_not_added_early_in_leap_years(monkeypatch):
+    # Feb 29, 2028 is a day of its own, one past the window.
+    sql = await upcoming_sql(monkeypatch, date(2028, 2, 21), 7)
+
+    assert f"{KEY} BETWEEN 221 AND 228" in sql
+
+
+async def test_window_of_a_year_or_more_covers_every_day(monkeypatch):
+    sql = await upcoming_sql(monkeypatch, date(2026, 6, 1), 365)
+
+    assert "BETWEEN" not in sql and " OR " not in sql
+    assert "WHERE contacts.deleted_at IS NULL ORDER BY" in sql
@@ -0,0 +1,172 @@
+import json
+
+import pytest
+
+from src.repository.repository import _match_inserted
+from src.schemas.schemas import ContactCreate
+from src.services import bulk_import
+from src.services.bulk_import import (
+    MAX_RECORD_SIZE,
+    RecordTooLargeError,
+    UnsupportedFormatError,
+    detect_format,
+    import_contacts,
+    iter_csv_records,
+    iter_lines,
+    iter_ndjson_records,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+def summary(items):
+    return [type(item).__name__ if isinstance(item, Exception) else item for item in items]
+
+
+def record(n: int, **overrides):
+    data = {
+        "first_name": "Olena",
+        "last_name": "Shevchenko",
+        "email": f"olena{n}@example.com",
+        "phone_number": f"+38050{n:07d}",
+        "birthday": "1990-05-17",
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.mark.parametrize(
+    "content_type, expected",
+    [
+        (None, "ndjson"),
+        ("application/x-ndjson", "ndjson"),
+        ("application/json; charset=utf-8", "ndjson"),
+        ("text/csv", "csv"),
+        ("Text/CSV; charset=utf-8", "csv"),
+    ],
+)
+def test_detect_format(content_type, expected):
+    assert detect_format(content_type) == expected
+
+
+def test_detect_format_rejects_other_types():
+    with pytest.raises(UnsupportedFormatError):
+        detect_format("application/xml")
+
+
+async def test_lines_are_split_across_chunks():
+    lines = await collect(iter_lines(stream(b"\xef\xbb\xbfone\r\ntw", b"o\nthree")))
+
+    assert lines == ["one", "two", "three"]
+
+
+async def test_multibyte_characters_split_across_chunks():
+    encoded = "Ковальчук\n".encode()
+
+    assert await collect(iter_lines(stream(encoded[:3], encoded[3:]))) == ["Ковальчук"]
+
+
+async def test_oversized_lines_are_reported_and_skipped():
+    long_line = b"x" * (MAX_RECORD_SIZE + 1)
+    chunks = (
+        # Completes inside one chunk.
+        b"a\n" + long_line + b"\nb\n",
+        # Spans chunks.
+        long_line[:100],
+        long_line[100:] + b"\nc\n",
+        # The last line, without a line break.
+        long_line,
+    )
+
+    lines = await collect(iter_lines(stream(*chunks)))
+
+    assert summary(lines) == ["a", "RecordTooLargeError", "b", "RecordTooLargeError", "c", "RecordTooLargeError"]
+
+
+async def test_ndjson_records():
+    lines = [json.dumps(record(1)), "", "   ", "{not json", "[1, 2]", RecordTooLargeError("too large")]
+
+    records = await collect(iter_ndjson_records(stream(*lines)))
+
+    assert summary(records) == [record(1), "ValueError", "ValueError", "RecordTooLargeError"]
+
+
+async def test_csv_records():
+    lines = [
+        "first_name, last_name ,email,phone_number,birthday,other_info",
+        'Olena,Shevchenko,olena1@example.com,+380500000001,1990-05-17,"Line one',
+        'line two, with a comma"',
+        "Taras,Bondar,taras@example.com,+380500000002,1991-01-01,",
+        "too,few,columns",
+        "",
+    ]
+
+    records = await collect(iter_csv_records(stream(*lines)))
+
+    assert records[0]["other_info"] == "Line one\nline two, with a comma"
+    assert records[0]["last_name"] == "Shevchenko"
+    # Empty cells are missing values.
+    assert records[1]["other_info"] is None
+    assert summary(records[2:]) == ["ValueError"]
+
+
+async def test_csv_unterminated_quote_is_reported():
+    lines = ["first_name,other_info", 'Olena,"never closed']
+
+    assert summary(await collect(iter_csv_records(stream(*lines)))) == ["ValueError"]
+
+
+def test_match_inserted_pairs_rows_in_input_order():
+    contacts = [ContactCreate(**record(n)) for n in (1, 2, 3)]
+    inserted = {"olena3@example.com": (13, "+380500000003"), "olena1@example.com": (11, "+380500000001")}
+
+    assert _match_inserted(contacts, inserted) == [11, None, 13]
+
+
+def test_match_inserted_reports_duplicates_in_the_batch_as_conflicts():
+    contacts = [
+        ContactCreate(**record(1)),
+        # Same email as the first row, so the insert skipped it.
+        ContactCreate(**record(2, email="olena1@example.com")),
+        # Same email as an existing contact, with another phone number.
+        ContactCreate(**record(3, email="taken@example.com")),
+    ]
+    inserted = {"olena1@example.com": (11, "+380500000001")}
+
+    assert _match_inserted(contacts, inserted) == [11, None, None]
+
+
+async def test_import_validates_batches_and_reports_errors(monkeypatch):
+    batches = []
+
+    async def insert_contacts(db, contacts):
+        batches.append([contact.email for contact in contacts])
+        # The second contact of every batch conflicts.
+        return [None if i == 1 else 100 + i for i in range(len(contacts))]
+
+    monkeypatch.setattr(bulk_import, "insert_contacts", insert_contacts)
+    lines = [
+        json.dumps(record(1)),
+        json.dumps(record(2)),
+        json.dumps(record(3, email="not an email")),
+        json.dumps(record(4, other_info="x" * 251)),
+        "{broken",
+        json.dumps(record(5)),
+    ]
+    body = ("\n".join(lines) + "\n").encode()
+
+    report = await import_contacts(None, stream(body), "application/x-ndjson", batch_size=2, max_errors=3)
+
+    assert batches == [["olena1@example.com", "olena2@example.com"], ["olena5@example.com"]]
+    assert (report.received, report.inserted, report.failed) == (6, 2, 4)
+    assert [(error.row, error.reason) for error in report.errors] == [(2, "conflict"), (3, "invalid"), (4, "invalid")]
+    assert report.errors_truncated
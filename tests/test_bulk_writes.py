@@ -0,0 +1,63 @@
+import pytest
+
+from src.repository import repository
+from src.schemas.schemas import ContactFilter, ContactUpdate, StringFilter
+
+from tests.fakes import FakeSession, compile_sql
+
+pytestmark = pytest.mark.anyio
+
+FILTERS = ContactFilter(last_name=StringFilter(eq="Shevchenko"))
+
+
+async def test_filtered_walk_continues_past_chunks_the_write_skipped():
+    session = FakeSession(
+        results=[
+            [1, 2], [1],  # 2 changed concurrently and no longer matches the update.
+            [3, 4], [],  # Nothing updated, but the walk goes on.
+            [5], [5],
+            [],
+        ]
+    )
+
+    affected, chunks = await repository.bulk_update_contacts(
+        session, ContactUpdate(other_info="Moved"), filters=FILTERS, chunk_size=2
+    )
+
+    assert (affected, chunks) == (2, 3)
+    assert session.commits == 4
+    selects = [compile_sql(stmt) for stmt in session.statements[::2]]
+    for sql, last_id in zip(selects, (0, 2, 4, 5), strict=True):
+        assert f"contacts.id > {last_id}" in sql
+        assert "LIMIT 2 FOR UPDATE" in sql
+
+
+async def test_filtered_write_applies_to_the_selected_ids():
+    session = FakeSession(results=[[7, 9], [7, 9], []])
+
+    await repository.bulk_delete_contacts(session, filters=FILTERS, chunk_size=10)
+
+    delete = compile_sql(session.statements[1])
+    assert "UPDATE contacts SET" in delete
+    assert "contacts.id = ANY (ARRAY[7, 9])" in delete
+
+
+async def test_empty_selection_runs_no_write():
+    session = FakeSession(results=[[]])
+
+    assert await repository.bulk_delete_contacts(session, filters=FILTERS) == (0, 0)
+    assert len(session.statements) == 1
+
+
+async def test_id_list_is_split_into_chunks():
+    session = FakeSession(results=[[1, 2], [3], [5]])
+
+    affected, chunks = await repository.bulk_delete_contacts(session, contact_ids=[1, 2, 3, 4, 5], chunk_size=2)
+
+    assert (affected, chunks) == (4, 3)
+    assert session.commits == 3
+
+
+async def test_filter_without_searchable_fields_is_rejected():
+    with pytest.raises(repository.EmptySelectionError):
+        await repository.bulk_delete_contacts(FakeSession(), filters=ContactFilter())
@@ -0,0 +1,178 @@
+import pytest
+
+from src.repository import repository
+from src.schemas.schemas import ContactUpdate
+from src.services import cache as cache_module
+from src.services.cache import ContactCache, InMemoryCacheBackend, RedisCacheBackend
+
+from tests.fakes import FakeRedis, FakeSession, make_contact
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(params=["memory", "redis"])
+def contact_cache(request, clock, fake_redis, monkeypatch):
+    # The in-memory backend reads the time through the module, the fake Redis through the clock.
+    monkeypatch.setattr(cache_module, "time", clock)
+    if request.param == "memory":
+        backend = InMemoryCacheBackend(max_size=100)
+    else:
+        backend = RedisCacheBackend(fake_redis)
+    return ContactCache(backend, ttl=60)
+
+
+async def test_hit_and_miss_counters(contact_cache):
+    assert await contact_cache.get(1) is None
+    await contact_cache.set(make_contact(1))
+
+    cached = await contact_cache.get(1)
+    found = await contact_cache.get_many([1, 2, 3])
+
+    assert cached.id == 1 and cached.email == "contact1@example.com"
+    assert list(found) == [1]
+    assert contact_cache.stats()["hits"] == 2
+    assert contact_cache.stats()["misses"] == 3
+    assert contact_cache.stats()["hit_ratio"] == pytest.approx(0.4)
+
+
+async def test_cached_contact_round_trips(contact_cache):
+    contact = make_contact(7, other_info="Met at the conference")
+    await contact_cache.set(contact)
+
+    cached = await contact_cache.get(7)
+
+    for field in cache_module.CACHED_FIELDS:
+        assert getattr(cached, field) == getattr(contact, field)
+
+
+async def test_entries_expire_after_ttl(contact_cache, clock):
+    await contact_cache.set(make_contact(1))
+
+    clock.advance(59)
+    assert await contact_cache.get(1) is not None
+    clock.advance(1)
+    assert await contact_cache.get(1) is None
+    assert await contact_cache.get_many([1]) == {}
+
+
+async def test_invalidate_drops_the_entry(contact_cache):
+    await contact_cache.set(make_contact(1))
+    await contact_cache.set(make_contact(2))
+
+    await contact_cache.invalidate(1)
+
+    assert await contact_cache.get(1) is None
+    assert await contact_cache.get(2) is not None
+
+
+async def test_memory_backend_evicts_least_recently_used(clock, monkeypatch):
+    monkeypatch.setattr(cache_module, "time", clock)
+    contact_cache = ContactCache(InMemoryCacheBackend(max_size=2), ttl=60)
+    await contact_cache.set(make_contact(1))
+    await contact_cache.set(make_contact(2))
+
+    # Reading 1 makes 2 the least recently used entry.
+    await contact_cache.get(1)
+    await contact_cache.set(make_contact(3))
+
+    assert len(contact_cache.backend) == 2
+    assert await contact_cache.get(2) is None
+    assert await contact_cache.get(1) is not None
+    assert await contact_cache.get(3) is not None
+
+
+async def test_redis_backend_decodes_bytes(clock):
+    contact_cache = ContactCache(RedisCacheBackend(FakeRedis(clock, decode_responses=False)), ttl=60)
+    await contact_cache.set(make_contact(1))
+
+    assert (await contact_cache.get(1)).id == 1
+    assert list(await contact_cache.get_many([1, 2])) == [1]
+
+
+async def test_get_many_is_one_round_trip(clock, fake_redis):
+    contact_cache = ContactCache(RedisCacheBackend(fake_redis), ttl=60)
+    for contact_id in (1, 2, 3):
+        await contact_cache.set(make_contact(contact_id))
+    fake_redis.calls.clear()
+
+    await contact_cache.get_many([1, 2, 3, 4])
+
+    assert fake_redis.calls == ["mget"]
+
+
+async def test_evict_local_only_touches_the_memory_backend(fake_redis):
+    memory = ContactCache(InMemoryCacheBackend(), ttl=60)
+    shared = ContactCache(RedisCacheBackend(fake_redis), ttl=60)
+    for contact_cache in (memory, shared):
+        await contact_cache.set(make_contact(1))
+        await contact_cache.set(make_contact(2))
+        contact_cache.evict_local([1])
+
+    assert await memory.get(1) is None
+    assert await memory.get(2) is not None
+    assert await shared.get(1) is not None
+
+    memory.evict_local()
+    assert len(memory.backend) == 0
+
+
+async def test_disabled_cache_stores_nothing():
+    contact_cache = ContactCache(None)
+    await contact_cache.set(make_contact(1))
+
+    assert await contact_cache.get(1) is None
+    assert await contact_cache.get_many([1]) == {}
+    assert contact_cache.stats()["backend"] is None
+
+
+@pytest.fixture
+def repository_cache(contact_cache, monkeypatch):
+    monkeypatch.setattr(repository, "contact_cache", contact_cache)
+    monkeypatch.setattr(repository, "is_cacheable_read", lambda db: True)
+    return contact_cache
+
+
+async def test_get_contact_by_id_reads_through(repository_cache):
+    session = FakeSession(make_contact(1))
+
+    first = await repository.get_contact_by_id(session, 1)
+    second = await repository.get_contact_by_id(session, 1)
+
+    assert first.id == second.id == 1
+    assert len(session.statements) == 1
+    assert repository_cache.stats()["hits"] == 1
+
+
+async def test_update_invalidates_the_cached_contact(repository_cache):
+    await repository_cache.set(make_contact(1, first_name="Olena"))
+    session = FakeSession(make_contact(1, first_name="Oksana"))
+
+    updated = await repository.update_contact(session, 1, ContactUpdate(first_name="Oksana"))
+
+    assert updated.first_name == "Oksana"
+    assert session.commits == 1
+    assert await repository_cache.get(1) is None
+    assert (await repository.get_contact_by_id(session, 1)).first_name == "Oksana"
+
+
+async def test_update_of_missing_contact_keeps_the_cache(repository_cache):
+    await repository_cache.set(make_contact(2))
+    session = FakeSession(None)
+
+    assert await repository.update_contact(session, 1, ContactUpdate(first_name="Oksana")) is None
+    assert session.commits == 0
+    assert await repository_cache.get(2) is not None
+
+
+async def test_delete_invalidates_the_cached_contact(repository_cache):
+    await repository_cache.set(make_contact(1))
+    session = FakeSession(make_contact(1))
+
+    assert await repository.delete_contact(session, 1) is not None
+    assert session.commits == 1
+    assert await repository_cache.get(1) is None
+
+    # The tombstone is filtered out by the query, so nothing is cached again.
+    session.row = None
+    assert await repository.get_contact_by_id(session, 1) is None
+    assert await repository_cache.get(1) is None
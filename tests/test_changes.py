@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.v1.endpoints.contacts import read_contact_changes
+from src.conf.config import settings
+from src.repository.pagination import decode_cursor, encode_cursor
+
+from tests.fakes import FakeSession, compile_sql, make_contact
+
+pytestmark = pytest.mark.anyio
+
+
+def token(change_xid: int, last_id: int, issued_ago: timedelta = timedelta(0)) -> str:
+    issued_at = datetime.now(timezone.utc) - issued_ago
+    return encode_cursor("change", "asc", [change_xid, issued_at.isoformat()], last_id)
+
+
+def decode(next_token: str):
+    (change_xid, issued_at), last_id = decode_cursor(next_token, "change", "asc")
+    return change_xid, last_id, issued_at
+
+
+async def read_changes(session: FakeSession, since=None, limit: int = 1000):
+    return await read_contact_changes(since=since, limit=limit, db=session)
+
+
+@pytest.fixture(autouse=True)
+def retention(monkeypatch):
+    monkeypatch.setattr(settings, "TOMBSTONE_RETENTION_DAYS", 30)
+
+
+async def test_full_sync_returns_live_contacts_and_a_token_after_the_last():
+    session = FakeSession(rows=[make_contact(3, change_xid=100), make_contact(1, change_xid=105)])
+    started = datetime.now(timezone.utc)
+
+    page = await read_changes(session)
+
+    assert [change.id for change in page.changes] == [3, 1]
+    assert "contacts.deleted_at IS NULL" in compile_sql(session.statements[0])
+    change_xid, last_id, issued_at = decode(page.next_token)
+    assert (change_xid, last_id) == (105, 1)
+    assert issued_at >= started
+
+
+async def test_incremental_sync_continues_after_the_token_and_reports_deletions():
+    deleted_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    session = FakeSession(rows=[make_contact(9, change_xid=501, deleted_at=deleted_at)])
+
+    page = await read_changes(session, since=token(500, 7))
+
+    sql = compile_sql(session.statements[0])
+    assert "(contacts.change_xid, contacts.id) > (500, 7)" in sql
+    assert "deleted_at IS NULL" not in sql
+    assert page.changes[0].deleted and page.changes[0].contact is None
+
+
+async def test_one_more_row_than_the_limit_means_more_to_fetch():
+    session = FakeSession(rows=[make_contact(n, change_xid=100 + n) for n in (1, 2, 3)])
+
+    page = await read_changes(session, since=token(100, 0), limit=2)
+
+    assert page.has_more and len(page.changes) == 2
+    assert decode(page.next_token)[:2] == (102, 2)
+
+
+async def test_token_issued_before_the_retention_has_expired():
+    session = FakeSession(rows=[])
+
+    with pytest.raises(HTTPException) as error:
+        await read_changes(session, since=token(500, 7, issued_ago=timedelta(days=31)))
+
+    assert error.value.status_code == 410
+    assert session.statements == []
+
+
+async def test_changes_to_old_rows_do_not_expire_a_fresh_token():
+    # The row was last changed long ago; the token was issued just now.
+    old = datetime.now(timezone.utc) - timedelta(days=400)
+    session = FakeSession(rows=[make_contact(4, change_xid=600, updated_at=old)])
+
+    page = await read_changes(session, since=token(500, 7))
+    again = await read_changes(FakeSession(rows=[]), since=page.next_token)
+
+    assert decode(again.next_token)[:2] == (600, 4)
+
+
+async def test_polling_a_quiet_table_renews_the_token():
+    quiet = FakeSession(rows=[])
+    since = token(500, 7, issued_ago=timedelta(days=29))
+
+    page = await read_changes(quiet, since=since)
+
+    assert page.changes == [] and not page.has_more
+    change_xid, last_id, issued_at = decode(page.next_token)
+    assert (change_xid, last_id) == (500, 7)
+    assert issued_at > datetime.now(timezone.utc) - timedelta(minutes=1)
+
+
+async def test_full_sync_of_an_empty_table_starts_at_the_beginning():
+    page = await read_changes(FakeSession(rows=[]))
+
+    assert decode(page.next_token)[:2] == (0, 0)
+
+
+@pytest.mark.parametrize("since", ["garbage", encode_cursor("id", "asc", 1, 1), encode_cursor("change", "asc", [1, "2026-01-01T00:00:00"], 1)])
+async def test_malformed_token_is_rejected(since):
+    with pytest.raises(HTTPException) as error:
+        await read_changes(FakeSession(rows=[]), since=since)
+
+    assert error.value.status_code == 400
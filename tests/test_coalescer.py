@@ -0,0 +1,111 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src.repository.repository import DuplicateContactError
+from src.schemas.schemas import ContactCreate
+from src.services import coalescer as coalescer_module
+from src.services.coalescer import CreateCoalescer
+
+from tests.fakes import FakeSession, make_contact
+
+pytestmark = pytest.mark.anyio
+
+
+def contact(n: int) -> ContactCreate:
+    return ContactCreate(
+        first_name="Olena",
+        last_name="Shevchenko",
+        email=f"contact{n}@example.com",
+        phone_number=f"+38050{n:07d}",
+        birthday="1990-05-17",
+    )
+
+
+class BatchWriter:
+    """
+    Records the emails of every written batch; emails in `taken` conflict.
+    """
+
+    def __init__(self):
+        self.batches = []
+        self.taken = set()
+        self.error = None
+
+    async def create_contacts(self, db, contacts):
+        self.batches.append([c.email for c in contacts])
+        if self.error is not None:
+            raise self.error
+        return [None if c.email in self.taken else make_contact(int(c.phone_number[-7:])) for c in contacts]
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    writer = BatchWriter()
+
+    @asynccontextmanager
+    async def session():
+        yield FakeSession()
+
+    monkeypatch.setattr(coalescer_module, "create_contacts", writer.create_contacts)
+    monkeypatch.setattr(coalescer_module, "sessionmanager", SimpleNamespace(session=session))
+    return writer
+
+
+async def test_concurrent_creates_share_one_batch(writer):
+    coalescer = CreateCoalescer(max_batch=100, max_delay_ms=5)
+
+    rows = await asyncio.gather(*(coalescer.create(contact(n)) for n in (1, 2, 3)))
+
+    assert writer.batches == [["contact1@example.com", "contact2@example.com", "contact3@example.com"]]
+    assert [row.id for row in rows] == [1, 2, 3]
+
+
+async def test_full_batch_is_written_without_waiting_for_the_timer(writer):
+    coalescer = CreateCoalescer(max_batch=2, max_delay_ms=60_000)
+
+    rows = await asyncio.wait_for(asyncio.gather(*(coalescer.create(contact(n)) for n in (1, 2))), timeout=1)
+
+    assert [row.id for row in rows] == [1, 2]
+    assert coalescer._timer is None
+
+
+async def test_creates_beyond_the_batch_size_start_a_new_batch(writer):
+    coalescer = CreateCoalescer(max_batch=2, max_delay_ms=5)
+
+    await asyncio.gather(*(coalescer.create(contact(n)) for n in range(1, 6)))
+
+    assert [len(batch) for batch in writer.batches] == [2, 2, 1]
+
+
+async def test_duplicates_fail_only_their_own_caller(writer):
+    writer.taken.add("contact2@example.com")
+    coalescer = CreateCoalescer(max_batch=100, max_delay_ms=5)
+
+    results = await asyncio.gather(*(coalescer.create(contact(n)) for n in (1, 2, 3)), return_exceptions=True)
+
+    assert results[0].id == 1 and results[2].id == 3
+    assert isinstance(results[1], DuplicateContactError)
+
+
+async def test_failed_write_fails_every_caller_of_the_batch(writer):
+    writer.error = RuntimeError("connection lost")
+    coalescer = CreateCoalescer(max_batch=100, max_delay_ms=5)
+
+    results = await asyncio.gather(*(coalescer.create(contact(n)) for n in (1, 2)), return_exceptions=True)
+
+    assert [str(result) for result in results] == ["connection lost", "connection lost"]
+
+
+async def test_cancelled_caller_does_not_affect_the_batch(writer):
+    coalescer = CreateCoalescer(max_batch=100, max_delay_ms=5)
+    gone = asyncio.create_task(coalescer.create(contact(1)))
+    staying = asyncio.create_task(coalescer.create(contact(2)))
+    await asyncio.sleep(0)
+
+    gone.cancel()
+
+    assert (await staying).id == 2
+    assert writer.batches == [["contact1@example.com", "contact2@example.com"]]
@@ -0,0 +1,159 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.v1.endpoints import contacts as contacts_endpoints
+from src.services import events as events_module
+from src.services.cache import ContactCache, InMemoryCacheBackend
+from src.services.events import ContactEventBroadcaster, InMemoryEventBackend, TooManySubscribersError
+
+from tests.fakes import make_contact
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def broadcaster():
+    broadcaster = ContactEventBroadcaster(InMemoryEventBackend(), max_queue=3, max_subscribers=2)
+    await broadcaster.start()
+    yield broadcaster
+    await broadcaster.stop()
+
+
+async def test_subscriber_receives_published_changes(broadcaster):
+    subscription = broadcaster.subscribe()
+
+    broadcaster.publish_change("created", make_contact(1))
+    broadcaster.publish_bulk("bulk_deleted", 5)
+    await broadcaster.drain()
+
+    frames = [subscription.queue.get_nowait() for _ in range(subscription.queue.qsize())]
+    assert [frame.split("\n")[0] for frame in frames] == ["event: created", "event: bulk_deleted"]
+    created = json.loads(frames[0].split("\n")[1].removeprefix("data: "))
+    assert created["id"] == 1 and created["contact"]["email"] == "contact1@example.com"
+    assert broadcaster.stats()["published"] == 2
+
+
+async def test_slow_subscriber_overflows_and_is_dropped(broadcaster):
+    slow = broadcaster.subscribe()
+    fast = broadcaster.subscribe()
+
+    broadcaster.publish_changes("updated", [make_contact(contact_id) for contact_id in range(1, 4)])
+    await broadcaster.drain()
+    # `fast` keeps up, `slow` never reads.
+    for _ in range(3):
+        fast.queue.get_nowait()
+    broadcaster.publish_change("updated", make_contact(4))
+    await broadcaster.drain()
+
+    assert slow.overflowed and not fast.overflowed
+    assert slow.queue.qsize() == 3
+    assert broadcaster.stats()["subscribers"] == 1
+    assert broadcaster.stats()["dropped_subscribers"] == 1
+
+    frames = [frame async for frame in broadcaster.stream(slow)]
+    assert frames == [": connected\n\n", "event: overflow\ndata: {}\n\n"]
+
+
+async def test_disconnect_unregisters_the_subscriber(broadcaster):
+    subscription = broadcaster.subscribe()
+    stream = broadcaster.stream(subscription, keepalive=0.01)
+
+    assert await stream.__anext__() == ": connected\n\n"
+    assert await stream.__anext__() == ": keepalive\n\n"
+    broadcaster.publish_change("deleted", make_contact(1))
+    frame = await stream.__anext__()
+    await stream.aclose()
+
+    assert frame.startswith("event: deleted\n")
+    assert "contact" not in json.loads(frame.split("\n")[1].removeprefix("data: "))
+    assert broadcaster.stats()["subscribers"] == 0
+
+    # Later events are not queued for the closed stream.
+    broadcaster.publish_change("deleted", make_contact(2))
+    await broadcaster.drain()
+    assert subscription.queue.empty()
+
+
+async def test_subscriber_limit(broadcaster):
+    broadcaster.subscribe()
+    broadcaster.subscribe()
+
+    with pytest.raises(TooManySubscribersError):
+        broadcaster.subscribe()
+
+
+async def test_publish_never_waits_for_a_stuck_backend():
+    class StuckBackend(InMemoryEventBackend):
+        async def publish(self, message):
+            await asyncio.Event().wait()
+
+    broadcaster = ContactEventBroadcaster(StuckBackend(), outbox_size=2, publish_timeout=0.01)
+    await broadcaster.start()
+    try:
+        broadcaster.publish_changes("created", [make_contact(contact_id) for contact_id in range(1, 6)])
+        stats = broadcaster.stats()
+        await broadcaster.drain()
+    finally:
+        await broadcaster.stop()
+
+    assert stats["queued"] == 2
+    assert broadcaster.stats()["dropped_events"] == 5
+    assert broadcaster.stats()["published"] == 0
+
+
+async def test_delivered_changes_evict_local_cache_entries(broadcaster, monkeypatch):
+    contact_cache = ContactCache(InMemoryCacheBackend(), ttl=60)
+    monkeypatch.setattr(events_module, "contact_cache", contact_cache)
+    for contact_id in (1, 2, 3):
+        await contact_cache.set(make_contact(contact_id))
+
+    broadcaster.publish_change("updated", make_contact(1))
+    await broadcaster.drain()
+    assert await contact_cache.get(1) is None
+    assert await contact_cache.get(2) is not None
+
+    broadcaster.publish_bulk("bulk_updated", 2)
+    await broadcaster.drain()
+    assert len(contact_cache.backend) == 0
+
+
+@pytest.fixture
+def endpoint_events(broadcaster, monkeypatch):
+    monkeypatch.setattr(contacts_endpoints, "contact_events", broadcaster)
+    return broadcaster
+
+
+async def test_stream_endpoint_subscribes_only_while_the_body_is_sent(endpoint_events):
+    response = await contacts_endpoints.stream_contact_events()
+    assert endpoint_events.stats()["subscribers"] == 0
+
+    body = response.body_iterator
+    assert await body.__anext__() == ": connected\n\n"
+    assert endpoint_events.stats()["subscribers"] == 1
+
+    await body.aclose()
+    assert endpoint_events.stats()["subscribers"] == 0
+
+
+async def test_stream_endpoint_rejects_clients_over_the_limit(endpoint_events):
+    endpoint_events.subscribe()
+    endpoint_events.subscribe()
+
+    with pytest.raises(HTTPException) as error:
+        await contacts_endpoints.stream_contact_events()
+
+    assert error.value.status_code == 503
+
+
+async def test_stream_endpoint_ends_if_the_limit_is_reached_before_the_body_starts(endpoint_events):
+    response = await contacts_endpoints.stream_contact_events()
+    endpoint_events.subscribe()
+    endpoint_events.subscribe()
+
+    frames = [frame async for frame in response.body_iterator]
+
+    assert frames == ["event: overflow\ndata: {}\n\n"]
+    assert endpoint_events.stats()["subscribers"] == 2
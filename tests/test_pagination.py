@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+
+from src.repository import repository
+from src.repository.pagination import InvalidCursorError, decode_cursor, encode_cursor, next_cursor
+
+from tests.fakes import FakeSession, compile_sql, make_contact
+
+
+@pytest.mark.parametrize(
+    "sort_by, value",
+    [("id", 42), ("last_name", "Shevchenko"), ("first_name", "Olena"), ("birthday", date(1990, 2, 28))],
+)
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_cursor_round_trips(sort_by, value, order):
+    cursor = encode_cursor(sort_by, order, value, 42)
+
+    assert decode_cursor(cursor, sort_by, order) == (value, 42)
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor("last_name", "asc", "Ковальчук?&/", 7)
+
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor, "last_name", "asc") == ("Ковальчук?&/", 7)
+
+
+@pytest.mark.parametrize("sort_by, order", [("first_name", "asc"), ("last_name", "desc")])
+def test_cursor_of_another_sort_is_rejected(sort_by, order):
+    cursor = encode_cursor("last_name", "asc", "Shevchenko", 1)
+
+    with pytest.raises(InvalidCursorError, match="does not match"):
+        decode_cursor(cursor, sort_by, order)
+
+
+@pytest.mark.parametrize(
+    "cursor, sort_by",
+    [
+        ("not-base64!", "id"),
+        (encode_cursor("birthday", "asc", "not a date", 1), "birthday"),
+        (encode_cursor("id", "asc", "forty-two", 1), "id"),
+        (encode_cursor("id", "asc", 1, "one"), "id"),
+        ("eyJzIjoiaWQifQ", "id"),  # {"s":"id"}
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor, sort_by):
+    with pytest.raises(InvalidCursorError, match="Malformed"):
+        decode_cursor(cursor, sort_by, "asc")
+
+
+def test_next_cursor_points_after_the_last_row_of_a_full_page():
+    rows = [make_contact(1, last_name="Bondar"), make_contact(2, last_name="Koval")]
+
+    assert next_cursor(rows, limit=3, sort_by="last_name", order="asc") is None
+    assert decode_cursor(next_cursor(rows, limit=2, sort_by="last_name", order="asc"), "last_name", "asc") == ("Koval", 2)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "order, predicate",
+    [("asc", "(contacts.last_name, contacts.id) > ('Koval', 2)"), ("desc", "(contacts.last_name, contacts.id) < ('Koval', 2)")],
+)
+async def test_keyset_page_is_a_row_value_range(order, predicate):
+    session = FakeSession(rows=[])
+
+    await repository.get_contacts(
+        session, skip=500, limit=10, sort_by="last_name", order=order, cursor=encode_cursor("last_name", order, "Koval", 2)
+    )
+
+    sql = compile_sql(session.statements[0])
+    assert predicate in sql
+    assert f"ORDER BY contacts.last_name {order.upper()}, contacts.id {order.upper()}" in sql
+    # The cursor replaces the offset.
+    assert "OFFSET" not in sql
+
+
+@pytest.mark.anyio
+async def test_id_sort_compares_the_id_only():
+    session = FakeSession(rows=[])
+
+    await repository.get_contacts(session, limit=10, sort_by="id", cursor=encode_cursor("id", "asc", 2, 2))
+
+    assert "(contacts.id) > (2)" in compile_sql(session.statements[0])
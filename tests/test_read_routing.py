@@ -0,0 +1,155 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.engine import make_url
+
+from src.conf.config import settings
+from src.database import db as db_module
+from src.database.db import DatabaseSessionManager, Replica
+from src.services import cache as cache_module
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeDatabaseSession:
+    """
+    Session stand-in whose `connection()` fails when its database is down.
+    """
+
+    def __init__(self, database: "FakeDatabase"):
+        self.database = database
+        self.bind = database
+        self.closed = False
+
+    async def connection(self):
+        if self.database.down:
+            raise OSError(f"{self.database.name} is unreachable")
+
+    async def close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+class FakeDatabase:
+    def __init__(self, name: str, checked_out: int = 0, down: bool = False):
+        self.name = name
+        self.down = down
+        self.url = make_url(f"postgresql+asyncpg://user@{name}:5432/contacts")
+        self.pool = SimpleNamespace(checkedout=lambda: checked_out)
+        self.sessions = []
+
+    def __call__(self) -> FakeDatabaseSession:
+        session = FakeDatabaseSession(self)
+        self.sessions.append(session)
+        return session
+
+
+@pytest.fixture
+def manager(clock, monkeypatch):
+    monkeypatch.setattr(db_module, "time", clock)
+    manager = DatabaseSessionManager()
+    manager._engine = FakeDatabase("primary")
+    manager._session_maker = manager._engine
+    return manager
+
+
+def add_replica(manager: DatabaseSessionManager, database: FakeDatabase) -> Replica:
+    replica = Replica(database)
+    replica.session_maker = database
+    manager.replicas.append(replica)
+    return replica
+
+
+async def read_from(manager: DatabaseSessionManager, use_primary: bool = False) -> str:
+    async with manager.read_session(use_primary=use_primary) as session:
+        return session.bind.name
+
+
+async def test_without_replicas_reads_go_to_the_primary(manager):
+    assert await read_from(manager) == "primary"
+
+
+async def test_round_robin_rotates_over_the_replicas(manager):
+    add_replica(manager, FakeDatabase("replica-a"))
+    add_replica(manager, FakeDatabase("replica-b"))
+
+    assert [await read_from(manager) for _ in range(4)] == ["replica-a", "replica-b", "replica-a", "replica-b"]
+
+
+async def test_least_connections_prefers_the_idlest_replica(manager, monkeypatch):
+    monkeypatch.setattr(settings, "DB_REPLICA_SELECTION", "least_connections")
+    add_replica(manager, FakeDatabase("busy", checked_out=5))
+    add_replica(manager, FakeDatabase("idle", checked_out=1))
+
+    assert [await read_from(manager) for _ in range(2)] == ["idle", "idle"]
+
+
+async def test_use_primary_skips_the_replicas(manager):
+    add_replica(manager, FakeDatabase("replica-a"))
+
+    assert await read_from(manager, use_primary=True) == "primary"
+
+
+async def test_unreachable_replica_fails_over_and_is_retried_later(manager, clock, monkeypatch):
+    monkeypatch.setattr(settings, "DB_REPLICA_RETRY_AFTER", 10.0)
+    broken = FakeDatabase("broken", down=True)
+    replica = add_replica(manager, broken)
+    add_replica(manager, FakeDatabase("healthy"))
+
+    assert await read_from(manager) == "healthy"
+    assert broken.sessions[0].closed
+    assert not replica.is_available()
+
+    # Skipped without another connection attempt while it is marked down.
+    assert [await read_from(manager) for _ in range(3)] == ["healthy"] * 3
+    assert len(broken.sessions) == 1
+
+    clock.advance(10)
+    broken.down = False
+    assert {await read_from(manager) for _ in range(2)} == {"broken", "healthy"}
+
+
+async def test_all_replicas_down_falls_back_to_the_primary(manager):
+    add_replica(manager, FakeDatabase("replica-a", down=True))
+    add_replica(manager, FakeDatabase("replica-b", down=True))
+
+    assert await read_from(manager) == "primary"
+    assert [replica.is_available() for replica in manager.replicas] == [False, False]
+
+
+@pytest.mark.parametrize(
+    "cookies, expected",
+    [
+        ({}, False),
+        ({db_module.READ_YOUR_WRITES_COOKIE: str(time.time() + 60)}, True),
+        ({db_module.READ_YOUR_WRITES_COOKIE: str(time.time() - 60)}, False),
+        ({db_module.READ_YOUR_WRITES_COOKIE: "garbage"}, False),
+    ],
+)
+def test_recent_writers_read_from_the_primary(cookies, expected):
+    assert db_module._wrote_recently(SimpleNamespace(cookies=cookies)) is expected
+
+
+def test_replica_reads_are_cached_only_once_writes_have_settled(manager, clock, monkeypatch):
+    monkeypatch.setattr(db_module, "sessionmanager", manager)
+    monkeypatch.setattr(cache_module, "time", clock)
+    monkeypatch.setattr(settings, "DB_READ_YOUR_WRITES_WINDOW", 5.0)
+    generation = cache_module.Generation()
+    monkeypatch.setattr(db_module, "contacts_generation", generation)
+    primary = SimpleNamespace(bind=manager.engine)
+    replica = SimpleNamespace(bind=FakeDatabase("replica-a"))
+
+    assert db_module.is_cacheable_read(replica)
+
+    generation.bump()
+    assert db_module.is_cacheable_read(primary)
+    assert not db_module.is_cacheable_read(replica)
+
+    clock.advance(5.1)
+    assert db_module.is_cacheable_read(replica)
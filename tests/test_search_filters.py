@@ -0,0 +1,102 @@
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import and_
+
+from src.repository import repository
+from src.repository.pagination import encode_cursor
+from src.schemas.schemas import ContactFilter, ContactSearch, DateFilter, StringFilter
+
+from tests.fakes import FakeSession, compile_sql
+
+
+def compile_filters(ranked: bool = False, **fields) -> str:
+    conditions, _ = repository._search_conditions(ContactFilter(**fields), ranked=ranked)
+    return compile_sql(and_(*conditions))
+
+
+def test_bare_string_is_a_contains_filter():
+    assert ContactFilter(first_name="ol").first_name == StringFilter(contains="ol")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"first_name": {}},
+        {"first_name": {"like": "ol"}},
+        {"first_name": {"prefix": ""}},
+        {"birthday": {}},
+        {"birthday": {"between": ["1990-12-31", "1990-01-01"]}},
+        {"age": 30},
+    ],
+)
+def test_invalid_filters_are_rejected(data):
+    with pytest.raises(ValidationError):
+        ContactFilter.model_validate(data)
+
+
+def test_search_body_splits_filters_from_paging():
+    search = ContactSearch.model_validate({"email": {"in": ["a@example.com"]}, "limit": 5, "cursor": "abc"})
+
+    assert search.filters() == ContactFilter(email=StringFilter(in_=["a@example.com"]))
+    assert ContactFilter().is_empty() and not search.filters().is_empty()
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        ({"last_name": {"eq": "Koval"}}, "contacts.last_name = 'Koval'"),
+        ({"email": {"in": ["a@example.com", "b@example.com"]}}, "contacts.email = ANY (ARRAY['a@example.com', 'b@example.com'])"),
+        # Lower-cased to match the `lower(column) text_pattern_ops` index.
+        ({"first_name": {"prefix": "OL"}}, "lower(contacts.first_name) LIKE 'ol%' ESCAPE '\\'"),
+        ({"other_info": {"contains": "kyiv"}}, "contacts.other_info ILIKE '%kyiv%' ESCAPE '\\'"),
+        ({"birthday": {"eq": "1990-05-17"}}, "contacts.birthday = '1990-05-17'"),
+        ({"birthday": {"between": ["1990-01-01", "1990-12-31"]}}, "contacts.birthday BETWEEN '1990-01-01' AND '1990-12-31'"),
+    ],
+)
+def test_operators_compile_to_index_friendly_predicates(fields, expected):
+    assert expected in compile_filters(**fields)
+
+
+def test_like_wildcards_in_values_are_escaped():
+    sql = compile_filters(first_name={"prefix": "50%_off\\"}, other_info={"contains": "a_b"})
+
+    assert "LIKE '50\\%\\_off\\\\%'" in sql
+    assert "ILIKE '%a\\_b%'" in sql
+
+
+def test_operators_and_fields_are_combined_with_and():
+    sql = compile_filters(last_name={"prefix": "ko", "eq": "Koval"}, birthday=DateFilter(eq=date(1990, 5, 17)))
+
+    assert sql.count(" AND ") == 2
+
+
+def test_ranked_contains_uses_word_similarity():
+    conditions, scores = repository._search_conditions(
+        ContactFilter(first_name={"contains": "olna"}, last_name={"eq": "Koval"}), ranked=True
+    )
+
+    assert "'olna' <% contacts.first_name" in compile_sql(and_(*conditions))
+    assert [compile_sql(score) for score in scores] == ["word_similarity('olna', contacts.first_name)"]
+
+
+@pytest.mark.anyio
+async def test_search_without_conditions_runs_no_query():
+    session = FakeSession(rows=[])
+
+    assert await repository.search_contacts_repo(session, ContactFilter()) == []
+    assert session.statements == []
+
+
+@pytest.mark.anyio
+async def test_unranked_search_is_keyset_paged_by_id():
+    session = FakeSession(rows=[])
+
+    await repository.search_contacts_repo(
+        session, ContactFilter(last_name="ko"), limit=10, cursor=encode_cursor("id", "asc", 40, 40)
+    )
+
+    sql = compile_sql(session.statements[0])
+    assert "contacts.id > 40" in sql
+    assert sql.endswith("ORDER BY contacts.id \n LIMIT 10")